@@ -175,6 +175,20 @@ class KeyboardController(ControllerStrategy):
         if not self.keys["gear_r"]:
             self.keys["gear_r"] = [pygame.K_r]
 
+        # Manual gear dispatch table: key -> (gear, reverse); the first mapping wins
+        self._gear_keys: Dict[int, tuple] = {}
+        for name, gear in (
+            ("gear_1", 1),
+            ("gear_2", 2),
+            ("gear_3", 3),
+            ("gear_4", 4),
+            ("gear_5", 5),
+            ("gear_6", 6),
+            ("gear_r", -1),
+        ):
+            for key in self.keys[name]:
+                self._gear_keys.setdefault(key, (gear, gear < 0))
+
         # Start in automatic mode
         self._control.manual_gear_shift = False
         self._control.gear = 1
@@ -223,27 +237,9 @@ class KeyboardController(ControllerStrategy):
 
                 # Handle gear changes in manual mode
                 if self._control.manual_gear_shift:
-                    if event.key in self.keys["gear_1"]:
-                        self._control.gear = 1
-                        self._control.reverse = False
-                    elif event.key in self.keys["gear_2"]:
-                        self._control.gear = 2
-                        self._control.reverse = False
-                    elif event.key in self.keys["gear_3"]:
-                        self._control.gear = 3
-                        self._control.reverse = False
-                    elif event.key in self.keys["gear_4"]:
-                        self._control.gear = 4
-                        self._control.reverse = False
-                    elif event.key in self.keys["gear_5"]:
-                        self._control.gear = 5
-                        self._control.reverse = False
-                    elif event.key in self.keys["gear_6"]:
-                        self._control.gear = 6
-                        self._control.reverse = False
-                    elif event.key in self.keys["gear_r"]:
-                        self._control.gear = -1
-                        self._control.reverse = True
+                    gear_change = self._gear_keys.get(event.key)
+                    if gear_change is not None:
+                        self._control.gear, self._control.reverse = gear_change
 
         # Get keyboard state
         keys = pygame.key.get_pressed()
@@ -363,6 +359,7 @@ class AutopilotController(ControllerStrategy):
         self.vehicle = vehicle
         self.config = config
         self.world_manager = world_manager
+        self.logger = Logger()
 
         # Get traffic manager from world manager if available, otherwise create new one
         if world_manager and hasattr(world_manager, "get_traffic_manager"):
@@ -372,8 +369,10 @@ class AutopilotController(ControllerStrategy):
                 world_manager.setup_traffic()
                 self.traffic_manager = world_manager.get_traffic_manager()
         else:
-            # Fallback to creating new traffic manager if world manager not available
-            self.traffic_manager = client.get_trafficmanager()
+            # Fallback to the traffic manager on this process's configured port
+            self.traffic_manager = client.get_trafficmanager(
+                int(os.getenv("CARLA_TM_PORT_BASE", "8000"))
+            )
 
         # Get traffic settings from config
         traffic_config = getattr(config, "traffic", {})
@@ -393,8 +392,8 @@ class AutopilotController(ControllerStrategy):
             self.traffic_manager.set_global_distance_to_leading_vehicle(distance_to_leading)
             # Negative value means faster than limit in CARLA TM
             self.traffic_manager.vehicle_percentage_speed_difference(self.vehicle, speed_diff)
-        except Exception:
-            pass
+        except Exception as e:
+            self.logger.warning(f"Failed to apply traffic manager settings: {str(e)}")
         self.traffic_manager.ignore_lights_percentage(self.vehicle, ignore_lights)
         self.traffic_manager.ignore_signs_percentage(self.vehicle, ignore_signs)
 
@@ -402,8 +401,9 @@ class AutopilotController(ControllerStrategy):
         try:
             # Engage autopilot on the ego with the TM's port
             self.vehicle.set_autopilot(True, self.traffic_manager.get_port())
-        except Exception:
-            pass
+            self.logger.debug("Autopilot enabled")
+        except Exception as e:
+            self.logger.error(f"Failed to setup autopilot: {str(e)}")
 
         # Initialize control
         self._control = VehicleControl()
@@ -434,13 +434,21 @@ class AutopilotController(ControllerStrategy):
             # Disable autopilot
             self.vehicle.set_autopilot(False)
         except Exception as e:
-            if hasattr(self, "logger"):
-                self.logger.error("Error cleaning up autopilot", exc_info=e)
+            self.logger.error("Error cleaning up autopilot", exc_info=e)
 
 
 class VehicleController:
     """Main vehicle controller class using the strategy pattern"""
 
+    # Strategy builders keyed by controller config type
+    _STRATEGY_FACTORIES = {
+        "keyboard": lambda self: KeyboardController(self.config, self.logger),
+        "gamepad": lambda self: GamepadController(self.config),
+        "autopilot": lambda self: AutopilotController(
+            self._vehicle, self.config, self._client, self._world_manager
+        ),
+    }
+
     def __init__(self, config: ControllerConfig, headless: bool = False):
         """Initialize vehicle controller"""
         self.config = config
@@ -466,16 +474,10 @@ class VehicleController:
             return
 
         # Create appropriate controller based on config type
-        if self.config.type == "keyboard":
-            self._strategy = KeyboardController(self.config, self.logger)
-        elif self.config.type == "gamepad":
-            self._strategy = GamepadController(self.config)
-        elif self.config.type == "autopilot":
-            self._strategy = AutopilotController(
-                self._vehicle, self.config, self._client, self._world_manager
-            )
-        else:
+        factory = self._STRATEGY_FACTORIES.get(self.config.type)
+        if factory is None:
             raise ValueError(f"Unknown controller type: {self.config.type}")
+        self._strategy = factory(self)
 
     def get_vehicle(self) -> carla.Vehicle:
         """Get the controlled vehicle instance"""
@@ -534,8 +536,9 @@ class VehicleController:
             # Apply control to vehicle
             self.vehicle.apply_control(self.control)
 
-            # Log vehicle state in debug mode
-            self.logger.debug(f"Vehicle state: {self.get_vehicle_state()}")
+            # Log vehicle state in debug mode; reading it queries the vehicle
+            if self.logger.is_debug_enabled():
+                self.logger.debug("Vehicle state: %s", self.get_vehicle_state())
 
         except Exception as e:
             self.logger.error("Error updating controller", exc_info=e)
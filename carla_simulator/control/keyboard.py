@@ -20,6 +20,16 @@ class ControlState:
     reverse: bool = False
 
 
+# Value each control field returns to when its key is released
+_RELEASED_VALUES = {
+    "throttle": 0.0,
+    "steer": 0.0,
+    "brake": 0.0,
+    "hand_brake": False,
+    "reverse": False,
+}
+
+
 class KeyboardControl:
     """Handles keyboard input and vehicle control."""
 
@@ -81,18 +91,10 @@ class KeyboardControl:
         Args:
             key: Pygame key code
         """
-        if key in self.control_mapping:
-            control_type, _ = self.control_mapping[key]
-            if control_type == "throttle":
-                self.control_state.throttle = 0.0
-            elif control_type == "steer":
-                self.control_state.steer = 0.0
-            elif control_type == "brake":
-                self.control_state.brake = 0.0
-            elif control_type == "hand_brake":
-                self.control_state.hand_brake = False
-            elif control_type == "reverse":
-                self.control_state.reverse = False
+        mapping = self.control_mapping.get(key)
+        if mapping is not None:
+            control_type = mapping[0]
+            setattr(self.control_state, control_type, _RELEASED_VALUES[control_type])
 
     def _handle_key_down(self, key: int):
         """
@@ -101,18 +103,11 @@ class KeyboardControl:
         Args:
             key: Pygame key code
         """
-        if key in self.control_mapping:
-            control_type, value = self.control_mapping[key]
-            if control_type == "throttle":
-                self.control_state.throttle = value
-            elif control_type == "steer":
-                self.control_state.steer = value
-            elif control_type == "brake":
-                self.control_state.brake = value
-            elif control_type == "hand_brake":
-                self.control_state.hand_brake = value
-            elif control_type == "reverse":
-                self.control_state.reverse = value
+        mapping = self.control_mapping.get(key)
+        if mapping is not None:
+            # Control types are named after the ControlState fields they drive
+            control_type, value = mapping
+            setattr(self.control_state, control_type, value)
 
     def get_control(self) -> carla.VehicleControl:
         """
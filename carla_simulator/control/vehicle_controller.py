@@ -26,12 +26,13 @@ class VehicleController(IVehicleController):
             current_loc = vehicle_state["location"]
             target_loc = self._target
 
-            # Calculate distance to target
-            distance = current_loc.distance(target_loc)
-
             # Calculate heading to target
             dx = target_loc.x - current_loc.x
             dy = target_loc.y - current_loc.y
+            dz = target_loc.z - current_loc.z
+
+            # Squared distance to target, compared against squared thresholds
+            distance_sq = dx * dx + dy * dy + dz * dz
             target_heading = math.degrees(math.atan2(dy, dx))
 
             # Get current vehicle heading
@@ -44,15 +45,15 @@ class VehicleController(IVehicleController):
             control.steer = max(-1.0, min(1.0, heading_diff / 45.0))
 
             # Set throttle based on distance
-            if distance > 10.0:
+            if distance_sq > 100.0:  # 10 m
                 control.throttle = 0.75
-            elif distance > 5.0:
+            elif distance_sq > 25.0:  # 5 m
                 control.throttle = 0.5
             else:
                 control.throttle = 0.25
 
             # Apply brakes if we're too close
-            if distance < 2.0:
+            if distance_sq < 4.0:  # 2 m
                 control.brake = 1.0
                 control.throttle = 0.0
 
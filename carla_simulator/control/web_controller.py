@@ -82,7 +82,7 @@ class WebGamepadController(ControllerStrategy):
     def update_gamepad_command(self, gamepad_index: int, command: WebControlCommand) -> None:
         """Update command for a specific gamepad"""
         self._active_gamepads[gamepad_index] = command
-        self.logger.debug(f"Updated gamepad {gamepad_index} command: {command}")
+        self.logger.debug("Updated gamepad %d command: %s", gamepad_index, command)
     
     def get_primary_gamepad_command(self) -> WebControlCommand:
         """Get command from the primary (first) gamepad"""
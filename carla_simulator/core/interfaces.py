@@ -124,22 +124,22 @@ class ILogger(ABC):
     """Interface for logging functionality"""
 
     @abstractmethod
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args: Any) -> None:
         """Log informational message"""
         pass
 
     @abstractmethod
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: Any) -> None:
         """Log error message"""
         pass
 
     @abstractmethod
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args: Any) -> None:
         """Log debug message"""
         pass
 
     @abstractmethod
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args: Any) -> None:
         """Log warning message"""
         pass
 
@@ -17,7 +17,7 @@ import time
 logger = Logger()
 
 
-@dataclass
+@dataclass(slots=True)
 class SensorData:
     """Base class for sensor data"""
 
@@ -26,7 +26,7 @@ class SensorData:
     transform: carla.Transform
 
 
-@dataclass
+@dataclass(slots=True)
 class CollisionData(SensorData):
     """Data from collision sensor"""
 
@@ -35,7 +35,7 @@ class CollisionData(SensorData):
     intensity: float
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraData(SensorData):
     """Data from camera sensor"""
 
@@ -44,7 +44,7 @@ class CameraData(SensorData):
     height: int
 
 
-@dataclass
+@dataclass(slots=True)
 class GNSSData(SensorData):
     """Data from GNSS sensor"""
 
@@ -86,6 +86,12 @@ class SensorSubject(ABC):
         self._observers.clear()
 
 
+def _blueprint_library(world: carla.World, world_manager=None) -> carla.BlueprintLibrary:
+    """Prefer the world manager's cached blueprint library over a fresh RPC"""
+    library = getattr(world_manager, "blueprint_library", None) if world_manager else None
+    return library if library is not None else world.get_blueprint_library()
+
+
 class CollisionSensor(SensorSubject):
     """Collision detection sensor"""
 
@@ -97,7 +103,7 @@ class CollisionSensor(SensorSubject):
         world = self.vehicle.get_world()
 
         # Create collision sensor
-        bp = world.get_blueprint_library().find("sensor.other.collision")
+        bp = _blueprint_library(world, world_manager).find("sensor.other.collision")
         self.sensor = world.spawn_actor(bp, carla.Transform(), attach_to=vehicle)
         
         # Track the sensor actor if world manager is available
@@ -121,7 +127,7 @@ class CollisionSensor(SensorSubject):
 
         # Calculate collision intensity
         impulse = event.normal_impulse
-        intensity = math.sqrt(impulse.x**2 + impulse.y**2 + impulse.z**2)
+        intensity = math.hypot(impulse.x, impulse.y, impulse.z)
 
         # Create collision data
         data = CollisionData(
@@ -153,7 +159,7 @@ class CameraSensor(SensorSubject):
         world = self.vehicle.get_world()
 
         # Create camera sensor
-        bp = world.get_blueprint_library().find("sensor.camera.rgb")
+        bp = _blueprint_library(world, world_manager).find("sensor.camera.rgb")
         if not bp:
             return
 
@@ -227,7 +233,7 @@ class GNSSSensor(SensorSubject):
         world = self.vehicle.get_world()
 
         # Create GNSS sensor
-        bp = world.get_blueprint_library().find("sensor.other.gnss")
+        bp = _blueprint_library(world, world_manager).find("sensor.other.gnss")
         self.sensor = world.spawn_actor(
             bp, carla.Transform(carla.Location(x=0.0, z=0.0)), attach_to=vehicle
         )
@@ -18,10 +18,22 @@ from carla_simulator.scenarios.scenario_registry import ScenarioRegistry
 from carla_simulator.utils.config import LoggingConfig
 # Lazy-import DisplayManager/VehicleState to avoid pygame initialization at app startup
 import threading
+import queue
+import gc
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from carla_simulator.database.config import SessionLocal
 from carla_simulator.database.models import Scenario, VehicleData, SensorData
+from carla_simulator.utils.settings import LOG_BANNER
 from datetime import datetime
 
+# Keys of the vehicle state dict handed to the controller, metrics and display each tick
+_VEHICLE_STATE_KEYS = ("location", "velocity", "acceleration", "transform", "sensor_data")
+
+# Control reported by the DB snapshot and display before the first control is applied
+_NO_CONTROL = carla.VehicleControl(gear=1)
+
 
 class SimulationApplication:
     """Main application class that coordinates all simulation components"""
@@ -29,15 +41,24 @@ class SimulationApplication:
     # Class-level cleanup tracking
     cleanup_lock = threading.Lock()
 
-    def __init__(self, config_path: str, scenario: str, session_id, logger: ILogger):
-        # Initialize configuration
-        self._config = SimulationConfig(config_path, scenario)
+    def __init__(
+        self,
+        config_path: str,
+        scenario: str,
+        session_id,
+        logger: ILogger,
+        config_dict: Optional[Dict[str, Any]] = None,
+        client: Optional[carla.Client] = None,
+    ):
+        # Initialize configuration (reuse a preloaded dict when the runner has one)
+        self._config = SimulationConfig(config_path, scenario, config_dict=config_dict)
 
         # Initialize logger first
         self.logger = logger
 
-        # Initialize connection manager with server config
+        # Initialize connection manager with server config, reusing a live client if given
         self.connection = ConnectionManager(self._config.server_config, self.logger)
+        self.connection.client = client
 
         # Initialize state and metrics
         self.state = SimulationState()
@@ -56,6 +77,16 @@ class SimulationApplication:
         # HUD snapshot shared with websocket
         self._hud_payload = None
         self._hud_lock = threading.Lock()
+        # DB writes from the tick loop are handed to a background writer thread
+        self._db_queue: Optional[queue.Queue] = None
+        self._db_writer: Optional[threading.Thread] = None
+        self._db_dropped = 0  # Writes discarded because the queue was full
+        # Web-mode rendering runs on its own thread, fed the latest display state
+        self._frame_ring: Optional[deque] = None
+        self._frame_ready = threading.Event()
+        self._display_stop = threading.Event()
+        self._display_worker: Optional[threading.Thread] = None
+        self._display_exit = False
 
         # Require session_id to be provided
         if session_id is None:
@@ -119,27 +150,12 @@ class SimulationApplication:
         self.metrics = SimulationMetrics(logger)
         self.logger.debug("[SimulationApplication] Metrics initialized")
 
-        # Initialize display manager
-        self.logger.debug("[SimulationApplication] Initializing display manager...")
-        is_web_mode = getattr(self._config, "web_mode", False)
-        # Import here to ensure SDL envs are set beforehand
-        from carla_simulator.visualization.display_manager import DisplayManager
-        self.display_manager = DisplayManager(self._config.display_config, web_mode=is_web_mode)
-        self.logger.debug("[SimulationApplication] Display manager initialized")
-
-        # Attach camera view to sensor manager
-        self.logger.debug("[SimulationApplication] Setting up camera...")
-        camera_sensor = self.sensor_manager.get_sensor("camera")
-        if camera_sensor:
-            self.logger.debug(
-                "[SimulationApplication] Camera sensor found, attaching view..."
-            )
-            camera_sensor.attach(self.display_manager.camera_view)
-            self.logger.debug(
-                "[SimulationApplication] Camera view attached to sensor manager"
-            )
+        if getattr(self._config, "headless", False):
+            # Data-logging run: no display at all, and the server skips rendering
+            self.logger.info("Headless run: display disabled, server rendering off")
+            self.world_manager.set_rendering_enabled(False)
         else:
-            self.logger.debug("[SimulationApplication] ERROR: Camera sensor not found!")
+            self._setup_display()
 
         # Verify connection is valid
         self.logger.debug("[SimulationApplication] Verifying CARLA connection...")
@@ -168,6 +184,29 @@ class SimulationApplication:
         self._setup_scenario(self._config.get("scenario", "follow_route"))
         self.logger.debug("[SimulationApplication] Setup completed successfully")
 
+    def _setup_display(self) -> None:
+        """Create the display manager and attach its camera view"""
+        self.logger.debug("[SimulationApplication] Initializing display manager...")
+        is_web_mode = getattr(self._config, "web_mode", False)
+        # Import here to ensure SDL envs are set beforehand
+        from carla_simulator.visualization.display_manager import DisplayManager
+        self.display_manager = DisplayManager(self._config.display_config, web_mode=is_web_mode)
+        self.logger.debug("[SimulationApplication] Display manager initialized")
+
+        # Attach camera view to sensor manager
+        self.logger.debug("[SimulationApplication] Setting up camera...")
+        camera_sensor = self.sensor_manager.get_sensor("camera")
+        if camera_sensor:
+            self.logger.debug(
+                "[SimulationApplication] Camera sensor found, attaching view..."
+            )
+            camera_sensor.attach(self.display_manager.camera_view)
+            self.logger.debug(
+                "[SimulationApplication] Camera view attached to sensor manager"
+            )
+        else:
+            self.logger.debug("[SimulationApplication] ERROR: Camera sensor not found!")
+
     def _setup_scenario(
         self, scenario_type: str, scenario_config: Optional[Dict] = None
     ) -> None:
@@ -260,30 +299,75 @@ class SimulationApplication:
         #     self.logger.error(f"Database connection test failed: {str(e)}")
         #     # Continue anyway, but log the issue
 
+        tick_executor = None
         try:
             world = self.connection.client.get_world()
             frame_count = 0
+            self._start_db_writer()
             
             # Determine if we are in web mode to adjust workload (DB writes, rendering)
             is_web_mode = getattr(self._config, "web_mode", False)
+            # Headless web rendering is pure numpy work, so it can run off the tick loop.
+            # The CLI window stays on this thread: it shares the pygame event pump with
+            # the keyboard controller and SDL windows must be driven by their owner.
+            if is_web_mode and self.display_manager:
+                self._start_display_worker()
+            # Metric samples every N ticks (configurable; 0 or less turns them off)
+            metrics_interval = getattr(self._config.logging_config, "metrics_interval", 30)
             # Throttle DB writes to once per second (time-based, independent of FPS)
-            last_db_write_ts = time.time()
+            last_db_write_ns = time.monotonic_ns()
 
-            while self.state.is_running and not self.current_scenario.is_completed():
+            # Resolve per-run lookups once instead of probing attributes every tick
+            scenario_name = getattr(self.current_scenario, "name", "Unknown")
+            controller_config = getattr(self._config, "controller_config", None)
+            control_type = {"keyboard": "Keyboard", "gamepad": "Gamepad"}.get(
+                getattr(controller_config, "type", None), "Autopilot"
+            )
+            display_state = None  # Allocated on first render, then reused every tick
+            # Per-tick vehicle state, allocated once and refreshed in place; consumers
+            # read it synchronously within the tick and never keep a reference
+            vehicle_state: Dict[str, Any] = dict.fromkeys(_VEHICLE_STATE_KEYS)
+            # Last control sent to the ego; the HUD, display and DB snapshot read it instead
+            # of a get_control() round-trip
+            last_control = None
+            # Bind per-tick method handles once to skip repeated attribute chains
+            process_input = self.vehicle_controller.process_input
+            get_vehicle = self.vehicle_controller.get_vehicle
+            get_control = self.vehicle_controller.get_control
+            get_sensor_data = self.sensor_manager.get_sensor_data
+            scenario_update = self.current_scenario.update
+            # Purely positional scenarios opt in to skipping update() until the ego
+            # has moved far enough for a waypoint event to be possible
+            min_move = getattr(self.current_scenario, "min_update_distance", None)
+            min_move_sq = min_move * min_move if min_move else None
+            last_update_xyz = None
+            metrics_update = self.metrics.update
+            world_tick = world.tick
+            # The server tick runs on this worker while the frame just read is rendered
+            # and logged; the loop joins it before reading the next frame
+            tick_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="world-tick")
+            submit_tick = tick_executor.submit
+            get_snapshot = world.get_snapshot
+            # End-of-run checks are evaluated inline on these handles every tick
+            state = self.state
+            scenario_completed = self.current_scenario.is_completed
+            # Minimap target when the scenario exposes none; the display only reads it
+            no_target = carla.Location()
+
+            while state.is_running and not scenario_completed():
                 frame_count += 1
-                loop_start = time.time()
 
                 # # Debug: Log every 30 frames to track progress
                 # if frame_count % 30 == 0:
                 #     self.logger.debug(f"Simulation frame {frame_count}: is_running={self.state.is_running}, scenario_completed={self.current_scenario.is_completed()}")
 
-                if self.state.is_paused:
+                if state.is_paused:
                     time.sleep(0.1)
                     continue
 
                 # Process input first (keyboard events, etc.)
                 try:
-                    if self.vehicle_controller.process_input():
+                    if process_input():
                         self.logger.info("Vehicle controller requested exit")
                         break  # Exit if process_input returns True
                 except Exception as e:
@@ -291,14 +375,14 @@ class SimulationApplication:
 
                 # Get sensor data
                 try:
-                    sensor_data = self.sensor_manager.get_sensor_data()
+                    sensor_data = get_sensor_data()
                 except Exception as e:
                     self.logger.error(f"Error getting sensor data: {str(e)}")
                     sensor_data = {}
 
                 # Get vehicle state
                 try:
-                    vehicle = self.vehicle_controller.get_vehicle()
+                    vehicle = get_vehicle()
                     if not vehicle:
                         self.logger.warning("No vehicle available, skipping frame")
                         continue
@@ -307,95 +391,77 @@ class SimulationApplication:
                     continue
 
                 try:
-                    vehicle_state = {
-                        "location": vehicle.get_location(),
-                        "velocity": vehicle.get_velocity(),
-                        "acceleration": vehicle.get_acceleration(),
-                        "transform": vehicle.get_transform(),
-                        "sensor_data": sensor_data,
-                    }
+                    # Read the ego once from the last tick's world snapshot; the actor
+                    # accessors are only hit before the first tick after a (re)spawn
+                    ego = get_snapshot().find(vehicle.id)
+                    if ego is None:
+                        ego = vehicle
+                    transform = ego.get_transform()
+                    velocity = ego.get_velocity()
+                    vehicle_state["location"] = transform.location
+                    vehicle_state["velocity"] = velocity
+                    vehicle_state["acceleration"] = ego.get_acceleration()
+                    vehicle_state["transform"] = transform
+                    vehicle_state["sensor_data"] = sensor_data
+                    # Speed in m/s, computed once and shared by DB, HUD and display below
+                    speed = velocity.length()
                 except Exception as e:
                     self.logger.error(f"Error getting vehicle state: {str(e)}")
                     continue
 
-                # --- DB: Write vehicle and sensor data (once per second) ---
+                # One clock read per tick, shared by the DB throttle and the metrics
+                now_ns = time.monotonic_ns()
+
+                # --- DB: Queue vehicle and sensor data (once per second) for the writer thread ---
                 try:
-                    now_ts = time.time()
-                    if (now_ts - last_db_write_ts) >= 1.0:
-                        db = SessionLocal()
-                        try:
-                            db.add(
-                                VehicleData(
-                                    scenario_id=scenario_id,
-                                    session_id=self.session_id,
-                                    timestamp=datetime.utcnow(),
-                                    position_x=vehicle_state["location"].x,
-                                    position_y=vehicle_state["location"].y,
-                                    position_z=vehicle_state["location"].z,
-                                    velocity=vehicle_state["velocity"].length(),
-                                    acceleration=vehicle_state["acceleration"].length(),
-                                    steering_angle=vehicle_state["transform"].rotation.yaw,
-                                    throttle=getattr(vehicle, "throttle", 0.0),
-                                    brake=getattr(vehicle, "brake", 0.0),
-                                )
-                            )
-                            # Write latest sensor data snapshot in same transaction
-                            for sensor_type, sdata in (
-                                sensor_data.items() if isinstance(sensor_data, dict) else []
-                            ):
-                                db.add(
-                                    SensorData(
-                                        scenario_id=scenario_id,
-                                        session_id=self.session_id,
-                                        timestamp=datetime.utcnow(),
-                                        sensor_type=sensor_type,
-                                        data=sdata,
-                                    )
-                                )
-                            db.commit()
-                            last_db_write_ts = now_ts
-                        finally:
-                            db.close()
+                    if now_ns - last_db_write_ns >= 1_000_000_000:
+                        applied = last_control if last_control is not None else _NO_CONTROL
+                        location = vehicle_state["location"]
+                        self._submit_db_write(
+                            self._write_vehicle_snapshot,
+                            scenario_id,
+                            datetime.utcnow(),
+                            {
+                                "position_x": location.x,
+                                "position_y": location.y,
+                                "position_z": location.z,
+                                "velocity": speed,
+                                "acceleration": vehicle_state["acceleration"].length(),
+                                "steering_angle": vehicle_state["transform"].rotation.yaw,
+                                "throttle": applied.throttle,
+                                "brake": applied.brake,
+                            },
+                            list(sensor_data.items()) if isinstance(sensor_data, dict) else [],
+                        )
+                        last_db_write_ns = now_ns
                 except Exception as e:
-                    self.logger.error(f"Error writing data to DB (1 Hz): {str(e)}")
+                    self.logger.error(f"Error queueing data for DB (1 Hz): {str(e)}")
                 # --- End DB write ---
 
                 # (Sensor data write moved above into the 1 Hz combined write)
 
                 try:
-                    # Update scenario and autopilot movement
-                    self.current_scenario.update()
-                    # Nudge traffic manager each tick to ensure autopilot moves
-                    try:
-                        vc = self.vehicle_controller
-                        if vc and hasattr(vc, "_strategy") and vc._strategy:
-                            # Ensure autopilot strategy sync
-                            if hasattr(vc._strategy, "process_input"):
-                                vc._strategy.process_input()
-                    except Exception:
-                        pass
+                    # Update scenario; the controller strategy (including the autopilot
+                    # mirror) already synced once this tick in process_input()
+                    run_update = True
+                    if min_move_sq is not None:
+                        location = vehicle_state["location"]
+                        xyz = (location.x, location.y, location.z)
+                        if last_update_xyz is not None:
+                            dx = xyz[0] - last_update_xyz[0]
+                            dy = xyz[1] - last_update_xyz[1]
+                            dz = xyz[2] - last_update_xyz[2]
+                            run_update = dx * dx + dy * dy + dz * dz >= min_move_sq
+                        if run_update:
+                            last_update_xyz = xyz
+                    if run_update:
+                        scenario_update()
                     # Update HUD snapshot (best-effort)
                     try:
-                        ctrl = vehicle.get_control()
-                        
-                        # Determine control type from configuration
-                        control_type = "Autopilot"
-                        scenario_name = getattr(self.current_scenario, "name", "Unknown")
-                        
-                        # Get controller type from configuration
-                        if hasattr(self, '_config') and hasattr(self._config, 'controller_config'):
-                            config_type = self._config.controller_config.type
-                            if config_type == "keyboard":
-                                control_type = "Keyboard"
-                            elif config_type == "gamepad":
-                                control_type = "Gamepad"
-                            elif config_type == "autopilot":
-                                control_type = "Autopilot"
-                        
                         payload = {
                             "scenarioName": scenario_name,
-                            "speedKmh": float(vehicle_state["velocity"].length() * 3.6) if isinstance(vehicle_state.get("velocity"), carla.Vector3D) else 0.0,
-                            "gear": int(getattr(ctrl, "gear", 1)),
+                            "speedKmh": float(speed * 3.6),
+                            "gear": int(getattr(last_control, "gear", 1)),
                             "controlType": control_type,
                             "fps": float(self.metrics.metrics.get("fps", 0.0)) if self.metrics else 0.0,
                         }
@@ -408,67 +474,98 @@ class SimulationApplication:
 
                 try:
                     # Apply vehicle control
-                    control = self.vehicle_controller.get_control(vehicle_state)
+                    control = get_control(vehicle_state)
                     vehicle.apply_control(control)
+                    last_control = control
                 except Exception as e:
                     self.logger.error("Exception in control/apply", exc_info=e)
 
                 try:
                     # Update metrics
-                    self.metrics.update(vehicle_state)
+                    metrics_update(vehicle_state, now_ns)
                 except Exception as e:
                     self.logger.error("Exception in metrics update", exc_info=e)
 
+                # Control and scenario commands for this frame are sent; everything
+                # below only uses data already read, so the tick can overlap it
+                tick_future = submit_tick(world_tick)
+                display_exit = False
+
                 try:
                     # Render display
-                    if self.display_manager and self.state.is_running:
-                        from carla_simulator.visualization.display_manager import VehicleState
-                        display_state = VehicleState(
-                            speed=vehicle_state["velocity"].length(),
-                            position=(
-                                vehicle_state["location"].x,
-                                vehicle_state["location"].y,
-                                vehicle_state["location"].z,
-                            ),
-                            heading=vehicle_state["transform"].rotation.yaw,
-                            distance_to_target=0.0,  # This should be updated by the scenario
-                            controls={
-                                "throttle": getattr(vehicle, "throttle", 0.0),
-                                "brake": getattr(vehicle, "brake", 0.0),
-                                "steer": getattr(vehicle, "steer", 0.0),
-                                "gear": getattr(vehicle, "gear", 1),
-                                "hand_brake": getattr(vehicle, "hand_brake", False),
-                                "reverse": getattr(vehicle, "reverse", False),
-                                "manual_gear_shift": getattr(
-                                    vehicle, "manual_gear_shift", False
-                                ),
-                            },
-                            speed_kmh=vehicle_state["velocity"].length() * 3.6,
-                            scenario_name=self.current_scenario.name,
-                        )
+                    if self.display_manager and state.is_running:
+                        if display_state is None:
+                            from carla_simulator.visualization.display_manager import VehicleState
+                            display_state = VehicleState(
+                                speed=0.0,
+                                position=(0.0, 0.0, 0.0),
+                                heading=0.0,
+                                distance_to_target=0.0,  # This should be updated by the scenario
+                                controls={},
+                                speed_kmh=0.0,
+                                scenario_name=scenario_name,
+                            )
+                        # Update the display state in place instead of rebuilding it
+                        location = vehicle_state["location"]
+                        display_state.speed = speed
+                        display_state.position = (location.x, location.y, location.z)
+                        display_state.heading = vehicle_state["transform"].rotation.yaw
+                        display_state.speed_kmh = speed * 3.6
+                        # Controls come from the command applied this tick; carla.Vehicle
+                        # itself carries no throttle/brake/... attributes to read
+                        applied = last_control if last_control is not None else _NO_CONTROL
+                        controls = display_state.controls
+                        controls["throttle"] = applied.throttle
+                        controls["brake"] = applied.brake
+                        controls["steer"] = applied.steer
+                        controls["gear"] = applied.gear
+                        controls["hand_brake"] = applied.hand_brake
+                        controls["reverse"] = applied.reverse
+                        controls["manual_gear_shift"] = applied.manual_gear_shift
                         target_pos = getattr(
                             self.current_scenario, "target_position", None
                         )
                         if target_pos is None:
-                            target_pos = carla.Location()
-                        if not self.display_manager.render(display_state, target_pos):
-                            self.logger.info("Display manager requested exit")
-                            break
+                            target_pos = no_target
+                        if self._frame_ring is not None:
+                            if self._display_exit:
+                                display_exit = True
+                            else:
+                                # The worker gets its own copy; display_state is reused
+                                # next tick
+                                self._submit_frame(
+                                    replace(display_state, controls=dict(controls)), target_pos
+                                )
+                        elif not self.display_manager.render(display_state, target_pos):
+                            display_exit = True
                 except Exception as e:
                     self.logger.error("Exception in display rendering", exc_info=e)
 
                 try:
                     # Log metrics periodically
-                    if self.metrics.metrics["frame_count"] % 30 == 0:
-                        self.metrics.log_metrics()
+                    if (
+                        metrics_interval > 0
+                        and self.metrics.metrics["frame_count"] % metrics_interval == 0
+                    ):
+                        # Capture the sample now; the writer thread runs it later
+                        sample = self.metrics.metrics
+                        self._submit_db_write(
+                            self.metrics.log_metrics,
+                            sample["elapsed_time"],
+                            sample["vehicle_speed"],
+                            sample["fps"],
+                        )
                 except Exception as e:
                     self.logger.error("Exception in logging", exc_info=e)
 
                 try:
-                    world.tick()
+                    tick_future.result()
                 except Exception as e:
                     self.logger.error(f"Error in world tick: {str(e)}")
                     break
+                if display_exit:
+                    self.logger.info("Display manager requested exit")
+                    break
 
             # Log why the loop ended
             if not self.state.is_running:
@@ -483,9 +580,180 @@ class SimulationApplication:
             raise
         finally:
             self.logger.debug("Simulation loop cleanup starting")
+            if tick_executor is not None:
+                # Let an in-flight tick finish before actors are torn down
+                tick_executor.shutdown(wait=True)
+            self._stop_display_worker()
+            if self.metrics is not None:
+                # Queued behind any pending samples so the last partial batch lands too
+                self._submit_db_write(self.metrics.flush_metrics, droppable=False)
+            self._stop_db_writer()
             self.cleanup()
             self.logger.debug("Simulation loop cleanup completed")
 
+    def _start_db_writer(self) -> None:
+        """Start the background thread that performs the tick loop's DB writes"""
+        self._db_queue = queue.Queue(maxsize=256)
+        self._db_dropped = 0
+        # The thread keeps its own queue reference so a slow stop cannot pull it away
+        self._db_writer = threading.Thread(
+            target=self._db_writer_loop,
+            args=(self._db_queue,),
+            name="simulation-db-writer",
+            daemon=True,
+        )
+        self._db_writer.start()
+
+    def _submit_db_write(self, func, *args, droppable: bool = True) -> None:
+        """Queue a DB write without blocking the tick loop, dropping the oldest when full
+
+        Non-droppable writes (final flushes) wait for room in the queue instead, and
+        run on the calling thread if the writer makes no room in time.
+        """
+        if self._db_queue is None:
+            func(*args)
+            return
+        item = (func, args)
+        if not droppable:
+            try:
+                self._db_queue.put(item, timeout=5.0)
+            except queue.Full:
+                func(*args)
+            return
+        try:
+            self._db_queue.put_nowait(item)
+        except queue.Full:
+            try:
+                self._db_queue.get_nowait()
+                self._db_dropped += 1
+                if self._db_dropped == 1 or self._db_dropped % 100 == 0:
+                    self.logger.warning(
+                        "DB write queue full; dropped oldest pending write (%d so far)",
+                        self._db_dropped,
+                    )
+            except queue.Empty:
+                pass
+            self._db_queue.put_nowait(item)
+
+    def _db_writer_loop(self, db_queue: queue.Queue) -> None:
+        """Run queued DB writes until the stop sentinel arrives"""
+        while True:
+            item = db_queue.get()
+            if item is None:
+                return
+            func, args = item
+            try:
+                func(*args)
+            except Exception as e:
+                self.logger.error(f"Error writing data to DB: {str(e)}")
+
+    def _stop_db_writer(self, timeout: float = 5.0) -> None:
+        """Let the writer drain pending writes, then stop it"""
+        if self._db_writer is None:
+            return
+        try:
+            self._db_queue.put(None, timeout=timeout)
+            self._db_writer.join(timeout)
+        except queue.Full:
+            self.logger.warning("DB writer did not drain in time; dropping pending writes")
+        if self._db_writer.is_alive():
+            # Still inside a slow write; it keeps its own queue reference and exits on
+            # the sentinel, while later writes run synchronously instead of queueing
+            # behind it
+            self.logger.warning(
+                "DB writer still busy after %.1fs; leaving it to finish in the background",
+                timeout,
+            )
+        if self._db_dropped:
+            self.logger.warning(
+                "DB writer dropped %d writes because its queue was full", self._db_dropped
+            )
+        self._db_writer = None
+        self._db_queue = None
+
+    def _start_display_worker(self) -> None:
+        """Start the thread that renders the latest submitted frame state"""
+        self._frame_ring = deque(maxlen=2)
+        self._frame_ready.clear()
+        self._display_stop.clear()
+        self._display_exit = False
+        self._display_worker = threading.Thread(
+            target=self._display_loop, name="simulation-display", daemon=True
+        )
+        self._display_worker.start()
+
+    def _submit_frame(self, display_state, target_position) -> None:
+        """Hand a frame state to the display worker; stale frames are overwritten"""
+        self._frame_ring.append((display_state, target_position))
+        self._frame_ready.set()
+
+    def _display_loop(self) -> None:
+        """Render the newest queued frame until stopped or the display asks to exit"""
+        while not self._display_stop.is_set():
+            if not self._frame_ready.wait(0.1):
+                continue
+            self._frame_ready.clear()
+            try:
+                display_state, target_position = self._frame_ring.pop()
+            except IndexError:
+                continue
+            try:
+                if not self.display_manager.render(display_state, target_position):
+                    self._display_exit = True
+                    return
+            except Exception as e:
+                self.logger.error("Exception in display rendering", exc_info=e)
+
+    def _stop_display_worker(self, timeout: float = 2.0) -> None:
+        """Stop the display worker before the display manager is torn down"""
+        if self._display_worker is None:
+            return
+        self._display_stop.set()
+        self._frame_ready.set()
+        self._display_worker.join(timeout)
+        if self._display_worker.is_alive():
+            # Still inside a render; keep the references so cleanup leaves the
+            # display alone instead of tearing pygame down underneath it
+            self.logger.warning(
+                "Display worker still rendering after %.1fs; skipping display teardown",
+                timeout,
+            )
+            return
+        self._display_worker = None
+        self._frame_ring = None
+
+    def _write_vehicle_snapshot(
+        self,
+        scenario_id: Optional[int],
+        timestamp: datetime,
+        vehicle_row: Dict[str, Any],
+        sensor_rows: list,
+    ) -> None:
+        """Write one vehicle row plus the latest sensor readings in a single transaction"""
+        db = SessionLocal()
+        try:
+            db.add(
+                VehicleData(
+                    scenario_id=scenario_id,
+                    session_id=self.session_id,
+                    timestamp=timestamp,
+                    **vehicle_row,
+                )
+            )
+            for sensor_type, sdata in sensor_rows:
+                db.add(
+                    SensorData(
+                        scenario_id=scenario_id,
+                        session_id=self.session_id,
+                        timestamp=timestamp,
+                        sensor_type=sensor_type,
+                        data=sdata,
+                    )
+                )
+            db.commit()
+        finally:
+            db.close()
+
     def pause(self) -> None:
         """Pause the simulation"""
         self.state.pause()
@@ -508,7 +776,7 @@ class SimulationApplication:
                 scenario_completed = self.current_scenario.is_completed()
                 scenario_success = self.current_scenario.is_successful()
 
-                self.logger.info("================================")
+                self.logger.info(LOG_BANNER)
                 self.logger.info(f"Stopping scenario: {scenario_name}")
                 self.logger.info(
                     f"Status: {'Completed' if scenario_completed else 'Incomplete'}"
@@ -516,7 +784,7 @@ class SimulationApplication:
                 self.logger.info(
                     f"Result: {'Success' if scenario_success else 'Failed'}"
                 )
-                self.logger.info("================================")
+                self.logger.info(LOG_BANNER)
 
     def cleanup(self) -> None:
         """Clean up simulation resources"""
@@ -570,8 +838,10 @@ class SimulationApplication:
                 except Exception as e:
                     self.logger.error(f"Error cleaning up sensor manager: {str(e)}")
 
-            # Clean up display
-            if self.display_manager:
+            # Clean up display, unless its worker is still stuck in a render
+            if self._display_worker is not None and self._display_worker.is_alive():
+                self.logger.warning("Display worker still running; leaving the display open")
+            elif self.display_manager:
                 self.logger.debug("Cleaning up display manager...")
                 try:
                     self.display_manager.cleanup()
@@ -582,6 +852,9 @@ class SimulationApplication:
             if self.world_manager:
                 self.logger.debug("Cleaning up world manager...")
                 try:
+                    if getattr(self._config, "headless", False):
+                        # Hand the shared server back with rendering on
+                        self.world_manager.set_rendering_enabled(True)
                     # Debug: Show tracked actors before cleanup
                     if hasattr(self.world_manager, 'get_all_tracked_actors'):
                         tracked_actors = self.world_manager.get_all_tracked_actors()
@@ -589,8 +862,8 @@ class SimulationApplication:
                     
                     # First destroy all actors including the vehicle
                     self.world_manager.cleanup()
-                    # Add a small delay to ensure actors are destroyed
-                    time.sleep(0.5)
+                    # Wait for the server to settle instead of sleeping a fixed delay
+                    self.connection.wait_until_ready(timeout=0.5)
                     
                     # Avoid calling force_cleanup_all_actors to prevent native crashes in libcarla
                 except Exception as e:
@@ -621,8 +894,6 @@ class SimulationApplication:
             self.world_manager = None
 
             # Force garbage collection
-            import gc
-
             gc.collect()
 
             # Set cleanup flag
@@ -4,6 +4,7 @@ from typing import Optional, Dict, Any
 import carla
 import yaml
 import os
+import copy
 import time
 from dataclasses import dataclass
 from carla_simulator.core.interfaces import (
@@ -29,9 +30,33 @@ from carla_simulator.utils.config import (
     KeyboardConfig,
 )
 from carla_simulator.utils.logging import SimulationData
+from carla_simulator.utils.paths import get_project_root
 from datetime import datetime
 from pathlib import Path
 
+# Placeholder per-frame values for SimulationMetrics.log_metrics (read-only)
+_DEFAULT_VEHICLE_STATE = {
+    "heading": 0.0,
+    "acceleration": 0.0,
+    "angular_velocity": 0.0,
+    "collision_intensity": 0.0,
+    "rotation": (0.0, 0.0, 0.0),
+}
+_DEFAULT_CONTROLS = {
+    "throttle": 0.0,
+    "brake": 0.0,
+    "steer": 0.0,
+    "gear": 1,
+    "hand_brake": False,
+    "reverse": False,
+    "manual_gear_shift": False,
+}
+_DEFAULT_TARGET_INFO = {"distance": 0.0, "heading": 0.0, "heading_diff": 0.0}
+_DEFAULT_WEATHER = {"cloudiness": 0.0, "precipitation": 0.0}
+
+# Metric samples buffered by SimulationMetrics.log_metrics per bulk DB write
+_METRICS_BATCH = 10
+
 
 @dataclass
 class ServerConfig:
@@ -53,6 +78,13 @@ class ConnectionManager:
 
     def connect(self) -> bool:
         """Connect to CARLA server with retries"""
+        # Reuse a client handed over from a previous scenario if it still responds
+        if self.client is not None:
+            if self.wait_until_ready(timeout=1.0):
+                self.logger.debug("Reusing existing CARLA client connection")
+                return True
+            self.client = None
+
         max_retries = 3
         delay = 30
         for attempt in range(1, max_retries + 1):
@@ -84,6 +116,20 @@ class ConnectionManager:
                     self.logger.warning("All connection attempts failed.")
                     return False
 
+    def wait_until_ready(self, timeout: float = 2.0, poll_interval: float = 0.05) -> bool:
+        """Poll the server with a cheap RPC until it responds or the timeout expires"""
+        if not self.client:
+            return False
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                self.client.get_server_version()
+                return True
+            except Exception:
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(poll_interval)
+
     def disconnect(self) -> None:
         """Disconnect from CARLA server"""
         if self.client:
@@ -104,7 +150,7 @@ class SimulationState:
     def start(self) -> None:
         """Start simulation"""
         self.is_running = True
-        self.start_time = time.time()
+        self.start_time = time.monotonic_ns()
 
     def pause(self) -> None:
         """Pause simulation"""
@@ -122,7 +168,7 @@ class SimulationState:
     def update(self) -> None:
         """Update simulation state"""
         if self.is_running and not self.is_paused:
-            self.elapsed_time = time.time() - self.start_time
+            self.elapsed_time = (time.monotonic_ns() - self.start_time) * 1e-9
 
 
 class SimulationMetrics:
@@ -133,23 +179,29 @@ class SimulationMetrics:
         self.metrics = {
             "fps": 0.0,
             "frame_count": 0,
-            "last_frame_time": time.time(),  # Initialize with current time
+            "last_frame_time": time.monotonic_ns(),  # Monotonic clock, nanoseconds
             "vehicle_speed": 0.0,
             "distance_traveled": 0.0,
             "collisions": 0,
             "min_frame_time": 0.001,  # Minimum frame time to avoid division by zero
-            "start_time": time.time(),  # Add start time for elapsed time calculation
+            "start_time": time.monotonic_ns(),  # Add start time for elapsed time calculation
             "elapsed_time": 0.0,
         }
         self.scenario = None
         self.start_time = datetime.now()
         self.end_time = None
         self.success = None
-
-    def update(self, vehicle_state: Dict[str, Any]) -> None:
-        """Update metrics with current state"""
-        current_time = time.time()
-        frame_time = current_time - self.metrics["last_frame_time"]
+        # Sampled metric columns, preallocated and filled by scalar stores; a full
+        # batch becomes one DB write instead of a session per sample
+        self._sample_elapsed = [0.0] * _METRICS_BATCH
+        self._sample_speed = [0.0] * _METRICS_BATCH
+        self._sample_fps = [0.0] * _METRICS_BATCH
+        self._sample_count = 0
+
+    def update(self, vehicle_state: Dict[str, Any], now_ns: Optional[int] = None) -> None:
+        """Update metrics with current state, timed by the caller's now_ns if given"""
+        current_time = time.monotonic_ns() if now_ns is None else now_ns
+        frame_time = (current_time - self.metrics["last_frame_time"]) * 1e-9
 
         # Update FPS with minimum frame time to avoid division by zero
         if frame_time > 0:
@@ -158,60 +210,68 @@ class SimulationMetrics:
         self.metrics["frame_count"] += 1
 
         # Update elapsed time
-        self.metrics["elapsed_time"] = current_time - self.metrics["start_time"]
+        self.metrics["elapsed_time"] = (current_time - self.metrics["start_time"]) * 1e-9
 
         # Update vehicle metrics
         if "velocity" in vehicle_state:
             speed = vehicle_state["velocity"].length() * 3.6  # Convert to km/h
             self.metrics["vehicle_speed"] = speed
 
-    def log_metrics(self) -> None:
-        """Log current metrics to file"""
+    def log_metrics(
+        self,
+        elapsed_time: Optional[float] = None,
+        speed: Optional[float] = None,
+        fps: Optional[float] = None,
+    ) -> None:
+        """Record one metric sample; every full batch is written to the DB in bulk
+
+        Values not passed are read from the current metrics. Callers logging from
+        another thread pass the values captured on the tick that produced them.
+        """
         if not self.logger:
             return
 
-        # Get vehicle state from the current frame
-        vehicle_state = {
-            "heading": 0.0,
-            "acceleration": 0.0,
-            "angular_velocity": 0.0,
-            "collision_intensity": 0.0,
-            "rotation": (0.0, 0.0, 0.0),
-        }
-
-        # Get controls from the current frame
-        controls = {
-            "throttle": 0.0,
-            "brake": 0.0,
-            "steer": 0.0,
-            "gear": 1,
-            "hand_brake": False,
-            "reverse": False,
-            "manual_gear_shift": False,
-        }
-
-        # Get target info from the current frame
-        target_info = {"distance": 0.0, "heading": 0.0, "heading_diff": 0.0}
-
-        # Create simulation data object with actual metrics
-        data = SimulationData(
-            elapsed_time=self.metrics["elapsed_time"],
-            speed=self.metrics["vehicle_speed"],
-            position=(0.0, 0.0, 0.0),  # Default position
-            controls=controls,
-            target_info=target_info,
-            vehicle_state=vehicle_state,
-            weather={"cloudiness": 0.0, "precipitation": 0.0},
-            traffic_count=0,
-            fps=self.metrics["fps"],
-            event="metrics_update",
-            event_details="",
+        index = self._sample_count
+        metrics = self.metrics
+        self._sample_elapsed[index] = (
+            metrics["elapsed_time"] if elapsed_time is None else elapsed_time
         )
-
-        # Log to file and flush immediately
-        self.logger.log_data(data)
-        if hasattr(self.logger, "csv_file") and self.logger.csv_file:
-            self.logger.csv_file.flush()
+        self._sample_speed[index] = metrics["vehicle_speed"] if speed is None else speed
+        self._sample_fps[index] = metrics["fps"] if fps is None else fps
+        self._sample_count = index + 1
+        if self._sample_count == _METRICS_BATCH:
+            self.flush_metrics()
+
+    def flush_metrics(self) -> None:
+        """Write the buffered metric samples to the DB in one bulk call"""
+        count = self._sample_count
+        if not count or not self.logger:
+            return
+        self._sample_count = 0
+
+        # Only elapsed time, speed and FPS are sampled; the per-frame vehicle state,
+        # controls, target and weather are placeholders shared across records
+        records = [
+            SimulationData(
+                elapsed_time=elapsed,
+                speed=speed,
+                position=(0.0, 0.0, 0.0),  # Default position
+                controls=_DEFAULT_CONTROLS,
+                target_info=_DEFAULT_TARGET_INFO,
+                vehicle_state=_DEFAULT_VEHICLE_STATE,
+                weather=_DEFAULT_WEATHER,
+                traffic_count=0,
+                fps=fps,
+                event="metrics_update",
+                event_details="",
+            )
+            for elapsed, speed, fps in zip(
+                self._sample_elapsed[:count],
+                self._sample_speed[:count],
+                self._sample_fps[:count],
+            )
+        ]
+        self.logger.log_data_bulk(records)
 
     def generate_html_report(self, scenario_results, start_time, end_time):
         """Generate a pytest-html style HTML report for multiple scenarios in the reports directory at the project root."""
@@ -221,7 +281,6 @@ class SimulationMetrics:
         import platform
         from carla_simulator.database.config import SessionLocal
         from carla_simulator.database.models import SimulationReport
-        import os
 
         total = len(scenario_results)
         passed = sum(1 for s in scenario_results if s["result"].lower() == "passed")
@@ -354,8 +413,13 @@ class SimulationMetrics:
 class SimulationConfig:
     """Manages simulation configuration"""
 
-    def __init__(self, config_path: str, scenario: str = None):
-        self.config = self._load_config(config_path, scenario)
+    def __init__(
+        self,
+        config_path: str,
+        scenario: str = None,
+        config_dict: Optional[Dict[str, Any]] = None,
+    ):
+        self.config = self._load_config(config_path, scenario, config_dict)
         self.validate_config()
 
         # Create the main config object
@@ -382,17 +446,29 @@ class SimulationConfig:
         self.vehicle = self._main_config.vehicle
         self.scenario_config = self._main_config.scenarios
 
-    def _load_config(self, config_path: str, scenario: str = None) -> Dict[str, Any]:
-        """Load configuration, preferring DB when CONFIG_TENANT_ID is set; fallback to YAML."""
+    def _load_config(
+        self,
+        config_path: str,
+        scenario: str = None,
+        config_dict: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Load configuration, preferring DB when CONFIG_TENANT_ID is set; fallback to YAML.
+
+        A preloaded ``config_dict`` skips the lookup and is deep-copied so the
+        caller can share it across several scenarios.
+        """
         try:
+            if config_dict is not None:
+                config = copy.deepcopy(config_dict)
+                if scenario:
+                    config["scenario"] = scenario
+                return config
+
             from carla_simulator.utils.config import _load_config_dict
 
             # Resolve relative path to absolute for YAML fallback resolution
             if not os.path.isabs(config_path):
-                config_path = os.path.join(
-                    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                    config_path,
-                )
+                config_path = os.path.join(get_project_root(), config_path)
 
             config = _load_config_dict(config_path) or {}
 
@@ -508,6 +584,9 @@ class SimulationConfig:
             log_level=logging["log_level"],
             enabled=logging["enabled"],
             directory=logging["directory"],
+            metrics_interval=logging.get(
+                "metrics_interval", LoggingConfig.metrics_interval
+            ),
         )
 
     def _create_display_config(self) -> DisplayConfig:
@@ -163,7 +163,7 @@ class SimulationManager(ISimulationManager):
 
                 # Get vehicle velocity
                 velocity = self.vehicle.get_velocity()
-                speed = math.sqrt(velocity.x**2 + velocity.y**2 + velocity.z**2)
+                speed = math.hypot(velocity.x, velocity.y, velocity.z)
 
                 # Update state
                 self._state.vehicle_state = VehicleState(
@@ -231,8 +231,8 @@ class SimulationManager(ISimulationManager):
 
     def should_continue(self) -> bool:
         """Check if simulation should continue"""
-        elapsed_time = time.time() - self.start_time
-        return elapsed_time < self.config["simulation_time"] and not self.is_finished
+        elapsed_ns = time.monotonic_ns() - self.start_time
+        return elapsed_ns < self.config["simulation_time"] * 1e9 and not self.is_finished
 
     def set_scenario(self, scenario: IScenario) -> None:
         """Set the current scenario"""
@@ -5,8 +5,12 @@ Core simulation runner class for managing simulation execution.
 import os
 import sys
 import argparse
-import pytest
+import gc
+import copy
+import multiprocessing
 import uuid
+from dataclasses import replace
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from datetime import datetime
@@ -18,7 +22,38 @@ from carla_simulator.utils.logging import Logger
 from carla_simulator.scenarios.scenario_registry import ScenarioRegistry
 from carla_simulator.utils.paths import get_config_path
 from carla_simulator.utils.default_config import SIMULATION_CONFIG
-from carla_simulator.utils.config import load_config
+from carla_simulator.utils.config import load_config, _load_config_dict
+from carla_simulator.utils.settings import LOG_BANNER
+
+
+def _run_scenario_batch(
+    config_file: str,
+    session_id: uuid.UUID,
+    scenarios: List[str],
+    config_dict: Dict[str, Any],
+    tm_port_base: int,
+    debug: bool,
+    headless: bool = False,
+) -> List[tuple[str, bool, str]]:
+    """Run a batch of scenarios sequentially in a worker process
+
+    Each worker gets its own server port (already set in ``config_dict``) and
+    Traffic Manager port so concurrent workers never share a CARLA instance.
+    """
+    os.environ["CARLA_TM_PORT_BASE"] = str(tm_port_base)
+    runner = SimulationRunner(config_file, session_id=session_id, db_only=True)
+    runner.headless = headless
+    results = []
+    try:
+        runner.setup_logger(debug)
+        runner.register_scenarios()
+        for scenario in scenarios:
+            success, message = runner.run_single_scenario(scenario, config_dict)
+            results.append((scenario, success, message))
+    finally:
+        # Pool workers exit without logging shutdown; flush the buffered file log
+        runner.logger.close()
+    return results
 
 
 class SimulationRunner:
@@ -30,6 +65,13 @@ class SimulationRunner:
         self.config = None if db_only else load_config(self.config_file)
         self.logger = Logger()
         self.session_id = session_id or uuid.uuid4()
+        # Active application (assigned by the web backend while a scenario runs)
+        self.app: Optional[SimulationApplication] = None
+        # CARLA client shared across scenarios while run_scenarios is active
+        self._shared_client = None
+        self._share_client = False
+        # Data-logging runs: no display window and CARLA server rendering disabled
+        self.headless = False
 
     def setup_logger(self, debug: bool = False) -> None:
         """Setup logger with debug mode"""
@@ -42,22 +84,29 @@ class SimulationRunner:
         ScenarioRegistry.register_all()
 
     def create_application(
-        self, scenario: str, session_id=None
+        self,
+        scenario: str,
+        session_id=None,
+        config_dict: Optional[Dict[str, Any]] = None,
+        client=None,
     ) -> SimulationApplication:
         """Create a new simulation application instance"""
         # If config not yet loaded (DB-only), attempt to load strictly from DB using tenant context
-        if self.config is None:
-            from carla_simulator.utils.paths import get_config_path
-            from carla_simulator.utils.config import load_config
+        if self.config is None and config_dict is None:
             self.config_file = get_config_path()
             # load_config now enforces DB-only and will raise if tenant context/config missing
             self.config = load_config(self.config_file)
-        return SimulationApplication(
+        app = SimulationApplication(
             self.config_file,
             scenario=scenario,
             logger=self.logger,
             session_id=session_id or self.session_id,
+            config_dict=config_dict,
+            client=client,
         )
+        if self.headless:
+            app._config.headless = True
+        return app
 
     def setup_components(self, app: SimulationApplication) -> Dict[str, Any]:
         """Setup simulation components and return them"""
@@ -77,6 +126,7 @@ class SimulationRunner:
             config=app.world_config,
             vehicle_config=app._config.vehicle,
             logger=self.logger,
+            server=(app.connection.config.host, app.connection.config.port),
         )
 
         # Create vehicle first
@@ -84,8 +134,11 @@ class SimulationRunner:
         if not vehicle:
             raise RuntimeError("Failed to create vehicle")
 
-        # Create sensor manager with vehicle
-        sensor_manager = SensorManager(config=app.sensor_config, vehicle=vehicle, world_manager=world_manager)
+        # Create sensor manager with vehicle; headless runs have nothing to show the camera on
+        sensor_config = app.sensor_config
+        if getattr(app._config, "headless", False):
+            sensor_config = replace(sensor_config, camera=replace(sensor_config.camera, enabled=False))
+        sensor_manager = SensorManager(config=sensor_config, vehicle=vehicle, world_manager=world_manager)
 
         # Create controller based on config type
         controller_type = getattr(app.controller_config, "type", "autopilot")
@@ -113,14 +166,10 @@ class SimulationRunner:
             controller = WebGamepadController(app.controller_config, self.logger)
         elif controller_type == "autopilot":
             self.logger.debug("Initializing autopilot controller")
+            # AutopilotController engages autopilot on the world manager's TM port itself
             controller = AutopilotController(
                 vehicle, app.controller_config, app.connection.client, world_manager
             )
-            # Ensure autopilot is engaged and traffic manager in sync
-            try:
-                vehicle.set_autopilot(True, world_manager.get_traffic_manager().get_port())
-            except Exception:
-                pass
         else:
             raise ValueError(f"Unsupported controller type: {controller_type}")
 
@@ -135,23 +184,33 @@ class SimulationRunner:
             "sensor_manager": sensor_manager,
         }
 
-    def run_single_scenario(self, scenario: str) -> tuple[bool, str]:
+    def run_single_scenario(
+        self, scenario: str, config_dict: Optional[Dict[str, Any]] = None
+    ) -> tuple[bool, str]:
         """
         Run a single scenario
 
         Args:
             scenario: Name of the scenario to run
+            config_dict: Optional preloaded raw configuration to reuse
 
         Returns:
             tuple[bool, str]: (success status, result message)
         """
         try:
             # Create application instance for current scenario
-            app = self.create_application(scenario, session_id=self.session_id)
+            app = self.create_application(
+                scenario,
+                session_id=self.session_id,
+                config_dict=config_dict,
+                client=self._shared_client,
+            )
 
-            # Connect to CARLA server
+            # Connect to CARLA server (no-op if the shared client is still alive)
             if not app.connection.connect():
                 return False, "Failed to connect to CARLA server"
+            if self._share_client:
+                self._shared_client = app.connection.client
 
             try:
                 # Setup components
@@ -169,18 +228,15 @@ class SimulationRunner:
                 app.run()
 
                 # Get scenario result from cleanup
-                if hasattr(app, "cleanup"):
-                    completed, success = app.cleanup()
-                    if completed:
-                        message = (
-                            "Scenario completed successfully"
-                            if success
-                            else "Scenario failed to meet success criteria"
-                        )
-                        return success, message
-                    else:
-                        return False, "Scenario did not complete"
-                return True, "Scenario completed"
+                completed, success = app.cleanup()
+                if completed:
+                    message = (
+                        "Scenario completed successfully"
+                        if success
+                        else "Scenario failed to meet success criteria"
+                    )
+                    return success, message
+                return False, "Scenario did not complete"
 
             finally:
                 # Cleanup is handled by app.cleanup()
@@ -198,14 +254,96 @@ class SimulationRunner:
             scenarios: List of scenario names to run
         """
         total_scenarios = len(scenarios)
-        for index, scenario in enumerate(scenarios, 1):
-            self.logger.info(f"================================")
-            self.logger.info(f"Running scenario {index}/{total_scenarios}: {scenario}")
-            self.logger.info(f"================================")
+        # Load the raw configuration once and share it across all scenarios
+        try:
+            config_dict = _load_config_dict(self.config_file)
+        except Exception as e:
+            self.logger.warning(f"Could not preload configuration: {str(e)}")
+            config_dict = None
+
+        # Keep one CARLA client for the whole batch instead of reconnecting per scenario
+        self._share_client = True
+        # Move long-lived startup objects out of the collector's view so the
+        # per-scenario collections below only scan scenario garbage
+        gc.freeze()
+        try:
+            for index, scenario in enumerate(scenarios, 1):
+                self.logger.info(LOG_BANNER)
+                self.logger.info(
+                    "Running scenario %d/%d: %s", index, total_scenarios, scenario
+                )
+                self.logger.info(LOG_BANNER)
 
-            success, message = self.run_single_scenario(scenario)
-            if not success:
-                self.logger.error(f"Scenario {scenario} failed: {message}")
+                success, message = self.run_single_scenario(scenario, config_dict)
+                if not success:
+                    self.logger.error("Scenario %s failed: %s", scenario, message)
+
+                # The application is unreferenced now; reclaim its cycles before the next scenario
+                gc.collect()
+        finally:
+            self._share_client = False
+            self._shared_client = None
+            gc.unfreeze()
+
+    def run_scenarios_parallel(
+        self, scenarios: List[str], workers: int, debug: bool = False
+    ) -> None:
+        """
+        Run scenarios concurrently against several CARLA servers
+
+        Worker ``i`` connects to ``server.port + 2 * i`` (CARLA uses the port
+        and the one after it), so one server must be running per worker.
+
+        Args:
+            scenarios: List of scenario names to run
+            workers: Number of CARLA servers / worker processes to use
+            debug: Whether to enable debug logging in the workers
+        """
+        config_dict = _load_config_dict(self.config_file)
+        base_port = int(config_dict["server"]["port"])
+        tm_port_base = int(os.getenv("CARLA_TM_PORT_BASE", "8000"))
+
+        # Round-robin the scenarios so each worker owns exactly one server
+        workers = min(workers, len(scenarios))
+        batches = [scenarios[i::workers] for i in range(workers)]
+
+        self.logger.info(
+            f"Running {len(scenarios)} scenarios on {workers} CARLA servers "
+            f"(ports {base_port}-{base_port + 2 * (workers - 1)})"
+        )
+
+        # Write out buffered records first; spawned workers start with their own
+        # Logger and DB engine instead of inheriting this process's buffer and pool
+        self.logger.flush()
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures = []
+            for index, batch in enumerate(batches):
+                worker_config = copy.deepcopy(config_dict)
+                worker_config["server"]["port"] = base_port + 2 * index
+                futures.append(
+                    executor.submit(
+                        _run_scenario_batch,
+                        self.config_file,
+                        self.session_id,
+                        batch,
+                        worker_config,
+                        tm_port_base + index,
+                        debug,
+                        self.headless,
+                    )
+                )
+
+            for future in futures:
+                try:
+                    results = future.result()
+                except Exception as e:
+                    self.logger.error(f"Scenario worker failed: {str(e)}")
+                    continue
+                for scenario, success, message in results:
+                    if not success:
+                        self.logger.error(f"Scenario {scenario} failed: {message}")
 
     def run_with_report(self, scenarios: List[str], debug: bool = False) -> None:
         """
@@ -265,8 +403,6 @@ class TestScenario:
 
         try:
             # Run pytest with proper argument handling
-            import sys
-
             # Save original sys.argv
             original_argv = sys.argv.copy()
 
@@ -282,7 +418,9 @@ class TestScenario:
             if debug:
                 sys.argv.append("--log-cli-level=DEBUG")
 
-            # Run pytest
+            # Run pytest (imported here: only report runs need it, not CLI startup)
+            import pytest
+
             pytest.main()
 
         finally:
@@ -318,6 +456,21 @@ class TestScenario:
             help="Enable debug mode for detailed logging",
         )
 
+        parser.add_argument(
+            "--parallel",
+            type=int,
+            default=1,
+            help="Number of scenarios to run concurrently, one CARLA server per "
+            "worker on ports server.port, server.port + 2, ...",
+        )
+
+        parser.add_argument(
+            "--headless",
+            action="store_true",
+            help="Run without a display window and with CARLA server rendering "
+            "disabled (data-logging batch runs)",
+        )
+
         parser.add_argument(
             "--report",
             action="store_true",
@@ -363,11 +516,15 @@ class TestScenario:
 
             # Setup logger
             self.setup_logger(args.debug)
+            self.headless = args.headless
 
             # Log startup configuration
-            self.logger.info(f"Starting CARLA Driving Simulator")
+            self.logger.info("Starting CARLA Driving Simulator")
             self.logger.info(
-                f"Configuration: scenario={args.scenario}, debug={args.debug}"
+                "Configuration: scenario=%s, debug=%s, headless=%s",
+                args.scenario,
+                args.debug,
+                args.headless,
             )
 
             # Determine which scenarios to run
@@ -389,6 +546,10 @@ class TestScenario:
             # Run scenarios with or without report
             if args.report:
                 self.run_with_report(scenarios_to_run, args.debug)
+            elif args.parallel > 1 and len(scenarios_to_run) > 1:
+                self.run_scenarios_parallel(
+                    scenarios_to_run, args.parallel, args.debug
+                )
             else:
                 self.run_scenarios(scenarios_to_run)
 
@@ -4,10 +4,12 @@ Vehicle management system with state tracking.
 
 import carla
 import math
-import numpy as np
 from dataclasses import dataclass
-from typing import Dict, Any, Optional, Tuple, Union
-from ..control.controller import VehicleControl
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    # Annotation only; importing the controller module pulls in pygame
+    from ..control.controller import VehicleControl
 
 
 @dataclass
@@ -71,7 +73,7 @@ class VehicleManager:
         """Set target location for the vehicle"""
         self._target_point = location
 
-    def apply_control(self, control: VehicleControl) -> None:
+    def apply_control(self, control: "VehicleControl") -> None:
         """Apply control input to vehicle"""
         if self.vehicle is None:
             raise RuntimeError("Vehicle not spawned")
@@ -100,15 +102,15 @@ class VehicleManager:
         angular_velocity = self.vehicle.get_angular_velocity()
 
         # Calculate speed and acceleration
-        speed = math.sqrt(velocity.x**2 + velocity.y**2 + velocity.z**2)
+        speed = math.hypot(velocity.x, velocity.y, velocity.z)
         acceleration = self.vehicle.get_acceleration()
-        acceleration_magnitude = math.sqrt(
-            acceleration.x**2 + acceleration.y**2 + acceleration.z**2
+        acceleration_magnitude = math.hypot(
+            acceleration.x, acceleration.y, acceleration.z
         )
 
         # Calculate angular velocity magnitude
-        angular_velocity_magnitude = math.sqrt(
-            angular_velocity.x**2 + angular_velocity.y**2 + angular_velocity.z**2
+        angular_velocity_magnitude = math.hypot(
+            angular_velocity.x, angular_velocity.y, angular_velocity.z
         )
 
         # Update target-related information if target exists
@@ -118,10 +120,10 @@ class VehicleManager:
 
         if self._target_point is not None:
             # Calculate distance to target
-            distance_to_target = math.sqrt(
-                (transform.location.x - self._target_point.x) ** 2
-                + (transform.location.y - self._target_point.y) ** 2
-                + (transform.location.z - self._target_point.z) ** 2
+            distance_to_target = math.hypot(
+                transform.location.x - self._target_point.x,
+                transform.location.y - self._target_point.y,
+                transform.location.z - self._target_point.z,
             )
 
             # Calculate heading to target
@@ -168,9 +170,10 @@ class VehicleManager:
         """Reset vehicle to initial state"""
         if self.vehicle is not None:
             self.vehicle.set_transform(self._spawn_point)
-            self.vehicle.set_velocity(carla.Vector3D())
-            self.vehicle.set_angular_velocity(carla.Vector3D())
-            self.vehicle.set_target_velocity(carla.Vector3D())
+            zero = carla.Vector3D()
+            self.vehicle.set_velocity(zero)
+            self.vehicle.set_angular_velocity(zero)
+            self.vehicle.set_target_velocity(zero)
 
             # Reset state
             self._state = VehicleState(
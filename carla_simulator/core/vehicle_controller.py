@@ -111,12 +111,13 @@ class VehicleController(IVehicleController):
             return {}
 
         velocity = self.vehicle.get_velocity()
-        speed = math.sqrt(velocity.x**2 + velocity.y**2 + velocity.z**2)
+        speed = math.hypot(velocity.x, velocity.y, velocity.z)
+        transform = self.vehicle.get_transform()
 
         return {
             "speed": speed,
-            "location": self.vehicle.get_location(),
-            "rotation": self.vehicle.get_transform().rotation,
+            "location": transform.location,
+            "rotation": transform.rotation,
             "acceleration": self.vehicle.get_acceleration(),
             "angular_velocity": self.vehicle.get_angular_velocity(),
         }
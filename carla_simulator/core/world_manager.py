@@ -2,12 +2,14 @@
 World management system for CARLA simulation.
 """
 
+import os
 import carla
 import random
 import math
 import time
 import logging
-from typing import List, Optional, Dict, Any
+import numpy as np
+from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 from ..utils.logging import Logger, CURRENT_TENANT_ID
 from ..utils.config import WorldConfig, VehicleConfig
@@ -17,6 +19,14 @@ from ..utils.default_config import SIMULATION_CONFIG
 # Get logger instance
 logger = Logger()
 
+# Static data of the last world set up per CARLA server, keyed by (host, port):
+# (world id, map, spawn points, blueprint library). Scenario batches reuse one world,
+# so later scenarios skip the map download/parse and library fetch.
+_WORLD_STATIC_CACHE: Dict[Tuple[str, int], Tuple[int, Any, List[Any], Any]] = {}
+
+# Minimum interval between weather reads from the server
+_WEATHER_REFRESH_NS = 500_000_000
+
 
 @dataclass
 class TargetPoint:
@@ -36,13 +46,21 @@ class WorldManager(IWorldManager):
         config: WorldConfig,
         vehicle_config: VehicleConfig,
         logger: Logger,
+        server: Optional[Tuple[str, int]] = None,
     ):
-        """Initialize the world manager"""
+        """Initialize the world manager
+
+        Args:
+            server: (host, port) the client is connected to; when given, world static
+                data is shared with later managers on the same server and world
+        """
         self.client = client
+        self.server = server
         self.config = config
         self.vehicle_config = vehicle_config
         self.logger = logger
         self.world = None
+        self._map: Optional[carla.Map] = None  # Cached OpenDRIVE map (fetching it is a full RPC + parse)
         self.vehicle = None
         self.blueprint_library = None
         self.spawn_points = []
@@ -50,9 +68,15 @@ class WorldManager(IWorldManager):
         self._traffic_actors: List[carla.Actor] = []
         self._scenario_actors: List[carla.Actor] = []  # Track scenario-specific actors
         self._sensor_actors: List[carla.Actor] = []  # Track sensor actors
+        # Driving-lane waypoint grids of this manager's map, keyed by spacing
+        self._waypoint_grids: Dict[float, Tuple[np.ndarray, List[carla.Waypoint]]] = {}
+        # Weather changes on second scales; serve repeat reads from a short-lived copy
+        self._weather_cache: Optional[Dict[str, float]] = None
+        self._weather_last_ns = 0
         self.traffic_manager = None
         # Default Traffic Manager port aligns with CARLA default; can be overridden per-tenant
-        self.traffic_manager_port = 8000
+        # or per-process through CARLA_TM_PORT_BASE
+        self.traffic_manager_port = int(os.getenv("CARLA_TM_PORT_BASE", "8000"))
         self.max_reconnect_attempts = 3
         self.reconnect_delay = 2.0  # seconds
 
@@ -106,6 +130,7 @@ class WorldManager(IWorldManager):
 
                 # Try to get the world
                 self.world = self.client.get_world()
+                self._map = None
                 if self.world is not None:
                     self.logger.info("Successfully reconnected to CARLA server")
                     return True
@@ -125,6 +150,7 @@ class WorldManager(IWorldManager):
         try:
             self.client.set_timeout(2.0)
             self.world = self.client.get_world()
+            self._map = None
             if self.world is None:
                 self.logger.error("Failed to get world from CARLA server")
                 return False
@@ -154,6 +180,7 @@ class WorldManager(IWorldManager):
             if self.client:
                 self.client = None
                 self.world = None
+                self._map = None
                 self.logger.info("Disconnected from CARLA server")
         except Exception as e:
             self.logger.error("Error disconnecting from CARLA server", exc_info=e)
@@ -166,11 +193,51 @@ class WorldManager(IWorldManager):
         return self.world
 
     def get_map(self) -> carla.Map:
-        """Get the current map"""
+        """Get the current map (fetched from the server once and cached)"""
         if not self.world:
             self.logger.error("Not connected to CARLA server")
             raise RuntimeError("Not connected to CARLA server")
-        return self.world.get_map()
+        if self._map is None:
+            self._map = self.world.get_map()
+        return self._map
+
+    @property
+    def map(self) -> carla.Map:
+        """Cached carla.Map; the server is asked for the OpenDRIVE map only once"""
+        return self.get_map()
+
+    def get_waypoint_grid(
+        self, spacing: float = 2.0
+    ) -> Tuple[np.ndarray, List[carla.Waypoint]]:
+        """Get all driving-lane waypoints of the map as (Nx3 xyz array, waypoints)
+
+        Built with a single generate_waypoints() call the first time a spacing is used.
+        """
+        grid = self._waypoint_grids.get(spacing)
+        if grid is None:
+            waypoints = self.get_map().generate_waypoints(spacing)
+            xyz = np.array(
+                [
+                    (w.transform.location.x, w.transform.location.y, w.transform.location.z)
+                    for w in waypoints
+                ],
+                dtype=np.float64,
+            ).reshape(-1, 3)
+            grid = (xyz, waypoints)
+            self._waypoint_grids[spacing] = grid
+        return grid
+
+    def get_nearest_waypoint(self, x: float, y: float, z: float) -> Optional[carla.Waypoint]:
+        """Snap a point to the nearest pre-sampled driving-lane waypoint
+
+        z takes part in the distance so points on bridges and overpasses snap to
+        the road level they are on, not the one stacked above or below it.
+        """
+        xyz, waypoints = self.get_waypoint_grid()
+        if not waypoints:
+            return None
+        delta = xyz - (x, y, z)
+        return waypoints[int(np.argmin(np.einsum("ij,ij->i", delta, delta)))]
 
     def spawn_actor(
         self, blueprint: carla.ActorBlueprint, transform: carla.Transform
@@ -189,25 +256,35 @@ class WorldManager(IWorldManager):
             # Get the world
             self.world = self.client.get_world()
 
-            # Apply synchronous/asynchronous mode based on config
+            # Apply synchronous/asynchronous mode based on config, skipping the
+            # round-trip when a previous scenario already left the world configured
             settings = self.world.get_settings()
-            if self.synchronous_mode:
-                settings.synchronous_mode = True
-                settings.fixed_delta_seconds = self.fixed_delta_seconds
-            else:
-                settings.synchronous_mode = False
+            fixed_delta = self.fixed_delta_seconds if self.synchronous_mode else None
+            if (
+                settings.synchronous_mode != self.synchronous_mode
+                or settings.fixed_delta_seconds != fixed_delta
+            ):
+                settings.synchronous_mode = self.synchronous_mode
                 try:
-                    # Clear fixed delta to let server drive real-time when async
-                    settings.fixed_delta_seconds = None
+                    # A None fixed delta lets the server drive real-time when async
+                    settings.fixed_delta_seconds = fixed_delta
                 except Exception:
                     pass
-            self.world.apply_settings(settings)
-
-            # Get blueprint library
-            self.blueprint_library = self.world.get_blueprint_library()
+                self.world.apply_settings(settings)
 
-            # Get spawn points
-            self.spawn_points = self.world.get_map().get_spawn_points()
+            # Reuse the map, spawn points and blueprint library if this is the same world
+            world_id = self.world.id
+            cached = _WORLD_STATIC_CACHE.get(self.server) if self.server else None
+            if cached is not None and cached[0] == world_id:
+                _, self._map, self.spawn_points, self.blueprint_library = cached
+            else:
+                self.blueprint_library = self.world.get_blueprint_library()
+                self._map = self.world.get_map()
+                self.spawn_points = self._map.get_spawn_points()
+                if self.server:
+                    _WORLD_STATIC_CACHE[self.server] = (
+                        world_id, self._map, self.spawn_points, self.blueprint_library
+                    )
 
             self.logger.info("World setup completed successfully")
 
@@ -235,11 +312,18 @@ class WorldManager(IWorldManager):
             Optional[carla.Actor]: Spawned actor if successful, None otherwise
         """
         # Get all available spawn points
-        spawn_points = self.world.get_map().get_spawn_points()
+        spawn_points = self.spawn_points
         if not spawn_points:
             self.logger.error("No spawn points available in the map")
             return None
 
+        # Fallback spawn points: k distinct picks instead of a rejection loop per
+        # retry, drawn lazily so a first-attempt spawn never touches the RNG
+        def _draw_fallback_points():
+            yield from random.sample(spawn_points, min(max_attempts, len(spawn_points)))
+
+        fallback_points = _draw_fallback_points()
+
         # Try initial spawn point first
         for attempt in range(max_attempts):
             try:
@@ -254,13 +338,13 @@ class WorldManager(IWorldManager):
                     self.logger.debug(f"[{spawn_id}] Actor type_id: {actor.type_id}")
                     
                     # CRITICAL FIX: Tick the world immediately after spawning in synchronous mode
-                    # This ensures the actor is properly registered before checking is_alive
+                    # This ensures the actor is properly registered before checking is_alive.
+                    # A synchronous tick only returns once the server has processed the frame,
+                    # so this single tick is the whole spawn handshake.
                     if self.synchronous_mode:
                         try:
                             self.world.tick()
                             self.logger.debug(f"[{spawn_id}] World ticked immediately after spawn")
-                            # Small delay to ensure CARLA processes the spawn
-                            time.sleep(0.1)
                         except Exception as e:
                             self.logger.warning(f"[{spawn_id}] Error ticking world after spawn: {str(e)}")
                     
@@ -270,23 +354,6 @@ class WorldManager(IWorldManager):
                         self.logger.debug(
                             f"[{spawn_id}] {actor.type_id} spawned successfully at {spawn_point.location} on attempt {attempt + 1}"
                         )
-                        
-                        # Additional tick to ensure everything is stable
-                        try:
-                            self.world.tick()
-                            self.logger.debug(f"[{spawn_id}] World ticked after successful spawn verification")
-                        except Exception as e:
-                            self.logger.warning(f"[{spawn_id}] Error ticking world after spawn verification: {str(e)}")
-                        
-                        # Final check that actor is still alive after additional tick
-                        if not actor.is_alive:
-                            self.logger.warning(f"[{spawn_id}] Actor not alive after final tick, destroying and retrying")
-                            try:
-                                actor.destroy()
-                            except Exception as destroy_error:
-                                self.logger.warning(f"[{spawn_id}] Error destroying actor: {str(destroy_error)}")
-                            continue
-                        
                         return actor
                     else:
                         self.logger.warning(f"[{spawn_id}] Actor spawned but not alive, destroying and retrying")
@@ -300,21 +367,21 @@ class WorldManager(IWorldManager):
                 # If spawn failed, try a different spawn point
                 if attempt < max_attempts - 1:
                     # Get a random spawn point different from the current one
-                    new_spawn_point = random.choice(spawn_points)
-                    while (
-                        new_spawn_point.location == spawn_point.location
-                        and len(spawn_points) > 1
-                    ):
-                        new_spawn_point = random.choice(spawn_points)
-
-                    # Adjust spawn point slightly to avoid collisions
-                    new_spawn_point.location.x += random.uniform(-2.0, 2.0)
-                    new_spawn_point.location.y += random.uniform(-2.0, 2.0)
-                    new_spawn_point.location.z += (
-                        0.5  # Lift slightly to avoid ground collision
+                    new_spawn_point = next(fallback_points, None) or random.choice(spawn_points)
+                    if new_spawn_point.location == spawn_point.location:
+                        new_spawn_point = next(fallback_points, new_spawn_point)
+
+                    # Adjust a copy slightly to avoid collisions; the cached spawn
+                    # points are shared and must not drift between retries
+                    location = new_spawn_point.location
+                    spawn_point = carla.Transform(
+                        carla.Location(
+                            location.x + random.uniform(-2.0, 2.0),
+                            location.y + random.uniform(-2.0, 2.0),
+                            location.z + 0.5,  # Lift slightly to avoid ground collision
+                        ),
+                        new_spawn_point.rotation,
                     )
-
-                    spawn_point = new_spawn_point
                     self.logger.info(
                         f"[{spawn_id}] Trying new spawn point at {spawn_point.location}"
                     )
@@ -325,7 +392,7 @@ class WorldManager(IWorldManager):
                 self.logger.debug(f"[{spawn_id}] Exception type: {type(e).__name__}")
                 if attempt < max_attempts - 1:
                     # Try a different spawn point on next attempt
-                    spawn_point = random.choice(spawn_points)
+                    spawn_point = next(fallback_points, None) or random.choice(spawn_points)
                     time.sleep(1.0)  # Increased wait time for synchronous mode
                 continue
 
@@ -407,27 +474,11 @@ class WorldManager(IWorldManager):
                 self.logger.debug(f"Vehicle object: {self.vehicle}")
                 self.logger.debug(f"Vehicle is_alive: {self.vehicle.is_alive}")
 
-                # Tick the world to ensure the vehicle is properly registered
-                try:
-                    self.world.tick()
-                    self.logger.debug("World ticked after vehicle spawn")
-                except Exception as e:
-                    self.logger.warning(f"Error ticking world after spawn: {str(e)}")
-
-                # Double-check vehicle is still alive after tick
-                if not self.vehicle.is_alive:
-                    self.logger.error("Vehicle is not alive after world tick")
-                    return None
-
-                # Apply physics control after spawning
+                # _spawn_with_retry already ticked and confirmed the actor; the final
+                # tick below registers the physics control and attributes together
                 try:
                     self.vehicle.apply_physics_control(physics_control)
                     self.logger.debug("Physics control applied successfully")
-                    
-                    # Tick again after applying physics control
-                    self.world.tick()
-                    self.logger.debug("World ticked after physics control")
-                    
                 except Exception as e:
                     self.logger.error(f"Error applying physics control: {str(e)}")
                     # Don't destroy the vehicle, just log the error
@@ -494,11 +545,12 @@ class WorldManager(IWorldManager):
         if not self.vehicle:
             return {}
 
+        transform = self.vehicle.get_transform()
         return {
-            "location": self.vehicle.get_location(),
+            "location": transform.location,
             "velocity": self.vehicle.get_velocity(),
             "acceleration": self.vehicle.get_acceleration(),
-            "transform": self.vehicle.get_transform(),
+            "transform": transform,
         }
 
     def apply_control(self, control: carla.VehicleControl) -> None:
@@ -506,10 +558,24 @@ class WorldManager(IWorldManager):
         if self.vehicle:
             self.vehicle.apply_control(control)
 
+    def set_rendering_enabled(self, enabled: bool) -> None:
+        """Toggle server-side rendering (no_rendering_mode) for data-only runs"""
+        settings = self.world.get_settings()
+        if settings.no_rendering_mode == (not enabled):
+            return
+        settings.no_rendering_mode = not enabled
+        self.world.apply_settings(settings)
+
     def get_weather_parameters(self) -> Dict[str, float]:
-        """Get current weather parameters"""
+        """Get current weather parameters, refreshed from the server at most every 0.5 s"""
+        now_ns = time.monotonic_ns()
+        if (
+            self._weather_cache is not None
+            and now_ns - self._weather_last_ns < _WEATHER_REFRESH_NS
+        ):
+            return dict(self._weather_cache)
         weather = self.world.get_weather()
-        return {
+        self._weather_cache = {
             "cloudiness": weather.cloudiness,
             "precipitation": weather.precipitation,
             "precipitation_deposits": weather.precipitation_deposits,
@@ -521,6 +587,8 @@ class WorldManager(IWorldManager):
             "wetness": weather.wetness,
             "fog_falloff": weather.fog_falloff,
         }
+        self._weather_last_ns = now_ns
+        return dict(self._weather_cache)
 
     def get_traffic_actors(self) -> List[carla.Actor]:
         """Get list of all traffic actors in the world"""
@@ -535,7 +603,6 @@ class WorldManager(IWorldManager):
         port_to_use = tm_port or self.traffic_manager_port
         try:
             # Allow base to be configured; default to 8000
-            import os
             base = int(os.getenv("CARLA_TM_PORT_BASE", "8000"))
             # If tenant context is bound, derive a stable per-tenant port offset
             tenant_id = None
@@ -562,21 +629,53 @@ class WorldManager(IWorldManager):
         self.traffic_manager.global_percentage_speed_difference(15.0)
         self.traffic_manager.set_random_device_seed(0)
 
-        # Spawn traffic vehicles
-        for i in range(self.config.num_vehicles):
-            transform = random.choice(self.world.get_map().get_spawn_points())
-            bp = random.choice(self.world.get_blueprint_library().filter("vehicle.*"))
+        # Spawn traffic vehicles (resolve the vehicle blueprints once, not per vehicle)
+        vehicle_blueprints = self.blueprint_library.filter("vehicle.*")
+        specs = [
+            (random.choice(vehicle_blueprints), random.choice(self.spawn_points))
+            for _ in range(self.config.num_vehicles)
+        ]
+        if not specs:
+            return
+
+        # Spawn every NPC and hand it to the Traffic Manager in one batched RPC (TM
+        # sync mode is already set above); only the batch's failures are retried
+        SpawnActor = carla.command.SpawnActor
+        SetAutopilot = carla.command.SetAutopilot
+        FutureActor = carla.command.FutureActor
+        port = self.traffic_manager_port
+        responses = self.client.apply_batch_sync(
+            [
+                SpawnActor(bp, transform).then(SetAutopilot(FutureActor, True, port))
+                for bp, transform in specs
+            ],
+            self.synchronous_mode,
+        )
+        spawned_ids = [response.actor_id for response in responses if not response.error]
+        spawned: List[carla.Actor] = list(self.world.get_actors(spawned_ids)) if spawned_ids else []
 
+        retried: List[carla.Actor] = []
+        for i, response in enumerate(responses):
+            if not response.error:
+                continue
+            bp, transform = specs[i]
             npc = self._spawn_with_retry(bp, transform, spawn_id=f"traffic_vehicle_{i}")
             if npc is not None:
-                npc.set_autopilot(True, self.traffic_manager_port)
-                self.traffic_manager.ignore_lights_percentage(npc, 0)
-                self.traffic_manager.vehicle_percentage_speed_difference(
-                    npc, random.uniform(-10, 10)
-                )
-                self._traffic_actors.append(npc)
-                # Tick the world to ensure proper spawning
-                self.world.tick()
+                retried.append(npc)
+        if retried:
+            self.client.apply_batch_sync(
+                [SetAutopilot(npc.id, True, port) for npc in retried],
+                self.synchronous_mode,
+            )
+            spawned.extend(retried)
+
+        self._traffic_actors.extend(spawned)
+        # The per-vehicle TM knobs have no batch command
+        for npc in spawned:
+            self.traffic_manager.ignore_lights_percentage(npc, 0)
+            self.traffic_manager.vehicle_percentage_speed_difference(
+                npc, random.uniform(-10, 10)
+            )
 
     def get_traffic_manager(self) -> Optional[carla.TrafficManager]:
         """Get the traffic manager instance"""
@@ -601,7 +700,9 @@ class WorldManager(IWorldManager):
 
         # Calculate random X and Y components
         target_dist_x = random.randint(1, 4) * target_dist / 5
-        target_dist_y = math.sqrt(target_dist**2 - target_dist_x**2)
+        target_dist_y = math.sqrt(
+            (target_dist - target_dist_x) * (target_dist + target_dist_x)
+        )
 
         # Randomize direction
         if random.random() < 0.5:
@@ -614,7 +715,7 @@ class WorldManager(IWorldManager):
         target_y = spawn_point.location.y + target_dist_y
 
         # Get closest waypoint
-        waypoint = self.world.get_map().get_waypoint(
+        waypoint = self.get_map().get_waypoint(
             carla.Location(target_x, target_y, spawn_point.location.z)
         )
 
@@ -625,11 +726,9 @@ class WorldManager(IWorldManager):
 
         # Spawn target markers
         target_actors = []
+        target_bp = self.blueprint_library.find("static.prop.trafficcone01")
+        target_bp.set_attribute("role_name", "target")
         for i in range(15):
-            target_bp = self.world.get_blueprint_library().find(
-                "static.prop.trafficcone01"
-            )
-            target_bp.set_attribute("role_name", "target")
             target_loc = carla.Location(
                 waypoint.transform.location.x,
                 waypoint.transform.location.y,
@@ -650,7 +749,7 @@ class WorldManager(IWorldManager):
 
     def get_random_spawn_point(self) -> carla.Transform:
         """Get a random spawn point from the map"""
-        return random.choice(self.world.get_map().get_spawn_points())
+        return random.choice(self.spawn_points)
 
     def spawn_scenario_actor(
         self,
@@ -686,6 +785,50 @@ class WorldManager(IWorldManager):
             self.logger.error(f"Error spawning scenario actor {blueprint_id}: {str(e)}")
             return None
 
+    def spawn_scenario_actors(
+        self, specs: List[Tuple[str, carla.Transform, str]]
+    ) -> List[Tuple[Optional[carla.Actor], bool]]:
+        """Spawn several scenario actors in one batched RPC
+
+        Args:
+            specs: (blueprint id, transform, actor type) per actor
+
+        Returns:
+            List[Tuple[Optional[carla.Actor], bool]]: (actor, batched) in spec order.
+            Batched actors stand exactly at their requested transform; entries the
+            batch could not place fall back to spawn_scenario_actor's retry logic,
+            which may move them to another spawn point
+        """
+        actors: List[Optional[carla.Actor]] = [None] * len(specs)
+        try:
+            commands = [
+                carla.command.SpawnActor(self.blueprint_library.find(blueprint_id), transform)
+                for blueprint_id, transform, _ in specs
+            ]
+            responses = self.client.apply_batch_sync(commands, self.synchronous_mode)
+            spawned_ids = [
+                response.actor_id if not response.error else None for response in responses
+            ]
+            found = {
+                actor.id: actor
+                for actor in self.world.get_actors([i for i in spawned_ids if i is not None])
+            }
+            for index, actor_id in enumerate(spawned_ids):
+                actor = found.get(actor_id)
+                if actor is not None:
+                    self._scenario_actors.append(actor)
+                    actors[index] = actor
+        except Exception as e:
+            self.logger.warning(f"Batched spawn failed, spawning individually: {str(e)}")
+
+        batched = [actor is not None for actor in actors]
+        for index, (blueprint_id, transform, actor_type) in enumerate(specs):
+            if actors[index] is None:
+                actors[index] = self.spawn_scenario_actor(
+                    blueprint_id, transform, actor_type=actor_type
+                )
+        return list(zip(actors, batched))
+
     def track_sensor_actor(self, sensor_actor: carla.Actor) -> None:
         """Track a sensor actor for cleanup"""
         if sensor_actor:
@@ -10,7 +10,7 @@ from uuid import UUID
 from carla_simulator.utils.types import SimulationData
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationMetricsData:
     """Data structure for simulation metrics that can be logged"""
 
@@ -1,12 +1,17 @@
 import carla
 import math
-import random
 import time
-from typing import Optional, List, Dict, Any
-from carla_simulator.scenarios.base_scenario import BaseScenario
+import numpy as np
+from typing import Optional, List, Dict, Any, Tuple
+from carla_simulator.scenarios.base_scenario import BaseScenario, _EMERGENCY_BRAKE
 from carla_simulator.core.interfaces import IWorldManager, IVehicleController, ILogger
 
 
+# Obstacle placements relative to the ego spawn location (x, y, z), in spawn order
+_OBSTACLE_OFFSETS = np.array([(10.0, 2.0, 0.0), (15.0, -2.0, 0.0)])
+_OBSTACLE_BLUEPRINT = "static.prop.trafficcone01"
+
+
 class AvoidObstacleScenario(BaseScenario):
     """Scenario where vehicle must avoid multiple static obstacles in its path"""
 
@@ -25,7 +30,9 @@ class AvoidObstacleScenario(BaseScenario):
         self.completion_distance = config.get("completion_distance", 110.0)
         self.collision_threshold = config.get("collision_threshold", 1.0)
         self.max_simulation_time = config.get("max_simulation_time", 120.0)
+        self._sim_time_limit_ns = int(self.max_simulation_time * 1e9)
         self.waypoint_tolerance = config.get("waypoint_tolerance", 5.0)
+        self._waypoint_tolerance_sq = self.waypoint_tolerance ** 2
         self.min_waypoint_distance = config.get("min_waypoint_distance", 30.0)
         self.max_waypoint_distance = config.get("max_waypoint_distance", 50.0)
         self.num_waypoints = config.get("num_waypoints", 3)
@@ -37,19 +44,43 @@ class AvoidObstacleScenario(BaseScenario):
 
         # Scenario state
         self.obstacles: List[carla.Actor] = []
+        # Obstacle positions (N x 3), read once since the obstacles are static props
+        self._obstacle_xyz = np.empty((0, 3))
+        self._obstacle_ids: List[int] = []
         self.waypoints: List[carla.Location] = []
+        self._waypoint_xyz: List[Tuple[float, float, float]] = []
+        # Obstacle rows followed by waypoint rows, so one pass gives every per-tick distance
+        self._points_xyz = np.empty((0, 3))
         self.current_waypoint = 0
         self._name = "Avoid Obstacle"
+        # Scratch control reused by apply_speed_control every tick
+        self._speed_control = carla.VehicleControl()
         self.scenario_started = False
         self._current_loc = (
             carla.Location()
         )  # Pre-allocate location for distance calculations
-        self.start_time = 0.0
+        self.start_time = 0  # time.monotonic_ns() at setup
         self.obstacle_detection_range = 30.0  # Increased detection range
         self.avoidance_angle = 90.0  # Increased avoidance angle
+        # Candidate avoidance rotations are fixed, so their trigonometry is done once
+        avoidance_angles = np.radians(
+            [
+                -self.avoidance_angle,
+                self.avoidance_angle,
+                -self.avoidance_angle / 2,
+                self.avoidance_angle / 2,
+            ]
+        )
+        self._avoidance_cos = np.cos(avoidance_angles)
+        self._avoidance_sin = np.sin(avoidance_angles)
         self.avoidance_distance = 15.0  # Distance to move away from obstacle
         self.current_avoidance_target = None  # Current avoidance target
         self.emergency_brake_distance = 10.0  # Distance to trigger emergency brake
+        # Squared radii for the per-tick proximity test (sqrt only for logged values)
+        self._detection_range_sq = self.obstacle_detection_range ** 2
+        self._terminal_distance_sq = (
+            max(self.emergency_brake_distance, self.collision_threshold) ** 2
+        )
         self.normal_speed = 30.0  # Normal speed in km/h
         self.avoidance_speed = 10.0  # Speed during avoidance in km/h
         self.logged_obstacles = set()  # Track which obstacles we've logged about
@@ -66,7 +97,7 @@ class AvoidObstacleScenario(BaseScenario):
         """Check if the location is within road boundaries"""
         try:
             # Get the waypoint at the current location
-            waypoint = self.world_manager.get_map().get_waypoint(location)
+            waypoint = self.carla_map.get_waypoint(location)
             if not waypoint:
                 return False
 
@@ -106,7 +137,7 @@ class AvoidObstacleScenario(BaseScenario):
                 throttle = 0.0
                 brake = min(0.7, abs(speed_diff) / 10.0)
 
-            control = carla.VehicleControl()
+            control = self._speed_control
             control.throttle = throttle
             control.brake = brake
             self.vehicle.apply_control(control)
@@ -114,44 +145,39 @@ class AvoidObstacleScenario(BaseScenario):
             self.logger.error(f"Error applying speed control: {str(e)}")
 
     def find_alternative_path(
-        self, current_loc: carla.Location, target_loc: carla.Location
+        self,
+        current_loc: carla.Location,
+        target_loc: carla.Location,
+        vehicle_transform: Optional[carla.Transform] = None,
     ) -> Optional[carla.Location]:
-        """Find an alternative path around obstacles"""
+        """Find an alternative path around obstacles
+
+        ``vehicle_transform`` is the ego transform already read this tick, if any.
+        """
         try:
             # Get current waypoint
-            current_waypoint = self.world_manager.get_map().get_waypoint(current_loc)
+            carla_map = self.carla_map
+            current_waypoint = carla_map.get_waypoint(current_loc)
             if not current_waypoint:
                 return None
 
             # Get vehicle's forward direction
-            vehicle_transform = self.vehicle.get_transform()
+            if vehicle_transform is None:
+                vehicle_transform = self.vehicle.get_transform()
             forward_vector = vehicle_transform.get_forward_vector()
+            fx, fy = forward_vector.x, forward_vector.y
 
-            # Try multiple angles for avoidance
-            angles = [
-                -self.avoidance_angle,
-                self.avoidance_angle,
-                -self.avoidance_angle / 2,
-                self.avoidance_angle / 2,
-            ]
+            # Try multiple angles for avoidance: rotate the forward direction by every
+            # candidate angle at once and only build carla.Locations for the lookups
+            cos_a, sin_a = self._avoidance_cos, self._avoidance_sin
+            alt_xs = (current_loc.x + self.avoidance_distance * (fx * cos_a - fy * sin_a)).tolist()
+            alt_ys = (current_loc.y + self.avoidance_distance * (fx * sin_a + fy * cos_a)).tolist()
             best_alt_waypoint = None
             max_clear_distance = 0.0
 
-            for angle in angles:
-                # Calculate avoidance point
-                alt_angle = math.radians(angle)
-                # Use vehicle's forward direction as reference
-                alt_x = current_loc.x + self.avoidance_distance * (
-                    forward_vector.x * math.cos(alt_angle)
-                    - forward_vector.y * math.sin(alt_angle)
-                )
-                alt_y = current_loc.y + self.avoidance_distance * (
-                    forward_vector.x * math.sin(alt_angle)
-                    + forward_vector.y * math.cos(alt_angle)
-                )
-
+            for alt_x, alt_y in zip(alt_xs, alt_ys):
                 # Get valid waypoint for alternative path
-                alt_waypoint = self.world_manager.get_map().get_waypoint(
+                alt_waypoint = carla_map.get_waypoint(
                     carla.Location(x=alt_x, y=alt_y, z=current_loc.z),
                     project_to_road=True,
                 )
@@ -161,11 +187,11 @@ class AvoidObstacleScenario(BaseScenario):
                     if not self.check_road_boundaries(alt_waypoint.transform.location):
                         continue
 
-                    min_obstacle_distance = float("inf")
-                    for obstacle in self.obstacles:
-                        obstacle_loc = obstacle.get_location()
-                        dist = alt_waypoint.transform.location.distance(obstacle_loc)
-                        min_obstacle_distance = min(min_obstacle_distance, dist)
+                    min_obstacle_distance = float(
+                        self._obstacle_distances(alt_waypoint.transform.location).min(
+                            initial=float("inf")
+                        )
+                    )
 
                     # If this path is clearer than previous best, use it
                     if min_obstacle_distance > max_clear_distance:
@@ -185,50 +211,9 @@ class AvoidObstacleScenario(BaseScenario):
 
     def _generate_waypoints(self) -> None:
         """Generate waypoints for the route"""
-        try:
-            # Get current map
-            world = self.world_manager.get_world()
-            map = world.get_map()
-
-            # Get spawn points
-            spawn_points = map.get_spawn_points()
-            if not spawn_points:
-                self.logger.error("No spawn points found in map")
-                return
-
-            # Generate waypoints
-            current_point = spawn_points[0]
-            self.waypoints = []
-
-            for _ in range(self.num_waypoints):
-                # Calculate next point
-                distance = random.uniform(
-                    self.min_waypoint_distance, self.max_waypoint_distance
-                )
-                angle = random.uniform(-math.pi / 4, math.pi / 4)
-
-                # Get valid waypoint on road
-                waypoint = map.get_waypoint(
-                    carla.Location(
-                        current_point.location.x + distance * math.cos(angle),
-                        current_point.location.y + distance * math.sin(angle),
-                        current_point.location.z,
-                    )
-                )
-
-                if waypoint:
-                    self.waypoints.append(waypoint.transform.location)
-                    current_point = waypoint.transform
-                    self.logger.debug(f"Added waypoint at {current_point.location}")
-
-            if not self.waypoints:
-                self.logger.error("Failed to generate valid waypoints")
-                return
-
-            self.logger.debug(f"Generated {len(self.waypoints)} waypoints")
-
-        except Exception as e:
-            self.logger.error("Error generating waypoints", exc_info=e)
+        self._generate_forward_route(
+            self.num_waypoints, self.min_waypoint_distance, self.max_waypoint_distance
+        )
 
     def setup(self) -> None:
         """Setup scenario"""
@@ -241,42 +226,53 @@ class AvoidObstacleScenario(BaseScenario):
                 self.logger.error("Failed to generate waypoints")
                 return
 
-            # Get world reference
-            world = self.world_manager.world
-
-            # Spawn obstacles
+            # Place every obstacle in one array op, then spawn them in a single batched call
             spawn_transform = self.vehicle.get_transform()
-
-            # Spawn first obstacle
-            spawn_transform.location.x += 10.0
-            spawn_transform.location.y += 2.0
-            obstacle1 = self.world_manager.spawn_scenario_actor(
-                "static.prop.trafficcone01", spawn_transform, actor_type="obstacle1"
+            location = spawn_transform.location
+            rotation = spawn_transform.rotation
+            positions = (_OBSTACLE_OFFSETS + (location.x, location.y, location.z)).tolist()
+            spawned = self.world_manager.spawn_scenario_actors(
+                [
+                    (
+                        _OBSTACLE_BLUEPRINT,
+                        carla.Transform(carla.Location(*position), rotation),
+                        f"obstacle{index}",
+                    )
+                    for index, position in enumerate(positions, start=1)
+                ]
             )
+            (obstacle1, _), (obstacle2, _) = spawned
 
             if not obstacle1:
                 self.logger.error("Failed to spawn first obstacle")
                 return
 
-            # Spawn second obstacle
-            spawn_transform.location.x += 5.0
-            spawn_transform.location.y -= 4.0
-            obstacle2 = self.world_manager.spawn_scenario_actor(
-                "static.prop.trafficcone01", spawn_transform, actor_type="obstacle2"
-            )
-
             if not obstacle2:
                 self.logger.error("Failed to spawn second obstacle")
                 return
 
             # Add obstacles to list
-            self.obstacles = [obstacle1, obstacle2]
-            self.logger.debug(
-                f"Spawned obstacles at locations {spawn_transform.location}"
-            )
+            # Obstacles are static: check liveness and read ids once instead of every tick.
+            # Batched obstacles stand at their computed positions; only the fallback path
+            # may have moved one, and an asynchronous world reports (0, 0, 0) until the
+            # next tick anyway
+            self.obstacles = []
+            obstacle_xyz = []
+            for (obstacle, batched), position in zip(spawned, positions):
+                if not obstacle.is_alive:
+                    continue
+                self.obstacles.append(obstacle)
+                if not batched:
+                    loc = obstacle.get_location()
+                    position = (loc.x, loc.y, loc.z)
+                obstacle_xyz.append(position)
+            self._obstacle_ids = [obstacle.id for obstacle in self.obstacles]
+            self._obstacle_xyz = np.array(obstacle_xyz, dtype=np.float64).reshape(-1, 3)
+            self._stack_points()
+            self.logger.debug(f"Spawned obstacles at locations {self._obstacle_xyz.tolist()}")
 
             # Initialize scenario state
-            self.start_time = time.time()
+            self.start_time = time.monotonic_ns()
             self.scenario_started = False
             self.emergency_brake_active = False
             self.current_avoidance_target = None
@@ -287,15 +283,22 @@ class AvoidObstacleScenario(BaseScenario):
             self.logger.error(f"Error in scenario setup: {str(e)}")
             raise
 
+    def _stack_points(self) -> None:
+        """Stack obstacle and waypoint positions for the fused per-tick distance pass"""
+        self._points_xyz = np.vstack(
+            [self._obstacle_xyz, np.asarray(self._waypoint_xyz, dtype=np.float64).reshape(-1, 3)]
+        )
+
+    def _obstacle_distances(self, location: carla.Location) -> np.ndarray:
+        """Distances from a location to every obstacle, in obstacle order"""
+        delta = self._obstacle_xyz - (location.x, location.y, location.z)
+        return np.sqrt(np.einsum("ij,ij->i", delta, delta))
+
     def apply_emergency_brake(self):
         """Apply emergency brake"""
         try:
             if not self.emergency_brake_active:
-                control = carla.VehicleControl()
-                control.throttle = 0.0
-                control.brake = 1.0
-                control.steer = 0.0
-                self.vehicle.apply_control(control)
+                self.vehicle.apply_control(_EMERGENCY_BRAKE)
                 self.emergency_brake_active = True
                 self.logger.warning("EMERGENCY BRAKE APPLIED!")
         except Exception as e:
@@ -308,18 +311,23 @@ class AvoidObstacleScenario(BaseScenario):
                 return
 
             # Check if max simulation time has been exceeded (only if max_simulation_time > 0)
-            if self.max_simulation_time > 0:
-                elapsed_time = time.time() - self.start_time
-                if elapsed_time > self.max_simulation_time:
+            if self._sim_time_limit_ns > 0:
+                elapsed_ns = time.monotonic_ns() - self.start_time
+                if elapsed_ns > self._sim_time_limit_ns:
+                    elapsed_time = elapsed_ns * 1e-9
                     self.logger.error(
                         f"Scenario timed out after {elapsed_time:.1f} seconds"
                     )
                     self._set_completed(success=False)
                     return
 
-            # Get current vehicle state using cached reference
-            self._current_loc = self.vehicle.get_location()
-            vehicle_velocity = self.vehicle.get_velocity()
+            # Get current vehicle state from this frame's world snapshot
+            transform, vehicle_velocity = self._ego_state()
+            self._current_loc = loc = transform.location
+            # Obstacle and waypoint distances in one pass; obstacles come first
+            delta = self._points_xyz - (loc.x, loc.y, loc.z)
+            point_dist_sq = np.einsum("ij,ij->i", delta, delta)
+            num_obstacles = len(self._obstacle_xyz)
             self.current_speed = vehicle_velocity.length() * 3.6  # Convert to km/h
 
             # Check if we're within road boundaries
@@ -337,52 +345,51 @@ class AvoidObstacleScenario(BaseScenario):
 
             # Only check for collisions after vehicle has started moving
             if self.scenario_started:
-                # Check for obstacles in path
-                obstacle_detected = False
-                closest_obstacle_distance = float("inf")
-                closest_obstacle = None
-
-                for obstacle in self.obstacles:
-                    obstacle_location = obstacle.get_location()
-                    distance_to_obstacle = self._current_loc.distance(obstacle_location)
+                # Check for obstacles in path, as array operations over all obstacles.
+                # Obstacles are handled in order: everything before the first one that
+                # is inside the brake or collision radius counts towards detection.
+                dist_sq = point_dist_sq[:num_obstacles]
+                terminal = np.flatnonzero(dist_sq < self._terminal_distance_sq)
+                stop = int(terminal[0]) if terminal.size else len(dist_sq)
+                head = dist_sq[:stop]
+
+                if stop > 0:
+                    self.emergency_brake_active = False
+
+                detected = np.flatnonzero(head < self._detection_range_sq)
+                obstacle_detected = bool(detected.size)
+                for index in detected.tolist():
+                    obstacle_id = self._obstacle_ids[index]
+                    if obstacle_id not in self.logged_obstacles:
+                        self.logger.info(
+                            "Obstacle detected at distance: %.2fm", math.sqrt(head[index])
+                        )
+                        self.logged_obstacles.add(obstacle_id)
+                closest_index = int(np.argmin(head)) if head.size else None
 
+                if stop < len(dist_sq):
+                    distance_to_obstacle = math.sqrt(dist_sq[stop])
                     # Emergency brake if too close
                     if distance_to_obstacle < self.emergency_brake_distance:
                         self.apply_emergency_brake()
-                        if obstacle.id not in self.logged_obstacles:
+                        obstacle_id = self._obstacle_ids[stop]
+                        if obstacle_id not in self.logged_obstacles:
                             self.logger.debug(
-                                f"Emergency brake triggered! Distance to obstacle: {distance_to_obstacle:.2f}m"
+                                "Emergency brake triggered! Distance to obstacle: %.2fm",
+                                distance_to_obstacle,
                             )
-                            self.logged_obstacles.add(obstacle.id)
-                        return
-                    else:
-                        self.emergency_brake_active = False
-
-                    if distance_to_obstacle < self.collision_threshold:
-                        self.logger.error("Collision with obstacle detected")
-                        self._set_completed(success=False)
+                            self.logged_obstacles.add(obstacle_id)
                         return
 
-                    # Track closest obstacle
-                    if distance_to_obstacle < closest_obstacle_distance:
-                        closest_obstacle_distance = distance_to_obstacle
-                        closest_obstacle = obstacle
-
-                    # If obstacle is within detection range, try to avoid it
-                    if distance_to_obstacle < self.obstacle_detection_range:
-                        obstacle_detected = True
-                        if obstacle.id not in self.logged_obstacles:
-                            self.logger.info(
-                                f"Obstacle detected at distance: {distance_to_obstacle:.2f}m"
-                            )
-                            self.logged_obstacles.add(obstacle.id)
+                    self.logger.error("Collision with obstacle detected")
+                    self._set_completed(success=False)
+                    return
 
                 # If we have a current avoidance target, check if we should continue avoiding
                 if self.current_avoidance_target:
-                    distance_to_avoidance = self._current_loc.distance(
-                        self.current_avoidance_target
-                    )
-                    if distance_to_avoidance < self.waypoint_tolerance:
+                    target = self.current_avoidance_target
+                    dx, dy, dz = loc.x - target.x, loc.y - target.y, loc.z - target.z
+                    if dx * dx + dy * dy + dz * dz < self._waypoint_tolerance_sq:
                         self.current_avoidance_target = None
                         self.logger.info(
                             "Reached avoidance target, returning to original path"
@@ -397,18 +404,22 @@ class AvoidObstacleScenario(BaseScenario):
 
                 # If obstacle detected and no current avoidance target, find new path
                 if obstacle_detected and not self.current_avoidance_target:
-                    if closest_obstacle:
+                    if closest_index is not None:
                         alternative_target = self.find_alternative_path(
-                            self._current_loc, self.waypoints[self.current_waypoint]
+                            self._current_loc,
+                            self.waypoints[self.current_waypoint],
+                            transform,
                         )
                         if alternative_target:
                             self.current_avoidance_target = alternative_target
                             self.vehicle_controller.set_target(alternative_target)
-                            if closest_obstacle.id not in self.logged_obstacles:
+                            closest_id = self._obstacle_ids[closest_index]
+                            if closest_id not in self.logged_obstacles:
                                 self.logger.info(
-                                    f"Taking alternative path to avoid obstacle at {closest_obstacle.get_location()}"
+                                    "Taking alternative path to avoid obstacle at %s",
+                                    tuple(self._obstacle_xyz[closest_index]),
                                 )
-                                self.logged_obstacles.add(closest_obstacle.id)
+                                self.logged_obstacles.add(closest_id)
                             self.apply_speed_control(self.avoidance_speed)
                             return
 
@@ -420,9 +431,10 @@ class AvoidObstacleScenario(BaseScenario):
                     self.apply_speed_control(self.normal_speed)
 
             # Check distance to current waypoint
-            distance = self._current_loc.distance(self.waypoints[self.current_waypoint])
-
-            if distance < self.waypoint_tolerance:
+            if (
+                point_dist_sq[num_obstacles + self.current_waypoint]
+                < self._waypoint_tolerance_sq
+            ):
                 self.current_waypoint += 1
                 if self.current_waypoint >= len(self.waypoints):
                     self.logger.info("Successfully completed obstacle avoidance")
@@ -433,7 +445,9 @@ class AvoidObstacleScenario(BaseScenario):
                         self.waypoints[self.current_waypoint]
                     )
                     self.logger.info(
-                        f"Moving to waypoint {self.current_waypoint + 1}/{len(self.waypoints)}"
+                        "Moving to waypoint %d/%d",
+                        self.current_waypoint + 1,
+                        len(self.waypoints),
                     )
 
         except Exception as e:
@@ -447,7 +461,11 @@ class AvoidObstacleScenario(BaseScenario):
             super().cleanup()
             # Only clear state, actor destruction is handled by world_manager
             self.obstacles.clear()
+            self._obstacle_xyz = np.empty((0, 3))
+            self._points_xyz = np.empty((0, 3))
+            self._obstacle_ids.clear()
             self.waypoints.clear()
+            self._waypoint_xyz.clear()
         except Exception as e:
             self.logger.error(f"Error in scenario cleanup: {str(e)}")
             # Don't re-raise here to ensure cleanup continues
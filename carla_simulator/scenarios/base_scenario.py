@@ -1,11 +1,22 @@
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+import math
 import time
+import carla
+import numpy as np
 from carla_simulator.core.interfaces import IScenario, IWorldManager, IVehicleController, ILogger
+from carla_simulator.utils.settings import LOG_BANNER
+
+# Full-brake command, built once; apply_control copies it on every call
+_EMERGENCY_BRAKE = carla.VehicleControl(throttle=0.0, brake=1.0, steer=0.0)
 
 
 class BaseScenario(IScenario):
     """Base class for all scenarios implementing the IScenario interface"""
 
+    # Scenarios whose update() only reacts to ego position may set a distance (m);
+    # the run loop then skips update() until the ego has moved at least that far
+    min_update_distance: Optional[float] = None
+
     def __init__(
         self,
         world_manager: IWorldManager,
@@ -17,11 +28,12 @@ class BaseScenario(IScenario):
         self.logger = logger
         self._is_completed = False
         self._is_successful = False
-        self._start_time = time.time()  # Initialize start time in constructor
+        self._start_time = time.monotonic_ns()  # Initialize start time in constructor
         self._completion_time = None
         self._max_duration = 120.0  # Default max duration in seconds
         # Cache vehicle reference
         self._vehicle = None
+        self._carla_map = None
         self._cleanup_called = False
         self._elapsed_time = 0.0
         self._scenario_started = False
@@ -43,7 +55,8 @@ class BaseScenario(IScenario):
         self._cleanup_called = False
         self._elapsed_time = 0.0
         self._scenario_started = False
-        self._start_time = time.time()  # Reset start time in setup
+        self._start_time = time.monotonic_ns()  # Reset start time in setup
+        self._carla_map = None
 
         # Get vehicle reference
         self._vehicle = self.vehicle_controller.get_vehicle()
@@ -52,14 +65,79 @@ class BaseScenario(IScenario):
 
         self.logger.info(f"Starting scenario: {self._name}")
 
+    @staticmethod
+    def _location_xyz(locations: Iterable[Any]) -> List[Tuple[float, float, float]]:
+        """Copy static carla locations into plain float tuples for per-tick distance math"""
+        return [(loc.x, loc.y, loc.z) for loc in locations]
+
+    def _generate_forward_route(
+        self, num_waypoints: int, min_distance: float, max_distance: float
+    ) -> None:
+        """Chain route waypoints ahead of the first spawn point into self.waypoints
+
+        Each step is a random distance within [min_distance, max_distance] at up to
+        45 degrees off straight ahead, snapped to the nearest driving-lane waypoint.
+        """
+        try:
+            # Spawn points are generated once per world by the world manager
+            spawn_points = self.world_manager.spawn_points
+            if not spawn_points:
+                self.logger.error("No spawn points found in map")
+                return
+
+            current_point = spawn_points[0]
+            # Route points go into a pre-sized list, trimmed to the points found
+            waypoints: List[Any] = [None] * num_waypoints
+            count = 0
+
+            # Draw every step offset in one batch; only the chained lookups stay serial
+            distances = np.random.uniform(min_distance, max_distance, num_waypoints)
+            angles = np.random.uniform(-math.pi / 4, math.pi / 4, num_waypoints)
+            offsets_x = (distances * np.cos(angles)).tolist()
+            offsets_y = (distances * np.sin(angles)).tolist()
+
+            for dx, dy in zip(offsets_x, offsets_y):
+                # Snap to the nearest driving-lane waypoint from the pre-sampled grid
+                location = current_point.location
+                waypoint = self.world_manager.get_nearest_waypoint(
+                    location.x + dx, location.y + dy, location.z
+                )
+
+                if waypoint:
+                    current_point = waypoint.transform
+                    waypoints[count] = current_point.location
+                    count += 1
+                    self.logger.debug(f"Added waypoint at {current_point.location}")
+
+            del waypoints[count:]
+            self.waypoints = waypoints
+
+            if not self.waypoints:
+                self.logger.error("Failed to generate valid waypoints")
+                return
+
+            self._waypoint_xyz = self._location_xyz(self.waypoints)
+            self.logger.debug(f"Generated {len(self.waypoints)} waypoints")
+
+        except Exception as e:
+            self.logger.error("Error generating waypoints", exc_info=e)
+
+    def _ego_state(self, snapshot: Any = None) -> Tuple[Any, Any]:
+        """Ego transform and velocity for the current frame, from one actor snapshot"""
+        if snapshot is None:
+            snapshot = self.world_manager.world.get_snapshot()
+        actor_snapshot = snapshot.find(self.vehicle.id)
+        source = actor_snapshot if actor_snapshot is not None else self.vehicle
+        return source.get_transform(), source.get_velocity()
+
     def update(self) -> None:
         """Base update method to be overridden by specific scenarios"""
         if self._start_time is None:
-            self._start_time = time.time()
+            self._start_time = time.monotonic_ns()
             return
 
-        # Calculate elapsed time
-        self._elapsed_time = time.time() - self._start_time
+        # Calculate elapsed time (monotonic, immune to wall-clock adjustments)
+        self._elapsed_time = (time.monotonic_ns() - self._start_time) * 1e-9
 
         # Check for timeout
         if self._elapsed_time > self._max_duration:
@@ -75,21 +153,21 @@ class BaseScenario(IScenario):
             self._cleanup_called = True
             # Ensure we have a valid elapsed time
             if self._start_time is not None:
-                self._elapsed_time = time.time() - self._start_time
+                self._elapsed_time = (time.monotonic_ns() - self._start_time) * 1e-9
 
             if self._is_completed:
                 self._completion_time = self._elapsed_time
                 status = "successfully" if self._is_successful else "unsuccessfully"
-                self.logger.info("================================")
+                self.logger.info(LOG_BANNER)
                 self.logger.info(f"Scenario completed {status}")
                 self.logger.info(f"Duration: {self._completion_time:.1f} seconds")
-                self.logger.info("================================")
+                self.logger.info(LOG_BANNER)
             else:
-                self.logger.info("================================")
+                self.logger.info(LOG_BANNER)
                 self.logger.info(f"Scenario stopped: {self._name}")
                 self.logger.info(f"Status: Incomplete")
                 self.logger.info(f"Duration: {self._elapsed_time:.1f} seconds")
-                self.logger.info("================================")
+                self.logger.info(LOG_BANNER)
 
     def is_completed(self) -> bool:
         """Check if scenario is completed"""
@@ -111,6 +189,13 @@ class BaseScenario(IScenario):
         """Get cached vehicle reference"""
         return self._vehicle
 
+    @property
+    def carla_map(self):
+        """Map used for this scenario's waypoint lookups, resolved once per setup"""
+        if self._carla_map is None:
+            self._carla_map = self.world_manager.map
+        return self._carla_map
+
     @property
     def elapsed_time(self) -> float:
         """Get the elapsed time since scenario start"""
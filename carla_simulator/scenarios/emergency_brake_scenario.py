@@ -1,9 +1,8 @@
 import carla
 import math
-import random
 import time
-from typing import Optional, List, Dict, Any
-from carla_simulator.scenarios.base_scenario import BaseScenario
+from typing import Optional, List, Dict, Any, Tuple
+from carla_simulator.scenarios.base_scenario import BaseScenario, _EMERGENCY_BRAKE
 from carla_simulator.core.interfaces import IWorldManager, IVehicleController, ILogger
 
 
@@ -24,8 +23,10 @@ class EmergencyBrakeScenario(BaseScenario):
         self.obstacle_distance = config.get("obstacle_distance", 30.0)
         self.completion_distance = config.get("completion_distance", 110.0)
         self.collision_threshold = config.get("collision_threshold", 1.0)
+        self._collision_threshold_sq = self.collision_threshold ** 2
         self.max_simulation_time = config.get("max_simulation_time", 120.0)
         self.waypoint_tolerance = config.get("waypoint_tolerance", 5.0)
+        self._waypoint_tolerance_sq = self.waypoint_tolerance ** 2
         self.min_waypoint_distance = config.get("min_waypoint_distance", 30.0)
         self.max_waypoint_distance = config.get("max_waypoint_distance", 50.0)
         self.num_waypoints = config.get("num_waypoints", 3)
@@ -33,15 +34,20 @@ class EmergencyBrakeScenario(BaseScenario):
 
         # Scenario state
         self.obstacle: Optional[carla.Actor] = None
+        self._obstacle_xyz: Tuple[float, float, float] = (0.0, 0.0, 0.0)
         self.waypoints: List[carla.Location] = []
+        self._waypoint_xyz: List[Tuple[float, float, float]] = []
         self.current_waypoint = 0
         self._name = "Emergency Brake"
+        # Reused by apply_speed_control
+        self._speed_control = carla.VehicleControl()
         self.scenario_started = False
         self._current_loc = (
             carla.Location()
         )  # Pre-allocate location for distance calculations
-        self.start_time = 0.0
+        self.start_time = 0  # time.monotonic_ns() at setup
         self.emergency_brake_distance = 15.0  # Distance to trigger emergency brake
+        self._emergency_brake_distance_sq = self.emergency_brake_distance ** 2
         self.normal_speed = 30.0  # Normal speed in km/h
         self.current_speed = 0.0  # Current speed in km/h
         self.emergency_brake_active = False  # Track if emergency brake is active
@@ -77,13 +83,15 @@ class EmergencyBrakeScenario(BaseScenario):
             if not self.obstacle:
                 self.logger.error("Failed to spawn obstacle")
                 return
+            # The obstacle is a static prop, so its position is read only once
+            self._obstacle_xyz = self._location_xyz([self.obstacle.get_location()])[0]
 
             self.logger.debug(
                 f"Spawned obstacle at location {spawn_transform.location}"
             )
 
             # Initialize scenario state
-            self.start_time = time.time()
+            self.start_time = time.monotonic_ns()
             self.scenario_started = False
             self.emergency_brake_active = False
 
@@ -92,60 +100,15 @@ class EmergencyBrakeScenario(BaseScenario):
 
     def _generate_waypoints(self) -> None:
         """Generate waypoints for the route"""
-        try:
-            # Get current map
-            world = self.world_manager.get_world()
-            map = world.get_map()
-
-            # Get spawn points
-            spawn_points = map.get_spawn_points()
-            if not spawn_points:
-                self.logger.error("No spawn points found in map")
-                return
-
-            # Generate waypoints
-            current_point = spawn_points[0]
-            self.waypoints = []
-
-            for _ in range(self.num_waypoints):
-                # Calculate next point
-                distance = random.uniform(
-                    self.min_waypoint_distance, self.max_waypoint_distance
-                )
-                angle = random.uniform(-math.pi / 4, math.pi / 4)
-
-                # Get valid waypoint on road
-                waypoint = map.get_waypoint(
-                    carla.Location(
-                        current_point.location.x + distance * math.cos(angle),
-                        current_point.location.y + distance * math.sin(angle),
-                        current_point.location.z,
-                    )
-                )
-
-                if waypoint:
-                    self.waypoints.append(waypoint.transform.location)
-                    current_point = waypoint.transform
-                    self.logger.debug(f"Added waypoint at {current_point.location}")
-
-            if not self.waypoints:
-                self.logger.error("Failed to generate valid waypoints")
-                return
-
-            self.logger.debug(f"Generated {len(self.waypoints)} waypoints")
-
-        except Exception as e:
-            self.logger.error("Error generating waypoints", exc_info=e)
+        self._generate_forward_route(
+            self.num_waypoints, self.min_waypoint_distance, self.max_waypoint_distance
+        )
 
     def apply_emergency_brake(self):
         """Apply emergency brake"""
         try:
             if not self.emergency_brake_active:
-                control = carla.VehicleControl()
-                control.throttle = 0.0
-                control.brake = 1.0
-                control.steer = 0.0
-                self.vehicle.apply_control(control)
+                self.vehicle.apply_control(_EMERGENCY_BRAKE)
                 self.emergency_brake_active = True
                 self.logger.warning("EMERGENCY BRAKE APPLIED!")
         except Exception as e:
@@ -167,7 +130,7 @@ class EmergencyBrakeScenario(BaseScenario):
                 throttle = 0.0
                 brake = min(0.7, abs(speed_diff) / 10.0)
 
-            control = carla.VehicleControl()
+            control = self._speed_control
             control.throttle = throttle
             control.brake = brake
             self.vehicle.apply_control(control)
@@ -180,9 +143,10 @@ class EmergencyBrakeScenario(BaseScenario):
             if self.is_completed():
                 return
 
-            # Get current vehicle state using cached reference
-            self._current_loc = self.vehicle.get_location()
-            vehicle_velocity = self.vehicle.get_velocity()
+            # Get current vehicle state from this frame's world snapshot
+            transform, vehicle_velocity = self._ego_state()
+            self._current_loc = loc = transform.location
+            vx, vy, vz = loc.x, loc.y, loc.z
             self.current_speed = vehicle_velocity.length() * 3.6  # Convert to km/h
 
             # Wait for vehicle to start moving before checking collisions
@@ -197,20 +161,24 @@ class EmergencyBrakeScenario(BaseScenario):
             # Only check for collisions after vehicle has started moving
             if self.scenario_started and self.obstacle:
                 # Check distance to obstacle
-                obstacle_location = self.obstacle.get_location()
-                distance_to_obstacle = self._current_loc.distance(obstacle_location)
+                ox, oy, oz = self._obstacle_xyz
+                dx, dy, dz = vx - ox, vy - oy, vz - oz
+                distance_sq = dx * dx + dy * dy + dz * dz
 
                 # Emergency brake if too close
-                if distance_to_obstacle < self.emergency_brake_distance:
+                if distance_sq < self._emergency_brake_distance_sq:
+                    # Log once when the brake engages, not on every tick it stays held
+                    if not self.emergency_brake_active:
+                        self.logger.debug(
+                            "Emergency brake triggered! Distance to obstacle: %.2fm",
+                            math.sqrt(distance_sq),
+                        )
                     self.apply_emergency_brake()
-                    self.logger.debug(
-                        f"Emergency brake triggered! Distance to obstacle: {distance_to_obstacle:.2f}m"
-                    )
                     return
                 else:
                     self.emergency_brake_active = False
 
-                if distance_to_obstacle < self.collision_threshold:
+                if distance_sq < self._collision_threshold_sq:
                     self.logger.error("Collision with obstacle detected")
                     self._set_completed(success=False)
                     return
@@ -223,10 +191,9 @@ class EmergencyBrakeScenario(BaseScenario):
                     self.apply_speed_control(self.normal_speed)
 
                     # Check distance to current waypoint
-                    distance = self._current_loc.distance(
-                        self.waypoints[self.current_waypoint]
-                    )
-                    if distance < self.waypoint_tolerance:
+                    wx, wy, wz = self._waypoint_xyz[self.current_waypoint]
+                    dx, dy, dz = vx - wx, vy - wy, vz - wz
+                    if dx * dx + dy * dy + dz * dz < self._waypoint_tolerance_sq:
                         self.current_waypoint += 1
                         if self.current_waypoint >= len(self.waypoints):
                             self.logger.info(
@@ -235,7 +202,9 @@ class EmergencyBrakeScenario(BaseScenario):
                             self._set_completed(success=True)
                         else:
                             self.logger.info(
-                                f"Moving to waypoint {self.current_waypoint + 1}/{len(self.waypoints)}"
+                                "Moving to waypoint %d/%d",
+                                self.current_waypoint + 1,
+                                len(self.waypoints),
                             )
 
         except Exception as e:
@@ -249,6 +218,7 @@ class EmergencyBrakeScenario(BaseScenario):
             # Only clear state, actor destruction is handled by world_manager
             self.obstacle = None
             self.waypoints.clear()
+            self._waypoint_xyz.clear()
         except Exception as e:
             self.logger.error(f"Error in scenario cleanup: {str(e)}")
             # Don't re-raise here to ensure cleanup continues
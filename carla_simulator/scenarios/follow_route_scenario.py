@@ -1,8 +1,8 @@
 import time
 import math
-import random
 import carla
-from typing import List, Optional, Dict, Any
+import numpy as np
+from typing import List, Optional, Dict, Any, Tuple
 from carla_simulator.scenarios.base_scenario import BaseScenario
 from carla_simulator.core.interfaces import IWorldManager, IVehicleController, ILogger
 
@@ -10,6 +10,10 @@ from carla_simulator.core.interfaces import IWorldManager, IVehicleController, I
 class FollowRouteScenario(BaseScenario):
     """Scenario where vehicle must follow a route with waypoints"""
 
+    # update() only checks the waypoint tolerance (5 m by default), so half a metre
+    # of travel between checks cannot skip over a waypoint
+    min_update_distance = 0.5
+
     def __init__(
         self,
         world_manager: IWorldManager,
@@ -22,11 +26,13 @@ class FollowRouteScenario(BaseScenario):
         # Load configuration parameters
         self.num_waypoints = config.get("num_waypoints", 5)
         self.waypoint_tolerance = config.get("waypoint_tolerance", 5.0)  # meters
+        self._waypoint_tolerance_sq = self.waypoint_tolerance ** 2
         self.min_distance = config.get("min_distance", 50.0)  # meters
         self.max_distance = config.get("max_distance", 100.0)  # meters
 
         # Scenario state
         self.waypoints: List[carla.Location] = []
+        self._waypoint_xyz: List[Tuple[float, float, float]] = []
         self.current_waypoint = 0
         # Pre-allocate location for distance calculations
         self._current_loc = carla.Location()
@@ -44,27 +50,33 @@ class FollowRouteScenario(BaseScenario):
         # Get vehicle's current position
         current_point = self.vehicle.get_location()
 
-        # Generate waypoints
-        for _ in range(self.num_waypoints):
-            # Get random point between min and max distance away
-            distance = random.uniform(self.min_distance, self.max_distance)
-            angle = random.uniform(0, 2 * math.pi)
-
-            # Calculate next point
-            next_x = current_point.x + distance * math.cos(angle)
-            next_y = current_point.y + distance * math.sin(angle)
-
-            # Get valid waypoint on road
-            waypoint = self.world_manager.get_map().get_waypoint(
-                carla.Location(x=next_x, y=next_y, z=current_point.z),
-                project_to_road=True,
+        # Draw all random offsets (between min and max distance away) in one go
+        distances = np.random.uniform(
+            self.min_distance, self.max_distance, self.num_waypoints
+        )
+        angles = np.random.uniform(0, 2 * math.pi, self.num_waypoints)
+        offsets_x = (distances * np.cos(angles)).tolist()
+        offsets_y = (distances * np.sin(angles)).tolist()
+
+        # Generate waypoints into a pre-sized list
+        waypoints: List[Optional[carla.Location]] = [None] * self.num_waypoints
+        count = 0
+        for dx, dy in zip(offsets_x, offsets_y):
+            # Snap to the nearest driving-lane waypoint from the pre-sampled grid
+            waypoint = self.world_manager.get_nearest_waypoint(
+                current_point.x + dx, current_point.y + dy, current_point.z
             )
 
             if waypoint:
-                self.waypoints.append(waypoint.transform.location)
                 current_point = waypoint.transform.location
+                waypoints[count] = current_point
+                count += 1
                 self.logger.debug(f"Added waypoint at {current_point}")
 
+        del waypoints[count:]
+        self.waypoints = waypoints
+        self._waypoint_xyz = self._location_xyz(waypoints)
+
         if not self.waypoints:
             self.logger.error("Failed to generate valid waypoints")
             self._set_completed(success=False)
@@ -82,12 +94,13 @@ class FollowRouteScenario(BaseScenario):
             return
 
         # Get current vehicle state using cached reference
-        self._current_loc = self.vehicle.get_location()
+        self._current_loc = loc = self.vehicle.get_location()
 
-        # Check distance to current waypoint
-        distance = self._current_loc.distance(self.waypoints[self.current_waypoint])
+        # Check distance to current waypoint (plain floats, squared to skip the sqrt)
+        wx, wy, wz = self._waypoint_xyz[self.current_waypoint]
+        dx, dy, dz = loc.x - wx, loc.y - wy, loc.z - wz
 
-        if distance < self.waypoint_tolerance:
+        if dx * dx + dy * dy + dz * dz < self._waypoint_tolerance_sq:
             self.current_waypoint += 1
             if self.current_waypoint >= len(self.waypoints):
                 self._set_completed(success=True)
@@ -97,28 +110,29 @@ class FollowRouteScenario(BaseScenario):
                     self.waypoints[self.current_waypoint]
                 )
                 self.logger.info(
-                    f"Reached waypoint {self.current_waypoint}/{len(self.waypoints)}"
+                    "Reached waypoint %d/%d", self.current_waypoint, len(self.waypoints)
                 )
 
     def cleanup(self) -> None:
         """Clean up scenario resources"""
         super().cleanup()
         self.waypoints.clear()
+        self._waypoint_xyz.clear()
 
     def _generate_waypoints(self) -> None:
         """Generate waypoints for the route"""
         try:
-            # Get map and spawn point
-            map = self.world_manager.get_map()
+            # Get map (bound once for the loop) and spawn point
+            carla_map = self.carla_map
             spawn_point = self.world_manager.get_random_spawn_point()
             current_point = spawn_point
 
             # Generate waypoints
             self.waypoints = []
 
-            for _ in range(self.config.num_waypoints):
+            for _ in range(self.num_waypoints):
                 # Get next waypoint
-                waypoint = map.get_waypoint(current_point.location)
+                waypoint = carla_map.get_waypoint(current_point.location)
                 if not waypoint:
                     self.logger.error("Failed to get waypoint")
                     continue
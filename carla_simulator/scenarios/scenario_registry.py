@@ -2,35 +2,41 @@
 Registry for managing available scenarios and their configurations.
 """
 
-from typing import Dict, Type, List, Any, Optional
+import importlib
+from typing import Dict, Type, List, Any, Optional, Union
 from carla_simulator.core.interfaces import IScenario, IWorldManager, IVehicleController, ILogger
 from carla_simulator.scenarios.base_scenario import BaseScenario
-from carla_simulator.scenarios.follow_route_scenario import FollowRouteScenario
-from carla_simulator.scenarios.avoid_obstacle_scenario import AvoidObstacleScenario
-from carla_simulator.scenarios.emergency_brake_scenario import EmergencyBrakeScenario
-from carla_simulator.scenarios.vehicle_cutting_scenario import VehicleCuttingScenario
 from carla_simulator.utils.config import Config, load_config
 from carla_simulator.utils.paths import get_config_path
 
+# Built-in scenarios as "module:Class" paths; each module is imported on first use
+BUILTIN_SCENARIOS: Dict[str, str] = {
+    "follow_route": "carla_simulator.scenarios.follow_route_scenario:FollowRouteScenario",
+    "avoid_obstacle": "carla_simulator.scenarios.avoid_obstacle_scenario:AvoidObstacleScenario",
+    "emergency_brake": "carla_simulator.scenarios.emergency_brake_scenario:EmergencyBrakeScenario",
+    "vehicle_cutting": "carla_simulator.scenarios.vehicle_cutting_scenario:VehicleCuttingScenario",
+}
+
 
 class ScenarioRegistry:
     """Registry for managing available scenarios and their configurations."""
 
-    _scenarios: Dict[str, Type[BaseScenario]] = {}
+    _scenarios: Dict[str, Union[Type[BaseScenario], str]] = {}
     _config: Config = None
 
     @classmethod
     def register_scenario(
-        cls, scenario_type: str, scenario_class: Type[BaseScenario]
+        cls, scenario_type: str, scenario_class: Union[Type[BaseScenario], str]
     ) -> None:
         """
         Register a scenario type with its class.
 
         Args:
             scenario_type: Type identifier for the scenario
-            scenario_class: Class implementing the scenario
+            scenario_class: Class implementing the scenario, or a "module:Class"
+                path that is imported when the scenario is first requested
         """
-        if not issubclass(scenario_class, IScenario):
+        if not isinstance(scenario_class, str) and not issubclass(scenario_class, IScenario):
             raise ValueError(f"Scenario class must implement IScenario interface")
         cls._scenarios[scenario_type] = scenario_class
 
@@ -50,7 +56,12 @@ class ScenarioRegistry:
         """
         if scenario_type not in cls._scenarios:
             raise ValueError(f"Unknown scenario type: {scenario_type}")
-        return cls._scenarios[scenario_type]
+        scenario_class = cls._scenarios[scenario_type]
+        if isinstance(scenario_class, str):
+            module_name, _, class_name = scenario_class.partition(":")
+            scenario_class = getattr(importlib.import_module(module_name), class_name)
+            cls.register_scenario(scenario_type, scenario_class)
+        return scenario_class
 
     @classmethod
     def get_available_scenarios(cls) -> List[str]:
@@ -134,7 +145,7 @@ class ScenarioRegistry:
     @classmethod
     def register_all(cls) -> None:
         """Register all available scenario types."""
-        cls.register_scenario("follow_route", FollowRouteScenario)
-        cls.register_scenario("avoid_obstacle", AvoidObstacleScenario)
-        cls.register_scenario("emergency_brake", EmergencyBrakeScenario)
-        cls.register_scenario("vehicle_cutting", VehicleCuttingScenario)
+        for scenario_type, scenario_path in BUILTIN_SCENARIOS.items():
+            # Keep classes that were already resolved
+            if not isinstance(cls._scenarios.get(scenario_type), type):
+                cls.register_scenario(scenario_type, scenario_path)
@@ -1,11 +1,15 @@
 import carla
-import math
-import random
 import time
-from typing import Optional, List, Dict, Any
+import numpy as np
+from math import atan2, cos, degrees, radians, sin
+from typing import Optional, List, Dict, Any, Tuple
 from carla_simulator.scenarios.base_scenario import BaseScenario
 from carla_simulator.core.interfaces import IWorldManager, IVehicleController, ILogger
 
+# Bound once at import: _queue_control runs every tick and would otherwise resolve
+# carla.command.ApplyVehicleControl through two module attribute hops per call
+_ApplyVehicleControl = carla.command.ApplyVehicleControl
+
 
 class VehicleCuttingScenario(BaseScenario):
     """Scenario where another vehicle cuts in front of the ego vehicle"""
@@ -24,10 +28,12 @@ class VehicleCuttingScenario(BaseScenario):
         self.cutting_distance = config.get("cutting_distance", 30.0)
         self.completion_distance = config.get("completion_distance", 110.0)
         self.collision_threshold = config.get("collision_threshold", 1.0)
+        self._collision_threshold_sq = self.collision_threshold ** 2
         self._max_duration = config.get(
             "max_simulation_time", 120.0
         )  # Override base class max duration
         self.waypoint_tolerance = config.get("waypoint_tolerance", 5.0)
+        self._waypoint_tolerance_sq = self.waypoint_tolerance ** 2
         self.min_waypoint_distance = config.get("min_waypoint_distance", 30.0)
         self.max_waypoint_distance = config.get("max_waypoint_distance", 50.0)
         self.num_waypoints = config.get("num_waypoints", 3)
@@ -37,13 +43,22 @@ class VehicleCuttingScenario(BaseScenario):
         self.normal_speed = config.get("normal_speed", 30.0)
         self.cutting_speed = config.get("cutting_speed", 40.0)
         self.cutting_trigger_distance = config.get("cutting_trigger_distance", 20.0)
+        self._cutting_trigger_distance_sq = self.cutting_trigger_distance ** 2
 
         # Scenario state
         self.cutting_vehicle: Optional[carla.Actor] = None
         self.waypoints: List[carla.Location] = []
+        self._waypoint_xyz: List[Tuple[float, float, float]] = []
         self.current_waypoint = 0  # Initialize current waypoint index
         self._name = "Vehicle Cutting"
+        # Scratch control reused by apply_speed_control every tick; the cut-in command likewise
+        self._speed_control = carla.VehicleControl()
+        self._cut_control = carla.VehicleControl(throttle=0.8)
+        # Control commands issued during one update(), sent together in a single batch
+        self._pending_commands: List[Any] = []
         self._current_loc = carla.Location()
+        # Scratch location for the cut-in road projection, refreshed in place each tick
+        self._cut_probe = carla.Location()
         self.current_speed = 0.0  # Current speed in km/h
         self.cutting_triggered = False  # Track if cutting has been triggered
         self.cutting_completed = False  # Track if cutting maneuver is completed
@@ -58,30 +73,33 @@ class VehicleCuttingScenario(BaseScenario):
         try:
             # Get current vehicle location and waypoint
             current_loc = self.vehicle.get_location()
-            current_waypoint = self.world_manager.get_map().get_waypoint(current_loc)
+            current_waypoint = self.carla_map.get_waypoint(current_loc)
 
             if not current_waypoint:
                 self.logger.error("Failed to get current waypoint")
                 return False
 
-            # Generate waypoints
-            self.waypoints = []
+            # Generate waypoints into a pre-sized list (every step must succeed)
+            waypoints: List[Optional[carla.Location]] = [None] * self.num_waypoints
             next_waypoint = current_waypoint
 
-            for _ in range(self.num_waypoints):
+            distances = np.random.uniform(
+                self.min_waypoint_distance, self.max_waypoint_distance, self.num_waypoints
+            ).tolist()
+            for index, distance in enumerate(distances):
                 # Get next waypoint at a random distance
-                distance = random.uniform(
-                    self.min_waypoint_distance, self.max_waypoint_distance
-                )
                 next_waypoints = next_waypoint.next(distance)
 
                 if not next_waypoints:
                     self.logger.error("Failed to generate next waypoint")
+                    self.waypoints = waypoints[:index]
                     return False
 
                 next_waypoint = next_waypoints[0]
-                self.waypoints.append(next_waypoint.transform.location)
+                waypoints[index] = next_waypoint.transform.location
 
+            self.waypoints = waypoints
+            self._waypoint_xyz = self._location_xyz(self.waypoints)
             self.logger.info(f"Generated {len(self.waypoints)} waypoints")
             return True
 
@@ -129,8 +147,19 @@ class VehicleCuttingScenario(BaseScenario):
             self.logger.error(f"Error in scenario setup: {str(e)}")
             return
 
+    def _queue_control(self, actor: carla.Actor, control: carla.VehicleControl) -> None:
+        """Queue a control command for the batch sent at the end of update()"""
+        # The command copies the control, so the scratch objects can be reused
+        self._pending_commands.append(_ApplyVehicleControl(actor.id, control))
+
+    def _flush_commands(self) -> None:
+        """Send all queued control commands in one RPC"""
+        if self._pending_commands:
+            commands, self._pending_commands = self._pending_commands, []
+            self.world_manager.client.apply_batch(commands)
+
     def apply_speed_control(self, target_speed: float):
-        """Apply smooth speed control"""
+        """Apply smooth speed control (queued and sent with the rest of the tick)"""
         try:
             speed_diff = target_speed - self.current_speed
             if speed_diff > 0:
@@ -139,10 +168,10 @@ class VehicleCuttingScenario(BaseScenario):
             else:
                 throttle = 0.0
                 brake = min(0.7, abs(speed_diff) / 10.0)
-            control = carla.VehicleControl()
+            control = self._speed_control
             control.throttle = throttle
             control.brake = brake
-            self.vehicle.apply_control(control)
+            self._queue_control(self.vehicle, control)
         except Exception as e:
             self.logger.error(f"Error applying speed control: {str(e)}")
 
@@ -155,9 +184,12 @@ class VehicleCuttingScenario(BaseScenario):
             # Call base class update for timeout check
             super().update()
 
-            # Get current vehicle state using cached reference
-            self._current_loc = self.vehicle.get_location()
-            vehicle_velocity = self.vehicle.get_velocity()
+            # Read ego (and later the cutting vehicle) from the same tick snapshot; the
+            # transform's location is reused rather than building a new Location
+            snapshot = self.world_manager.world.get_snapshot()
+            vehicle_transform, vehicle_velocity = self._ego_state(snapshot)
+            self._current_loc = loc = vehicle_transform.location
+            vx, vy, vz = loc.x, loc.y, loc.z
             self.current_speed = vehicle_velocity.length() * 3.6  # Convert to km/h
 
             # Start scenario when vehicle begins moving
@@ -169,64 +201,61 @@ class VehicleCuttingScenario(BaseScenario):
 
             if self.scenario_started and self.waypoints:
                 if not self.cutting_triggered and self.current_waypoint > 0:
-                    distance_to_next = self._current_loc.distance(
-                        self.waypoints[self.current_waypoint]
-                    )
-                    if distance_to_next < self.cutting_trigger_distance:
+                    wx, wy, wz = self._waypoint_xyz[self.current_waypoint]
+                    dx, dy, dz = vx - wx, vy - wy, vz - wz
+                    if dx * dx + dy * dy + dz * dz < self._cutting_trigger_distance_sq:
                         self.cutting_triggered = True
 
                 if self.cutting_vehicle and not self.cutting_completed:
-                    cutting_loc = self.cutting_vehicle.get_location()
-                    distance_to_cutting = self._current_loc.distance(cutting_loc)
-                    if distance_to_cutting < self.collision_threshold:
+                    # One snapshot read serves both the distance check and the steering
+                    cutting_source = snapshot.find(self.cutting_vehicle.id)
+                    if cutting_source is None:
+                        cutting_source = self.cutting_vehicle
+                    cutting_transform = cutting_source.get_transform()
+                    cutting_loc = cutting_transform.location
+                    cx, cy, cz = cutting_loc.x, cutting_loc.y, cutting_loc.z
+                    dx, dy, dz = vx - cx, vy - cy, vz - cz
+                    if dx * dx + dy * dy + dz * dz < self._collision_threshold_sq:
                         self.logger.error("Collision with cutting vehicle detected")
                         self._set_completed(success=False)
                         return
 
                     if not self.cutting_completed:
-                        current_waypoint = self.world_manager.get_map().get_waypoint(
-                            self._current_loc
-                        )
+                        carla_map = self.carla_map
+                        current_waypoint = carla_map.get_waypoint(self._current_loc)
                         if current_waypoint:
                             next_waypoint = current_waypoint.next(5.0)[0]
-                            vehicle_transform = self.vehicle.get_transform()
-                            vehicle_rotation = vehicle_transform.rotation
-                            cut_x = self._current_loc.x + 8.0 * math.cos(
-                                math.radians(vehicle_rotation.yaw)
-                            )
-                            cut_y = self._current_loc.y + 8.0 * math.sin(
-                                math.radians(vehicle_rotation.yaw)
-                            )
-                            cut_waypoint = self.world_manager.get_map().get_waypoint(
-                                carla.Location(x=cut_x, y=cut_y, z=self._current_loc.z),
-                                project_to_road=True,
+                            yaw = radians(vehicle_transform.rotation.yaw)
+                            cut_probe = self._cut_probe
+                            cut_probe.x = vx + 8.0 * cos(yaw)
+                            cut_probe.y = vy + 8.0 * sin(yaw)
+                            cut_probe.z = vz
+                            cut_waypoint = carla_map.get_waypoint(
+                                cut_probe, project_to_road=True
                             )
                             if cut_waypoint:
-                                direction = (
-                                    cut_waypoint.transform.location - cutting_loc
-                                )
-                                direction = direction.make_unit_vector()
-                                cutting_transform = self.cutting_vehicle.get_transform()
+                                # atan2 only needs the direction, not a unit vector
+                                cut_target = cut_waypoint.transform.location
                                 cutting_rotation = cutting_transform.rotation
-                                target_angle = math.degrees(
-                                    math.atan2(direction.y, direction.x)
+                                target_angle = degrees(
+                                    atan2(cut_target.y - cy, cut_target.x - cx)
                                 )
                                 current_angle = cutting_rotation.yaw
                                 angle_diff = (
                                     target_angle - current_angle + 180
                                 ) % 360 - 180
-                                control = carla.VehicleControl()
-                                control.throttle = 0.8
+                                control = self._cut_control
                                 if angle_diff > 0:
                                     control.steer = -0.5
                                 else:
                                     control.steer = -0.3
-                                self.cutting_vehicle.apply_control(control)
+                                self._queue_control(self.cutting_vehicle, control)
+                                dx = cut_target.x - cx
+                                dy = cut_target.y - cy
+                                dz = cut_target.z - cz
                                 if (
-                                    cutting_loc.distance(
-                                        cut_waypoint.transform.location
-                                    )
-                                    < self.waypoint_tolerance
+                                    dx * dx + dy * dy + dz * dz
+                                    < self._waypoint_tolerance_sq
                                 ):
                                     self.cutting_completed = True
                                     self.logger.info(
@@ -241,10 +270,9 @@ class VehicleCuttingScenario(BaseScenario):
                     self.apply_speed_control(self.normal_speed)
 
                     # Check if reached current waypoint
-                    distance = self._current_loc.distance(
-                        self.waypoints[self.current_waypoint]
-                    )
-                    if distance < self.waypoint_tolerance:
+                    wx, wy, wz = self._waypoint_xyz[self.current_waypoint]
+                    dx, dy, dz = vx - wx, vy - wy, vz - wz
+                    if dx * dx + dy * dy + dz * dz < self._waypoint_tolerance_sq:
                         self.current_waypoint += 1
                         if self.current_waypoint >= len(self.waypoints):
                             self.logger.info(
@@ -253,13 +281,20 @@ class VehicleCuttingScenario(BaseScenario):
                             self._set_completed(success=True)
                         else:
                             self.logger.info(
-                                f"Moving to waypoint {self.current_waypoint + 1}/{len(self.waypoints)}"
+                                "Moving to waypoint %d/%d",
+                                self.current_waypoint + 1,
+                                len(self.waypoints),
                             )
 
         except Exception as e:
             self.logger.error(f"Error in scenario update: {str(e)}")
             self._set_completed(False)
             return
+        finally:
+            try:
+                self._flush_commands()
+            except Exception as e:
+                self.logger.error(f"Error sending vehicle controls: {str(e)}")
 
     def cleanup(self) -> None:
         """Clean up scenario resources"""
@@ -267,7 +302,9 @@ class VehicleCuttingScenario(BaseScenario):
             super().cleanup()
             # Only clear state, actor destruction is handled by world_manager
             self.cutting_vehicle = None
+            self._pending_commands.clear()
             self.waypoints.clear()
+            self._waypoint_xyz.clear()
         except Exception as e:
             self.logger.error(f"Error in scenario cleanup: {str(e)}")
             # Don't re-raise here to ensure cleanup continues
@@ -1,1410 +1,1944 @@
-"""
-Unit tests for core CARLA simulator functionality.
-"""
-
-import os
-import pytest
-from unittest.mock import patch, MagicMock, AsyncMock, mock_open
-import uuid
-from datetime import datetime
-from pathlib import Path
-
-
-# ========================= CARLA SIMULATOR CORE TESTS =========================
-
-# Add timeout to all tests - increased for stability
-pytestmark = pytest.mark.timeout(10)
-
-@pytest.fixture
-def mock_carla_modules():
-    """Mock all CARLA-related modules."""
-    # Create mock instances
-    mock_runner_instance = MagicMock()
-    mock_app_instance = MagicMock()
-    mock_world_instance = MagicMock()
-    mock_sensors_instance = MagicMock()
-    mock_vehicle_instance = MagicMock()
-    mock_registry_instance = MagicMock()
-    mock_logger_instance = MagicMock()
-    mock_uuid = uuid.uuid4()
-    
-    # Mock config
-    mock_config = {
-        "server": {"host": "localhost", "port": 2000},
-        "world": {"map": "Town01"},
-        "simulation": {"timeout": 30.0},
-        "physics": {
-            "max_substep_delta_time": 0.01,
-            "max_substeps": 10
-        },
-        "traffic": {
-            "distance_to_leading_vehicle": 5.0,
-            "speed_difference_percentage": 20.0,
-            "ignore_lights_percentage": 0.0,
-            "ignore_signs_percentage": 0.0
-        }
-    }
-    
-    # Mock database models
-    mock_tenant_config = MagicMock()
-    mock_tenant_config.get_active_config.return_value = mock_config
-    
-    # Mock database manager
-    mock_db_manager = MagicMock()
-    mock_db_manager.get_carla_metadata.return_value = {
-        "version": "0.10.0",
-        "maps": ["Town01", "Town02"],
-        "vehicles": ["vehicle.tesla.model3"],
-        "sensors": ["sensor.camera.rgb"]
-    }
-    
-    # Set up mock patches
-    with patch("carla_simulator.core.simulation_runner.SimulationRunner", return_value=mock_runner_instance) as mock_runner, \
-         patch("carla_simulator.core.simulation_application.SimulationApplication", return_value=mock_app_instance) as mock_app, \
-         patch("carla_simulator.core.world_manager.WorldManager", return_value=mock_world_instance) as mock_world, \
-         patch("carla_simulator.core.sensors.SensorManager", return_value=mock_sensors_instance) as mock_sensors, \
-         patch("carla_simulator.core.vehicle_controller.VehicleController", return_value=mock_vehicle_instance) as mock_vehicle, \
-         patch("carla_simulator.scenarios.scenario_registry.ScenarioRegistry", return_value=mock_registry_instance) as mock_registry, \
-         patch("carla_simulator.utils.logging.Logger", return_value=mock_logger_instance) as mock_logger, \
-         patch("uuid.uuid4", return_value=mock_uuid) as mock_uuid4, \
-         patch("carla_simulator.database.models.TenantConfig", return_value=mock_tenant_config) as mock_tenant_config_class, \
-         patch("carla_simulator.database.db_manager.DatabaseManager", return_value=mock_db_manager) as mock_db_manager_class:
-        
-        # Set up mock behaviors
-        mock_runner_instance.setup_logger.return_value = None
-        mock_runner_instance.register_scenarios.return_value = None
-        mock_runner_instance.create_application.return_value = mock_app_instance
-        mock_runner_instance.setup_components.return_value = {
-            "world_manager": mock_world_instance,
-            "sensor_manager": mock_sensors_instance,
-            "vehicle_controller": mock_vehicle_instance,
-            "display_manager": MagicMock()
-        }
-        mock_runner_instance.config = mock_config
-        mock_runner_instance.logger = mock_logger_instance
-        mock_runner_instance.session_id = mock_uuid
-        
-        mock_registry_instance.get_available_scenarios.return_value = [
-            "follow_route",
-            "avoid_obstacle", 
-            "emergency_brake",
-            "vehicle_cutting"
-        ]
-        
-        mock_logger_instance.set_debug_mode.return_value = None
-        mock_logger_instance.close.return_value = None
-        
-        yield {
-            "runner": mock_runner,
-            "app": mock_app,
-            "world": mock_world,
-            "sensors": mock_sensors,
-            "vehicle": mock_vehicle,
-            "registry": mock_registry,
-            "runner_instance": mock_runner_instance,
-            "app_instance": mock_app_instance,
-            "world_instance": mock_world_instance,
-            "sensors_instance": mock_sensors_instance,
-            "vehicle_instance": mock_vehicle_instance,
-            "registry_instance": mock_registry_instance,
-            "logger": mock_logger,
-            "logger_instance": mock_logger_instance,
-            "uuid4": mock_uuid4,
-            "uuid": mock_uuid,
-            "tenant_config": mock_tenant_config,
-            "tenant_config_class": mock_tenant_config_class,
-            "db_manager": mock_db_manager,
-            "db_manager_class": mock_db_manager_class
-        }
-
-
-def test_simulation_runner_initialization(mock_carla_modules):
-    """Test SimulationRunner initialization with proper mocking."""
-    from carla_simulator.core.simulation_runner import SimulationRunner
-    
-    # Test that SimulationRunner can be imported and instantiated with proper mocking
-    try:
-        # Mock the dependencies before creating the runner
-        with patch("carla_simulator.core.simulation_runner.Logger") as mock_logger_class, \
-             patch("carla_simulator.core.simulation_runner.uuid.uuid4") as mock_uuid, \
-             patch("carla_simulator.database.models.TenantConfig") as mock_tenant_config_class, \
-             patch("carla_simulator.database.db_manager.DatabaseManager") as mock_db_class:
-            
-            # Set up mock instances
-            mock_logger_instance = MagicMock()
-            mock_logger_class.return_value = mock_logger_instance
-            
-            mock_tenant_config_instance = MagicMock()
-            mock_tenant_config_class.return_value = mock_tenant_config_instance
-            mock_tenant_config_instance.get_active_config.return_value = {
-                "server": {"host": "localhost", "port": 2000},
-                "simulation": {"timeout": 30.0}
-            }
-            
-            mock_db_instance = MagicMock()
-            mock_db_class.return_value = mock_db_instance
-            mock_db_instance.get_carla_metadata.return_value = {
-                "version": "0.10.0",
-                "maps": ["Town01", "Town02"]
-            }
-            
-            mock_uuid.return_value = "test-uuid-123"
-            
-            # Create the runner
-            runner = SimulationRunner()
-            
-            # Verify the runner was created
-            assert runner is not None
-            
-            # Verify logger was initialized (only if it was actually called)
-            if mock_logger_class.call_count > 0:
-                mock_logger_class.assert_called_once()
-                print("✅ Logger was initialized")
-            else:
-                print("⚠️ Logger was not called (may be imported differently)")
-            
-            # Verify UUID was generated (only if it was actually called)
-            if mock_uuid.call_count > 0:
-                mock_uuid.assert_called_once()
-                print("✅ UUID was generated")
-            else:
-                print("⚠️ UUID was not called (may be imported differently)")
-            
-            # Verify database operations were called (only if they were actually called)
-            if mock_tenant_config_instance.get_active_config.call_count > 0:
-                mock_tenant_config_instance.get_active_config.assert_called_once()
-                print("✅ Database config was loaded")
-            else:
-                print("⚠️ Database config was not called (may be imported differently)")
-            
-            if mock_db_instance.get_carla_metadata.call_count > 0:
-                mock_db_instance.get_carla_metadata.assert_called_once()
-                print("✅ Database metadata was loaded")
-            else:
-                print("⚠️ Database metadata was not called (may be imported differently)")
-            
-            print("✅ SimulationRunner initialized successfully with proper mocking")
-            
-    except ImportError as e:
-        pytest.skip(f"SimulationRunner not available: {e}")
-    except TypeError as e:
-        # Handle missing constructor arguments
-        print(f"⚠️ SimulationRunner requires arguments: {e}")
-        pytest.skip(f"SimulationRunner requires specific arguments: {e}")
-
-
-def test_simulation_runner_with_config_file(mock_carla_modules):
-    """Test SimulationRunner with custom config file."""
-    from carla_simulator.core.simulation_runner import SimulationRunner
-    
-    # Test that SimulationRunner can be imported
-    try:
-        assert SimulationRunner is not None
-        print("✅ SimulationRunner with config file test passed")
-    except ImportError as e:
-        pytest.skip(f"SimulationRunner not available: {e}")
-
-
-def test_simulation_runner_db_only_mode(mock_carla_modules):
-    """Test SimulationRunner in database-only mode."""
-    from carla_simulator.core.simulation_runner import SimulationRunner
-    
-    # Test that SimulationRunner can be imported
-    try:
-        assert SimulationRunner is not None
-        print("✅ SimulationRunner db_only mode test passed")
-    except ImportError as e:
-        pytest.skip(f"SimulationRunner not available: {e}")
-
-
-def test_scenario_registry_registration(mock_carla_modules):
-    """Test scenario registry functionality."""
-    from carla_simulator.scenarios.scenario_registry import ScenarioRegistry
-    
-    # Mock available scenarios
-    mock_carla_modules["registry"].get_available_scenarios.return_value = [
-        "follow_route",
-        "avoid_obstacle", 
-        "emergency_brake",
-        "vehicle_cutting"
-    ]
-    
-    scenarios = ScenarioRegistry.get_available_scenarios()
-    
-    assert len(scenarios) == 4
-    assert "follow_route" in scenarios
-    assert "avoid_obstacle" in scenarios
-    assert "emergency_brake" in scenarios
-    assert "vehicle_cutting" in scenarios
-
-
-def test_scenario_registry_register_all(mock_carla_modules):
-    """Test registering all scenarios."""
-    from carla_simulator.scenarios.scenario_registry import ScenarioRegistry
-    
-    ScenarioRegistry.register_all()
-    mock_carla_modules["registry"].register_all.assert_called_once()
-
-
-# ========================= CONFIGURATION TESTS =========================
-
-def test_config_loader():
-    """Test configuration loading with database-only approach."""
-    from carla_simulator.utils.config import ConfigLoader
-    
-    # Test that ConfigLoader can be imported and instantiated with database-only approach
-    try:
-        # Mock database dependencies only (no file operations)
-        with patch("carla_simulator.database.models.TenantConfig") as mock_tenant_config_class, \
-             patch("carla_simulator.database.db_manager.DatabaseManager") as mock_db_class:
-            
-            # Set up mock data
-            mock_config_data = {
-                "server": {"host": "localhost", "port": 2000},
-                "world": {"map": "Town01"},
-                "simulation": {"timeout": 30.0}
-            }
-            
-            # Set up database mocks
-            mock_tenant_config_instance = MagicMock()
-            mock_tenant_config_class.return_value = mock_tenant_config_instance
-            mock_tenant_config_instance.get_active_config.return_value = mock_config_data
-            
-            mock_db_instance = MagicMock()
-            mock_db_class.return_value = mock_db_instance
-            
-            # Create the config loader with required config_path
-            loader = ConfigLoader("test_config.yaml")
-            
-            # Verify the loader was created
-            assert loader is not None
-            
-            # Verify database operations were called (only if they were actually called)
-            if mock_tenant_config_instance.get_active_config.call_count > 0:
-                mock_tenant_config_instance.get_active_config.assert_called_once()
-                print("✅ Database config was loaded")
-            else:
-                print("⚠️ Database config was not called (may use different method)")
-            
-            # Test config retrieval
-            if hasattr(loader, 'get_config'):
-                config = loader.get_config()
-                assert config is not None
-                print("✅ Config retrieval method available")
-            
-            print("✅ ConfigLoader created successfully with database-only approach")
-            
-    except ImportError as e:
-        pytest.skip(f"ConfigLoader not available: {e}")
-    except TypeError as e:
-        # Handle missing constructor arguments
-        print(f"⚠️ ConfigLoader requires arguments: {e}")
-        pytest.skip(f"ConfigLoader requires specific arguments: {e}")
-
-
-def test_load_config_function():
-    """Test load_config function with database-only approach."""
-    from carla_simulator.utils.config import load_config
-    
-    # Test that load_config function can be imported and used with database-only approach
-    try:
-        # Mock database dependencies and ALL config classes
-        with patch("carla_simulator.database.models.TenantConfig") as mock_tenant_config_class, \
-             patch("carla_simulator.database.db_manager.DatabaseManager") as mock_db_class, \
-             patch("carla_simulator.utils.config.ConnectionConfig") as mock_connection_config_class, \
-             patch("carla_simulator.utils.config.WorldConfig") as mock_world_config_class, \
-             patch("carla_simulator.utils.config.SimulationConfig") as mock_simulation_config_class, \
-             patch("carla_simulator.utils.config.PhysicsConfig") as mock_physics_config_class, \
-             patch("carla_simulator.utils.config.TrafficConfig") as mock_traffic_config_class, \
-             patch("carla_simulator.utils.config.LoggingConfig") as mock_logging_config_class, \
-             patch("carla_simulator.utils.config.DisplayConfig") as mock_display_config_class, \
-             patch("carla_simulator.utils.config.CameraConfig") as mock_camera_config_class, \
-             patch("carla_simulator.utils.config.WeatherConfig") as mock_weather_config_class, \
-             patch("carla_simulator.utils.config.CollisionConfig") as mock_collision_config_class, \
-             patch("carla_simulator.utils.config.GNSSConfig") as mock_gnss_config_class, \
-             patch("carla_simulator.utils.config.KeyboardConfig") as mock_keyboard_config_class, \
-             patch("carla_simulator.utils.config.VehicleConfig") as mock_vehicle_config_class, \
-             patch("carla_simulator.utils.config.ScenarioConfig") as mock_scenario_config_class, \
-             patch("carla_simulator.utils.config.Config") as mock_config_class:
-            
-            # Set up mock data with complete config structure
-            mock_config_data = {
-                "server": {
-                    "host": "localhost", 
-                    "port": 2000,
-                    "connection": {
-                        "max_retries": 3,
-                        "retry_delay": 1.0
-                    }
-                },
-                "world": {
-                    "map": "Town01"
-                },
-                "simulation": {
-                    "timeout": 30.0
-                },
-                "physics": {
-                    "max_substep_delta_time": 0.01,
-                    "max_substeps": 10
-                },
-                "traffic": {
-                    "distance_to_leading_vehicle": 5.0,
-                    "speed_difference_percentage": 20.0
-                },
-                "logging": {
-                    "log_level": "INFO",
-                    "enabled": True,
-                    "directory": "logs"
-                },
-                "display": {
-                    "width": 800,
-                    "height": 600,
-                    "fps": 30
-                },
-                "camera": {
-                    "enabled": True,
-                    "width": 800,
-                    "height": 600,
-                    "fov": 90,
-                    "x": 0.0,
-                    "y": 0.0,
-                    "z": 0.0
-                },
-                "lidar": {
-                    "enabled": True,
-                    "channels": 32,
-                    "range": 50.0,
-                    "x": 0.0,
-                    "y": 0.0,
-                    "z": 0.0
-                },
-                "radar": {
-                    "enabled": True,
-                    "range": 100.0,
-                    "x": 0.0,
-                    "y": 0.0,
-                    "z": 0.0
-                },
-                "gnss": {
-                    "enabled": True,
-                    "x": 0.0,
-                    "y": 0.0,
-                    "z": 0.0
-                },
-                "imu": {
-                    "enabled": True,
-                    "x": 0.0,
-                    "y": 0.0,
-                    "z": 0.0
-                },
-                "weather": {
-                    "cloudiness": 0.0,
-                    "precipitation": 0.0,
-                    "wind_intensity": 0.0
-                },
-                "collision": {
-                    "enabled": True
-                },
-                "gnss": {
-                    "enabled": True
-                },
-                "keyboard": {
-                    "forward": "w",
-                    "backward": "s",
-                    "left": "a",
-                    "right": "d",
-                    "brake": "space",
-                    "hand_brake": "q",
-                    "reverse": "r",
-                    "quit": "escape"
-                },
-                "vehicle": {
-                    "model": "vehicle.tesla.model3",
-                    "mass": 1500.0,
-                    "drag_coefficient": 0.3,
-                    "max_rpm": 5000.0,
-                    "moi": 1.0,
-                    "center_of_mass": [0.0, 0.0, 0.0]
-                },
-                "scenario": {
-                    "follow_route": True,
-                    "avoid_obstacle": True,
-                    "emergency_brake": True,
-                    "vehicle_cutting": True
-                }
-            }
-            
-            # Set up database mocks
-            mock_tenant_config_instance = MagicMock()
-            mock_tenant_config_class.return_value = mock_tenant_config_instance
-            mock_tenant_config_instance.get_active_config.return_value = mock_config_data
-            
-            mock_db_instance = MagicMock()
-            mock_db_class.return_value = mock_db_instance
-            
-            # Mock ALL config classes
-            mock_connection_config_instance = MagicMock()
-            mock_connection_config_class.return_value = mock_connection_config_instance
-            
-            mock_world_config_instance = MagicMock()
-            mock_world_config_class.return_value = mock_world_config_instance
-            
-            mock_simulation_config_instance = MagicMock()
-            mock_simulation_config_class.return_value = mock_simulation_config_instance
-            
-            mock_physics_config_instance = MagicMock()
-            mock_physics_config_class.return_value = mock_physics_config_instance
-            
-            mock_traffic_config_instance = MagicMock()
-            mock_traffic_config_class.return_value = mock_traffic_config_instance
-            
-            mock_logging_config_instance = MagicMock()
-            mock_logging_config_class.return_value = mock_logging_config_instance
-            
-            mock_display_config_instance = MagicMock()
-            mock_display_config_class.return_value = mock_display_config_instance
-            
-            mock_camera_config_instance = MagicMock()
-            mock_camera_config_class.return_value = mock_camera_config_instance
-            
-            mock_weather_config_instance = MagicMock()
-            mock_weather_config_class.return_value = mock_weather_config_instance
-            
-            mock_collision_config_instance = MagicMock()
-            mock_collision_config_class.return_value = mock_collision_config_instance
-            
-            mock_gnss_config_instance = MagicMock()
-            mock_gnss_config_class.return_value = mock_gnss_config_instance
-            
-            mock_keyboard_config_instance = MagicMock()
-            mock_keyboard_config_class.return_value = mock_keyboard_config_instance
-            
-            mock_vehicle_config_instance = MagicMock()
-            mock_vehicle_config_class.return_value = mock_vehicle_config_instance
-            
-            mock_scenario_config_instance = MagicMock()
-            mock_scenario_config_class.return_value = mock_scenario_config_instance
-            
-            # Mock the main Config class to return our mock data
-            mock_config_instance = MagicMock()
-            mock_config_class.return_value = mock_config_instance
-            # Make the config instance behave like a dictionary
-            mock_config_instance.__getitem__ = lambda self, key: mock_config_data[key]
-            mock_config_instance.__contains__ = lambda self, key: key in mock_config_data
-            mock_config_instance.get = lambda self, key, default=None: mock_config_data.get(key, default)
-            
-            # Test the load_config function with required config_path
-            config = load_config("test_config.yaml")
-            
-            # Verify config was loaded
-            assert config is not None
-            assert "server" in config
-            assert "simulation" in config
-            
-            # Verify database operations were called (only if they were actually called)
-            if mock_tenant_config_instance.get_active_config.call_count > 0:
-                mock_tenant_config_instance.get_active_config.assert_called_once()
-                print("✅ Database config was loaded")
-            else:
-                print("⚠️ Database config was not called (may use different method)")
-            
-            print("✅ load_config function working successfully with database-only approach")
-            
-    except ImportError as e:
-        pytest.skip(f"load_config function not available: {e}")
-    except Exception as e:
-        # Handle any other errors and provide useful feedback
-        print(f"⚠️ load_config function test failed: {e}")
-        pytest.skip(f"load_config function test failed: {e}")
-
-
-def test_default_config_values():
-    """Test default configuration values."""
-    from carla_simulator.utils.default_config import SIMULATION_CONFIG, LOGGING_CONFIG, DISPLAY_CONFIG
-    
-    # Check simulation defaults
-    assert "scenario" in SIMULATION_CONFIG
-    assert "debug" in SIMULATION_CONFIG
-    assert "web_mode" in SIMULATION_CONFIG
-    
-    # Check logging defaults
-    assert "log_level" in LOGGING_CONFIG
-    assert "enabled" in LOGGING_CONFIG
-    assert "directory" in LOGGING_CONFIG
-    
-    # Check display defaults
-    assert "width" in DISPLAY_CONFIG
-    assert "height" in DISPLAY_CONFIG
-    assert "fps" in DISPLAY_CONFIG
-
-
-# ========================= SCENARIO TESTS =========================
-
-def test_base_scenario():
-    """Test base scenario functionality with proper mocking."""
-    from carla_simulator.scenarios.base_scenario import BaseScenario
-    
-    # Test that BaseScenario can be imported and instantiated with proper mocking
-    try:
-        # Create mock dependencies
-        mock_world_manager = MagicMock()
-        mock_vehicle_controller = MagicMock()
-        mock_logger = MagicMock()
-        
-        # Mock the scenario methods
-        mock_world_manager.get_world.return_value = MagicMock()
-        mock_vehicle_controller.get_vehicle.return_value = MagicMock()
-        mock_logger.info.return_value = None
-        
-        # Create the scenario (without config argument)
-        scenario = BaseScenario(
-            world_manager=mock_world_manager,
-            vehicle_controller=mock_vehicle_controller,
-            logger=mock_logger
-        )
-        
-        # Verify the scenario was created
-        assert scenario is not None
-        assert scenario.world_manager == mock_world_manager
-        assert scenario.vehicle_controller == mock_vehicle_controller
-        assert scenario.logger == mock_logger
-        
-        # Test scenario methods (only if they exist)
-        if hasattr(scenario, 'setup'):
-            scenario.setup()
-            print("✅ BaseScenario setup method available")
-        
-        if hasattr(scenario, 'run'):
-            scenario.run()
-            print("✅ BaseScenario run method available")
-        else:
-            print("⚠️ BaseScenario run method not available")
-        
-        if hasattr(scenario, 'cleanup'):
-            scenario.cleanup()
-            print("✅ BaseScenario cleanup method available")
-        
-        print("✅ BaseScenario created successfully with proper mocking")
-        
-    except ImportError as e:
-        pytest.skip(f"BaseScenario not available: {e}")
-    except TypeError as e:
-        # Handle missing constructor arguments
-        print(f"⚠️ BaseScenario requires arguments: {e}")
-        pytest.skip(f"BaseScenario requires specific arguments: {e}")
-
-
-def test_follow_route_scenario():
-    """Test follow route scenario with proper testing."""
-    from carla_simulator.scenarios.follow_route_scenario import FollowRouteScenario
-    
-    # Test that FollowRouteScenario can be imported and has expected structure
-    try:
-        assert FollowRouteScenario is not None
-        
-        # Test that it's a class
-        assert isinstance(FollowRouteScenario, type)
-        
-        # Test that it has expected attributes/methods
-        assert hasattr(FollowRouteScenario, '__init__')
-        
-        # Test class attributes if they exist
-        if hasattr(FollowRouteScenario, 'name'):
-            print(f"✅ FollowRouteScenario has name: {FollowRouteScenario.name}")
-        
-        if hasattr(FollowRouteScenario, 'description'):
-            print(f"✅ FollowRouteScenario has description: {FollowRouteScenario.description}")
-        
-        print("✅ FollowRouteScenario imported and analyzed successfully")
-        
-    except ImportError as e:
-        pytest.skip(f"FollowRouteScenario not available: {e}")
-
-
-def test_avoid_obstacle_scenario():
-    """Test avoid obstacle scenario with proper testing."""
-    from carla_simulator.scenarios.avoid_obstacle_scenario import AvoidObstacleScenario
-    
-    # Test that AvoidObstacleScenario can be imported and has expected structure
-    try:
-        assert AvoidObstacleScenario is not None
-        
-        # Test that it's a class
-        assert isinstance(AvoidObstacleScenario, type)
-        
-        # Test that it has expected attributes/methods
-        assert hasattr(AvoidObstacleScenario, '__init__')
-        
-        # Test class attributes if they exist
-        if hasattr(AvoidObstacleScenario, 'name'):
-            print(f"✅ AvoidObstacleScenario has name: {AvoidObstacleScenario.name}")
-        
-        if hasattr(AvoidObstacleScenario, 'description'):
-            print(f"✅ AvoidObstacleScenario has description: {AvoidObstacleScenario.description}")
-        
-        # Test for scenario-specific methods
-        expected_methods = ['setup', 'run', 'cleanup', 'avoid_obstacle']
-        for method in expected_methods:
-            if hasattr(AvoidObstacleScenario, method):
-                print(f"✅ AvoidObstacleScenario has {method} method")
-        
-        print("✅ AvoidObstacleScenario imported and analyzed successfully")
-        
-    except ImportError as e:
-        pytest.skip(f"AvoidObstacleScenario not available: {e}")
-
-
-def test_emergency_brake_scenario():
-    """Test emergency brake scenario with proper testing."""
-    from carla_simulator.scenarios.emergency_brake_scenario import EmergencyBrakeScenario
-    
-    # Test that EmergencyBrakeScenario can be imported and has expected structure
-    try:
-        assert EmergencyBrakeScenario is not None
-        
-        # Test that it's a class
-        assert isinstance(EmergencyBrakeScenario, type)
-        
-        # Test that it has expected attributes/methods
-        assert hasattr(EmergencyBrakeScenario, '__init__')
-        
-        # Test class attributes if they exist
-        if hasattr(EmergencyBrakeScenario, 'name'):
-            print(f"✅ EmergencyBrakeScenario has name: {EmergencyBrakeScenario.name}")
-        
-        if hasattr(EmergencyBrakeScenario, 'description'):
-            print(f"✅ EmergencyBrakeScenario has description: {EmergencyBrakeScenario.description}")
-        
-        # Test for scenario-specific methods
-        expected_methods = ['setup', 'run', 'cleanup', 'emergency_brake']
-        for method in expected_methods:
-            if hasattr(EmergencyBrakeScenario, method):
-                print(f"✅ EmergencyBrakeScenario has {method} method")
-        
-        print("✅ EmergencyBrakeScenario imported and analyzed successfully")
-        
-    except ImportError as e:
-        pytest.skip(f"EmergencyBrakeScenario not available: {e}")
-
-
-def test_vehicle_cutting_scenario():
-    """Test vehicle cutting scenario with proper testing."""
-    from carla_simulator.scenarios.vehicle_cutting_scenario import VehicleCuttingScenario
-    
-    # Test that VehicleCuttingScenario can be imported and has expected structure
-    try:
-        assert VehicleCuttingScenario is not None
-        
-        # Test that it's a class
-        assert isinstance(VehicleCuttingScenario, type)
-        
-        # Test that it has expected attributes/methods
-        assert hasattr(VehicleCuttingScenario, '__init__')
-        
-        # Test class attributes if they exist
-        if hasattr(VehicleCuttingScenario, 'name'):
-            print(f"✅ VehicleCuttingScenario has name: {VehicleCuttingScenario.name}")
-        
-        if hasattr(VehicleCuttingScenario, 'description'):
-            print(f"✅ VehicleCuttingScenario has description: {VehicleCuttingScenario.description}")
-        
-        # Test for scenario-specific methods
-        expected_methods = ['setup', 'run', 'cleanup', 'handle_vehicle_cutting']
-        for method in expected_methods:
-            if hasattr(VehicleCuttingScenario, method):
-                print(f"✅ VehicleCuttingScenario has {method} method")
-        
-        print("✅ VehicleCuttingScenario imported and analyzed successfully")
-        
-    except ImportError as e:
-        pytest.skip(f"VehicleCuttingScenario not available: {e}")
-
-
-# ========================= UTILITY TESTS =========================
-
-def test_logger_initialization():
-    """Test logger initialization with proper mocking."""
-    from carla_simulator.utils.logging import Logger
-    
-    # Test that Logger can be imported and instantiated with proper mocking
-    try:
-        # Mock database dependencies
-        with patch("carla_simulator.database.db_manager.DatabaseManager") as mock_db_class, \
-             patch("carla_simulator.database.models.AppLog") as mock_app_log_class:
-            
-            # Set up mock instances
-            mock_db_instance = MagicMock()
-            mock_db_class.return_value = mock_db_instance
-            
-            mock_app_log_instance = MagicMock()
-            mock_app_log_class.return_value = mock_app_log_instance
-            
-            # Create the logger
-            logger = Logger()
-            
-            # Verify the logger was created
-            assert logger is not None
-            
-            # Test logger methods
-            logger.info("Test info message")
-            logger.error("Test error message")
-            logger.warning("Test warning message")
-            logger.debug("Test debug message")
-            
-            # Verify methods exist and can be called
-            assert hasattr(logger, 'info')
-            assert hasattr(logger, 'error')
-            assert hasattr(logger, 'warning')
-            assert hasattr(logger, 'debug')
-            
-            print("✅ Logger initialized successfully with proper mocking")
-            
-    except ImportError as e:
-        pytest.skip(f"Logger not available: {e}")
-    except TypeError as e:
-        # Handle missing constructor arguments
-        print(f"⚠️ Logger requires arguments: {e}")
-        pytest.skip(f"Logger requires specific arguments: {e}")
-
-
-def test_logger_debug_mode():
-    """Test logger debug mode."""
-    from carla_simulator.utils.logging import Logger
-    
-    # Test that Logger can be imported and debug mode can be set
-    try:
-        logger = Logger()
-        logger.set_debug_mode(True)
-        assert logger is not None
-        print("✅ Logger debug mode set successfully")
-    except ImportError as e:
-        pytest.skip(f"Logger not available: {e}")
-
-
-def test_paths_utilities():
-    """Test path utility functions."""
-    from carla_simulator.utils.paths import get_project_root, get_config_path
-    
-    # Test that path utilities can be imported and used
-    try:
-        root = get_project_root()
-        config_path = get_config_path()
-        
-        assert root is not None
-        assert config_path is not None
-        print("✅ Path utilities working successfully")
-    except ImportError as e:
-        pytest.skip(f"Path utilities not available: {e}")
-
-
-def test_auth_utilities():
-    """Test authentication utility functions with proper testing."""
-    from carla_simulator.utils.auth import hash_password, verify_password, create_jwt_token, verify_jwt_token
-    
-    # Test that auth utilities can be imported and used with proper testing
-    try:
-        # Test password hashing
-        test_password = "testpass123"
-        password_hash = hash_password(test_password)
-        assert password_hash is not None
-        assert password_hash != test_password  # Should be hashed, not plain text
-        assert len(password_hash) > 0
-        
-        # Test password verification with correct password
-        is_valid = verify_password(test_password, password_hash)
-        assert is_valid is True
-        
-        # Test password verification with wrong password
-        is_invalid = verify_password("wrongpass", password_hash)
-        assert is_invalid is False
-        
-        # Test JWT creation
-        test_payload = {"user_id": 123, "username": "testuser"}
-        token = create_jwt_token(test_payload)
-        assert token is not None
-        assert isinstance(token, str)
-        assert len(token) > 0
-        
-        # Test JWT verification
-        payload = verify_jwt_token(token)
-        assert payload is not None
-        assert payload["user_id"] == 123
-        assert payload["username"] == "testuser"
-        
-        # Test JWT verification with invalid token
-        try:
-            invalid_payload = verify_jwt_token("invalid_token")
-            assert False, "Should have raised an exception for invalid token"
-        except Exception:
-            # Expected behavior for invalid token
-            pass
-        
-        print("✅ Auth utilities working successfully with proper testing")
-        
-    except ImportError as e:
-        pytest.skip(f"Auth utilities not available: {e}")
-    except Exception as e:
-        # Handle any other errors and provide useful feedback
-        print(f"⚠️ Auth utilities test failed: {e}")
-        pytest.skip(f"Auth utilities test failed: {e}")
-
-
-# ========================= DATABASE MODEL TESTS =========================
-
-def test_user_model():
-    """Test User database model with proper mocking."""
-    from carla_simulator.database.models import User
-    
-    # Test that User model can be imported and used with proper mocking
-    try:
-        # Mock database dependencies
-        with patch("carla_simulator.database.db_manager.DatabaseManager") as mock_db_class:
-            
-            # Set up mock database instance
-            mock_db_instance = MagicMock()
-            mock_db_class.return_value = mock_db_instance
-            
-            # Mock database operations
-            mock_db_instance.execute_query.return_value = [
-                {"id": 1, "username": "testuser", "email": "test@example.com"}
-            ]
-            mock_db_instance.execute_many.return_value = None
-            
-            # Test User model methods
-            assert User is not None
-            
-            # Test user creation
-            user_data = {
-                "username": "testuser",
-                "email": "test@example.com",
-                "password_hash": "hashed_password"
-            }
-            
-            # Test that User model has expected methods (only check for create)
-            assert hasattr(User, 'create')
-            
-            # Test user creation with mock database
-            result = User.create(mock_db_instance, **user_data)
-            
-            # Verify database was called
-            mock_db_instance.execute_query.assert_called()
-            
-            print("✅ User model tested successfully with proper mocking")
-            
-    except ImportError as e:
-        pytest.skip(f"User model not available: {e}")
-    except Exception as e:
-        # Handle any other errors and provide useful feedback
-        print(f"⚠️ User model test failed: {e}")
-        pytest.skip(f"User model test failed: {e}")
-        
-        # Test completed successfully
-
-
-def test_tenant_model():
-    """Test Tenant database model."""
-    from carla_simulator.database.models import Tenant
-    
-    # Test that Tenant model can be imported
-    try:
-        assert Tenant is not None
-        print("✅ Tenant model imported successfully")
-    except ImportError as e:
-        pytest.skip(f"Tenant model not available: {e}")
-
-
-def test_tenant_config_model():
-    """Test TenantConfig database model."""
-    from carla_simulator.database.models import TenantConfig
-    
-    # Test that TenantConfig model can be imported
-    try:
-        assert TenantConfig is not None
-        print("✅ TenantConfig model imported successfully")
-    except ImportError as e:
-        pytest.skip(f"TenantConfig model not available: {e}")
-
-
-def test_database_manager():
-    """Test DatabaseManager functionality."""
-    from carla_simulator.database.db_manager import DatabaseManager
-    
-    # Test that DatabaseManager can be imported
-    try:
-        assert DatabaseManager is not None
-        print("✅ DatabaseManager imported successfully")
-    except ImportError as e:
-        pytest.skip(f"DatabaseManager not available: {e}")
-
-
-# ========================= METRICS TESTS =========================
-
-def test_metrics_functionality():
-    """Test metrics functionality with proper testing."""
-    from carla_simulator.metrics import SimulationMetricsData
-    
-    # Test that SimulationMetricsData can be imported and has expected structure
-    try:
-        assert SimulationMetricsData is not None
-        
-        # Test that it's a class
-        assert isinstance(SimulationMetricsData, type)
-        
-        # Test that it has expected attributes
-        expected_fields = ['scenario_id', 'session_id', 'timestamp', 'elapsed_time', 'speed']
-        for field in expected_fields:
-            if hasattr(SimulationMetricsData, field):
-                print(f"✅ SimulationMetricsData has {field} field")
-        
-        # Test class methods
-        if hasattr(SimulationMetricsData, 'from_simulation_data'):
-            print("✅ SimulationMetricsData has from_simulation_data method")
-        
-        # Test creating an instance
-        metrics = SimulationMetricsData()
-        assert metrics is not None
-        assert hasattr(metrics, 'scenario_id')
-        assert hasattr(metrics, 'speed')
-        
-        print("✅ SimulationMetricsData imported and tested successfully")
-        
-    except ImportError as e:
-        pytest.skip(f"SimulationMetricsData not available: {e}")
-
-
-# ========================= CONTROL INTERFACE TESTS =========================
-
-def test_vehicle_controller():
-    """Test vehicle controller functionality with proper testing."""
-    from carla_simulator.control.vehicle_controller import VehicleController
-    
-    # Test that VehicleController can be imported and has expected structure
-    try:
-        assert VehicleController is not None
-        
-        # Test that it's a class
-        assert isinstance(VehicleController, type)
-        
-        # Test that it has expected attributes/methods
-        assert hasattr(VehicleController, '__init__')
-        
-        # Test for common vehicle controller methods
-        expected_methods = ['apply_control', 'get_vehicle', 'set_vehicle']
-        for method in expected_methods:
-            if hasattr(VehicleController, method):
-                print(f"✅ VehicleController has {method} method")
-        
-        print("✅ VehicleController imported and analyzed successfully")
-        
-    except ImportError as e:
-        pytest.skip(f"VehicleController not available: {e}")
-        
-        # Test completed successfully
-
-
-def test_keyboard_controller():
-    """Test keyboard controller functionality with proper testing."""
-    from carla_simulator.control.keyboard import KeyboardControl
-    
-    # Test that KeyboardControl can be imported and has expected structure
-    try:
-        assert KeyboardControl is not None
-        
-        # Test that it's a class
-        assert isinstance(KeyboardControl, type)
-        
-        # Test that it has expected attributes/methods
-        assert hasattr(KeyboardControl, '__init__')
-        
-        # Test for common keyboard control methods
-        expected_methods = ['process_events', '_handle_key_down', '_handle_key_up', '_setup_control_mapping']
-        for method in expected_methods:
-            if hasattr(KeyboardControl, method):
-                print(f"✅ KeyboardControl has {method} method")
-        
-        # Test creating an instance with mock config
-        mock_config = {
-            "throttle_up": "w",
-            "throttle_down": "s", 
-            "steer_left": "a",
-            "steer_right": "d",
-            "brake": "space",
-            "hand_brake": "q",
-            "reverse": "r"
-        }
-        
-        try:
-            controller = KeyboardControl(mock_config)
-            assert controller is not None
-            assert hasattr(controller, 'config')
-            assert hasattr(controller, 'control_state')
-            print("✅ KeyboardControl instance created successfully")
-        except Exception as e:
-            print(f"⚠️ KeyboardControl instantiation failed: {e}")
-        
-        print("✅ KeyboardControl imported and analyzed successfully")
-        
-    except ImportError as e:
-        pytest.skip(f"KeyboardControl not available: {e}")
-
-
-def test_keyboard_controller_error_handling():
-    """Test keyboard controller error handling for web mode."""
-    from carla_simulator.control.controller import KeyboardController
-    from carla_simulator.utils.config import ControllerConfig, KeyboardConfig
-    
-    # Test that KeyboardController properly handles web mode errors
-    try:
-        # Create a mock controller config with required parameters
-        keyboard_config = KeyboardConfig(
-            forward=["w", "up"],
-            backward=["s", "down"],
-            left=["a", "left"],
-            right=["d", "right"],
-            brake=["space"],
-            hand_brake=["q"],
-            reverse=["r"],
-            quit=["escape"]
-        )
-        
-        mock_config = ControllerConfig(
-            type="keyboard",
-            steer_speed=1.0,
-            throttle_speed=1.0,
-            brake_speed=1.0,
-            keyboard=keyboard_config
-        )
-        
-        # Test that the error message is clear for web mode
-        # This test verifies that the error handling is in place
-        # The actual pygame initialization error would occur in a headless environment
-        print("✅ KeyboardController error handling test completed")
-        
-    except ImportError as e:
-        pytest.skip(f"KeyboardController not available: {e}")
-
-
-# ========================= VISUALIZATION TESTS =========================
-
-def test_display_manager():
-    """Test display manager functionality with proper testing."""
-    from carla_simulator.visualization.display_manager import DisplayManager
-    
-    # Test that DisplayManager can be imported and has expected structure
-    try:
-        assert DisplayManager is not None
-        
-        # Test that it's a class
-        assert isinstance(DisplayManager, type)
-        
-        # Test that it has expected attributes/methods
-        assert hasattr(DisplayManager, '__init__')
-        
-        # Test for common display manager methods
-        expected_methods = ['render_frame', 'update', 'close', 'get_current_frame']
-        for method in expected_methods:
-            if hasattr(DisplayManager, method):
-                print(f"✅ DisplayManager has {method} method")
-        
-        # Test creating an instance with mock config
-        mock_config = {"width": 800, "height": 600, "fps": 30}
-        
-        try:
-            display = DisplayManager(mock_config)
-            assert display is not None
-            assert hasattr(display, 'config')
-            print("✅ DisplayManager instance created successfully")
-        except Exception as e:
-            print(f"⚠️ DisplayManager instantiation failed: {e}")
-        
-        print("✅ DisplayManager imported and analyzed successfully")
-        
-    except ImportError as e:
-        pytest.skip(f"DisplayManager not available: {e}")
-
-
-def test_camera_manager():
-    """Test camera manager functionality with proper testing."""
-    from carla_simulator.visualization.camera import CameraManager
-    
-    # Test that CameraManager can be imported and has expected structure
-    try:
-        assert CameraManager is not None
-        
-        # Test that it's a class
-        assert isinstance(CameraManager, type)
-        
-        # Test that it has expected attributes/methods
-        assert hasattr(CameraManager, '__init__')
-        
-        # Test for common camera manager methods
-        expected_methods = ['get_image', 'update', 'close', 'get_sensor_data']
-        for method in expected_methods:
-            if hasattr(CameraManager, method):
-                print(f"✅ CameraManager has {method} method")
-        
-        # Test creating an instance with mock parameters
-        mock_parent_actor = MagicMock()
-        mock_config = {"fov": 90, "image_size_x": 800, "image_size_y": 600}
-        
-        try:
-            camera = CameraManager(mock_parent_actor, mock_config)
-            assert camera is not None
-            assert hasattr(camera, 'config')
-            print("✅ CameraManager instance created successfully")
-        except Exception as e:
-            print(f"⚠️ CameraManager instantiation failed: {e}")
-        
-        print("✅ CameraManager imported and analyzed successfully")
-        
-    except ImportError as e:
-        pytest.skip(f"CameraManager not available: {e}")
-
-
-def test_web_display_manager():
-    """Test web display manager functionality with proper testing."""
-    from carla_simulator.visualization.web_display_manager import WebDisplayManager
-    
-    # Test that WebDisplayManager can be imported and has expected structure
-    try:
-        assert WebDisplayManager is not None
-        
-        # Test that it's a class
-        assert isinstance(WebDisplayManager, type)
-        
-        # Test that it has expected attributes/methods
-        assert hasattr(WebDisplayManager, '__init__')
-        
-        # Test for common web display manager methods
-        expected_methods = ['get_current_frame', 'update', 'start_server', 'stop_server']
-        for method in expected_methods:
-            if hasattr(WebDisplayManager, method):
-                print(f"✅ WebDisplayManager has {method} method")
-        
-        # Test creating an instance with mock config
-        mock_config = {"port": 8080, "host": "localhost"}
-        
-        try:
-            web_display = WebDisplayManager(mock_config)
-            assert web_display is not None
-            assert hasattr(web_display, 'config')
-            print("✅ WebDisplayManager instance created successfully")
-        except Exception as e:
-            print(f"⚠️ WebDisplayManager instantiation failed: {e}")
-        
-        print("✅ WebDisplayManager imported and analyzed successfully")
-        
-    except ImportError as e:
-        pytest.skip(f"WebDisplayManager not available: {e}")
-
-
-# ========================= CLI TESTS =========================
-
-def test_cli_interface():
-    """Test CLI interface functionality with proper testing."""
-    from carla_simulator.cli import main
-    
-    # Test that CLI main function can be imported and has expected structure
-    try:
-        assert main is not None
-        
-        # Test that it's a callable function
-        assert callable(main)
-        
-        # Test function signature
-        import inspect
-        sig = inspect.signature(main)
-        print(f"✅ CLI main function signature: {sig}")
-        
-        print("✅ CLI main function imported and analyzed successfully")
-        
-    except ImportError as e:
-        pytest.skip(f"CLI main function not available: {e}")
-
-
-# ========================= INTEGRATION TESTS =========================
-
-def test_full_simulation_workflow(mock_carla_modules):
-    """Test full simulation workflow integration with proper testing."""
-    from carla_simulator.core.simulation_runner import SimulationRunner
-    
-    # Test that SimulationRunner can be imported and has expected structure
-    try:
-        assert SimulationRunner is not None
-        
-        # Check if it's mocked (MagicMock) or actual class
-        if hasattr(SimulationRunner, '_mock_name'):
-            # It's a mock, test mock behavior
-            print(f"✅ SimulationRunner is mocked: {SimulationRunner._mock_name}")
-            
-            # Test that mock can be called
-            mock_instance = SimulationRunner()
-            assert mock_instance is not None
-            
-            # Test common methods on mock
-            expected_methods = ['setup_logger', 'register_scenarios', 'create_application', 'setup_components', 'run']
-            for method in expected_methods:
-                if hasattr(mock_instance, method):
-                    print(f"✅ Mock SimulationRunner has {method} method")
-            
-        else:
-            # It's a real class, test class behavior
-            assert isinstance(SimulationRunner, type)
-            assert hasattr(SimulationRunner, '__init__')
-            
-            # Test for common simulation runner methods
-            expected_methods = ['setup_logger', 'register_scenarios', 'create_application', 'setup_components', 'run']
-            for method in expected_methods:
-                if hasattr(SimulationRunner, method):
-                    print(f"✅ SimulationRunner has {method} method")
-        
-        print("✅ SimulationRunner imported and analyzed successfully")
-        
-    except ImportError as e:
-        pytest.skip(f"SimulationRunner not available: {e}")
-
-
-def test_scenario_execution_flow(mock_carla_modules):
-    """Test scenario execution flow."""
-    from carla_simulator.scenarios.follow_route_scenario import FollowRouteScenario
-    
-    # Test that FollowRouteScenario can be imported
-    try:
-        assert FollowRouteScenario is not None
-        print("✅ Scenario execution flow test passed")
-    except ImportError as e:
-        pytest.skip(f"FollowRouteScenario not available: {e}")
-
-
-# ========================= ERROR HANDLING TESTS =========================
-
-def test_configuration_error_handling():
-    """Test configuration error handling with proper testing."""
-    from carla_simulator.utils.config import ConfigLoader
-    
-    # Test that ConfigLoader can be imported and has expected structure
-    try:
-        assert ConfigLoader is not None
-        
-        # Test that it's a class
-        assert isinstance(ConfigLoader, type)
-        
-        # Test that it has expected attributes/methods
-        assert hasattr(ConfigLoader, '__init__')
-        
-        # Test for common config loader methods
-        expected_methods = ['get_config', 'load_config', 'validate_config']
-        for method in expected_methods:
-            if hasattr(ConfigLoader, method):
-                print(f"✅ ConfigLoader has {method} method")
-        
-        print("✅ Configuration error handling test passed with proper analysis")
-        
-    except ImportError as e:
-        pytest.skip(f"ConfigLoader not available: {e}")
-
-
-def test_scenario_error_handling():
-    """Test scenario error handling with proper testing."""
-    from carla_simulator.scenarios.base_scenario import BaseScenario
-    
-    # Test that BaseScenario can be imported and has expected structure
-    try:
-        assert BaseScenario is not None
-        
-        # Test that it's a class
-        assert isinstance(BaseScenario, type)
-        
-        # Test that it has expected attributes/methods
-        assert hasattr(BaseScenario, '__init__')
-        
-        # Test for common scenario methods
-        expected_methods = ['setup', 'run', 'cleanup', 'validate']
-        for method in expected_methods:
-            if hasattr(BaseScenario, method):
-                print(f"✅ BaseScenario has {method} method")
-        
-        print("✅ Scenario error handling test passed with proper analysis")
-        
-    except ImportError as e:
-        pytest.skip(f"BaseScenario not available: {e}")
-
-
-def test_database_connection_error():
-    """Test database connection error handling with proper testing."""
-    from carla_simulator.database.db_manager import DatabaseManager
-    
-    # Test that DatabaseManager can be imported and has expected structure
-    try:
-        assert DatabaseManager is not None
-        
-        # Test that it's a class
-        assert isinstance(DatabaseManager, type)
-        
-        # Test that it has expected attributes/methods
-        assert hasattr(DatabaseManager, '__init__')
-        
-        # Test for common database manager methods
-        expected_methods = ['execute_query', 'execute_many', 'get_connection', 'close']
-        for method in expected_methods:
-            if hasattr(DatabaseManager, method):
-                print(f"✅ DatabaseManager has {method} method")
-        
-        print("✅ Database connection error handling test passed with proper analysis")
-        
-    except ImportError as e:
-        pytest.skip(f"DatabaseManager not available: {e}")
-
-
-# ========================= PERFORMANCE TESTS =========================
-
-def test_scenario_performance():
-    """Test scenario performance characteristics with proper testing."""
-    from carla_simulator.scenarios.follow_route_scenario import FollowRouteScenario
-    
-    # Test that FollowRouteScenario can be imported and has expected structure
-    try:
-        assert FollowRouteScenario is not None
-        
-        # Test that it's a class
-        assert isinstance(FollowRouteScenario, type)
-        
-        # Test that it has expected attributes/methods
-        assert hasattr(FollowRouteScenario, '__init__')
-        
-        # Test for common scenario methods
-        expected_methods = ['setup', 'run', 'cleanup', 'follow_route']
-        for method in expected_methods:
-            if hasattr(FollowRouteScenario, method):
-                print(f"✅ FollowRouteScenario has {method} method")
-        
-        print("✅ Scenario performance test passed with proper analysis")
-        
-    except ImportError as e:
-        pytest.skip(f"FollowRouteScenario not available: {e}")
-
-
-def test_concurrent_scenario_execution():
-    """Test concurrent scenario execution with proper testing."""
-    from carla_simulator.scenarios.follow_route_scenario import FollowRouteScenario
-    
-    # Test that FollowRouteScenario can be imported and has expected structure
-    try:
-        assert FollowRouteScenario is not None
-        
-        # Test that it's a class
-        assert isinstance(FollowRouteScenario, type)
-        
-        # Test that it has expected attributes/methods
-        assert hasattr(FollowRouteScenario, '__init__')
-        
-        # Test for common scenario methods
-        expected_methods = ['setup', 'run', 'cleanup', 'follow_route']
-        for method in expected_methods:
-            if hasattr(FollowRouteScenario, method):
-                print(f"✅ FollowRouteScenario has {method} method")
-        
-        print("✅ Concurrent scenario execution test passed with proper analysis")
-        
-    except ImportError as e:
-        pytest.skip(f"FollowRouteScenario not available: {e}")
+"""
+Unit tests for core CARLA simulator functionality.
+"""
+
+import os
+import pytest
+from unittest.mock import patch, MagicMock, AsyncMock, mock_open
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+
+# ========================= CARLA SIMULATOR CORE TESTS =========================
+
+# Add timeout to all tests - increased for stability
+pytestmark = pytest.mark.timeout(10)
+
+@pytest.fixture
+def mock_carla_modules():
+    """Mock all CARLA-related modules."""
+    # Create mock instances
+    mock_runner_instance = MagicMock()
+    mock_app_instance = MagicMock()
+    mock_world_instance = MagicMock()
+    mock_sensors_instance = MagicMock()
+    mock_vehicle_instance = MagicMock()
+    mock_registry_instance = MagicMock()
+    mock_logger_instance = MagicMock()
+    mock_uuid = uuid.uuid4()
+    
+    # Mock config
+    mock_config = {
+        "server": {"host": "localhost", "port": 2000},
+        "world": {"map": "Town01"},
+        "simulation": {"timeout": 30.0},
+        "physics": {
+            "max_substep_delta_time": 0.01,
+            "max_substeps": 10
+        },
+        "traffic": {
+            "distance_to_leading_vehicle": 5.0,
+            "speed_difference_percentage": 20.0,
+            "ignore_lights_percentage": 0.0,
+            "ignore_signs_percentage": 0.0
+        }
+    }
+    
+    # Mock database models
+    mock_tenant_config = MagicMock()
+    mock_tenant_config.get_active_config.return_value = mock_config
+    
+    # Mock database manager
+    mock_db_manager = MagicMock()
+    mock_db_manager.get_carla_metadata.return_value = {
+        "version": "0.10.0",
+        "maps": ["Town01", "Town02"],
+        "vehicles": ["vehicle.tesla.model3"],
+        "sensors": ["sensor.camera.rgb"]
+    }
+    
+    # Set up mock patches
+    with patch("carla_simulator.core.simulation_runner.SimulationRunner", return_value=mock_runner_instance) as mock_runner, \
+         patch("carla_simulator.core.simulation_application.SimulationApplication", return_value=mock_app_instance) as mock_app, \
+         patch("carla_simulator.core.world_manager.WorldManager", return_value=mock_world_instance) as mock_world, \
+         patch("carla_simulator.core.sensors.SensorManager", return_value=mock_sensors_instance) as mock_sensors, \
+         patch("carla_simulator.core.vehicle_controller.VehicleController", return_value=mock_vehicle_instance) as mock_vehicle, \
+         patch("carla_simulator.scenarios.scenario_registry.ScenarioRegistry", return_value=mock_registry_instance) as mock_registry, \
+         patch("carla_simulator.utils.logging.Logger", return_value=mock_logger_instance) as mock_logger, \
+         patch("uuid.uuid4", return_value=mock_uuid) as mock_uuid4, \
+         patch("carla_simulator.database.models.TenantConfig", return_value=mock_tenant_config) as mock_tenant_config_class, \
+         patch("carla_simulator.database.db_manager.DatabaseManager", return_value=mock_db_manager) as mock_db_manager_class:
+        
+        # Set up mock behaviors
+        mock_runner_instance.setup_logger.return_value = None
+        mock_runner_instance.register_scenarios.return_value = None
+        mock_runner_instance.create_application.return_value = mock_app_instance
+        mock_runner_instance.setup_components.return_value = {
+            "world_manager": mock_world_instance,
+            "sensor_manager": mock_sensors_instance,
+            "vehicle_controller": mock_vehicle_instance,
+            "display_manager": MagicMock()
+        }
+        mock_runner_instance.config = mock_config
+        mock_runner_instance.logger = mock_logger_instance
+        mock_runner_instance.session_id = mock_uuid
+        
+        mock_registry_instance.get_available_scenarios.return_value = [
+            "follow_route",
+            "avoid_obstacle", 
+            "emergency_brake",
+            "vehicle_cutting"
+        ]
+        
+        mock_logger_instance.set_debug_mode.return_value = None
+        mock_logger_instance.close.return_value = None
+        
+        yield {
+            "runner": mock_runner,
+            "app": mock_app,
+            "world": mock_world,
+            "sensors": mock_sensors,
+            "vehicle": mock_vehicle,
+            "registry": mock_registry,
+            "runner_instance": mock_runner_instance,
+            "app_instance": mock_app_instance,
+            "world_instance": mock_world_instance,
+            "sensors_instance": mock_sensors_instance,
+            "vehicle_instance": mock_vehicle_instance,
+            "registry_instance": mock_registry_instance,
+            "logger": mock_logger,
+            "logger_instance": mock_logger_instance,
+            "uuid4": mock_uuid4,
+            "uuid": mock_uuid,
+            "tenant_config": mock_tenant_config,
+            "tenant_config_class": mock_tenant_config_class,
+            "db_manager": mock_db_manager,
+            "db_manager_class": mock_db_manager_class
+        }
+
+
+def _simulation_config_dict():
+    """Complete simulation config, as the runner would load it."""
+    colors = {"target": "#FF0000", "vehicle": "#00FF00", "text": "#FFFFFF", "background": "#000000"}
+    route = {"num_waypoints": 3, "waypoint_tolerance": 5.0, "min_distance": 50.0, "max_distance": 100.0}
+    shared = {
+        "target_distance": 100.0, "completion_distance": 110.0, "collision_threshold": 1.0,
+        "max_simulation_time": 120.0, "waypoint_tolerance": 5.0, "min_waypoint_distance": 30.0,
+        "max_waypoint_distance": 50.0, "num_waypoints": 3,
+    }
+    return {
+        "server": {"host": "localhost", "port": 2000, "timeout": 10.0,
+                   "connection": {"max_retries": 1, "retry_delay": 0.0}},
+        "world": {
+            "map": "Town01", "weather": {}, "physics": {"max_substep_delta_time": 0.01, "max_substeps": 10},
+            "traffic": {"distance_to_leading_vehicle": 5.0, "speed_difference_percentage": 20.0,
+                        "ignore_lights_percentage": 0.0, "ignore_signs_percentage": 0.0},
+            "fixed_delta_seconds": 0.05, "target_distance": 500.0, "num_vehicles": 0,
+            "enable_collision": False, "synchronous_mode": True,
+        },
+        "simulation": {"max_speed": 50.0, "simulation_time": 60, "update_rate": 30.0,
+                       "speed_change_threshold": 1.0, "position_change_threshold": 1.0,
+                       "heading_change_threshold": 1.0, "target_tolerance": 2.0,
+                       "max_collision_force": 1000.0},
+        "logging": {"log_level": "INFO", "enabled": True, "directory": "logs"},
+        "display": {
+            "width": 640, "height": 480, "fps": 30, "hud_enabled": True, "minimap_enabled": True,
+            "hud": {"font_size": 14, "font_name": "arial", "alpha": 200, "colors": colors},
+            "minimap": {"width": 100, "height": 100, "scale": 0.1, "alpha": 200, "colors": colors},
+            "camera": {"font_size": 14, "font_name": "arial"},
+        },
+        "sensors": {"camera": {"enabled": True}},
+        "controller": {
+            "type": "autopilot", "steer_speed": 1.0, "throttle_speed": 1.0, "brake_speed": 1.0,
+            "keyboard": {key: [] for key in ("forward", "backward", "left", "right", "brake",
+                                            "hand_brake", "reverse", "quit")},
+        },
+        "vehicle": {"model": "vehicle.tesla.model3", "mass": 1500.0, "drag_coefficient": 0.3,
+                    "max_rpm": 6000.0, "moi": 1.0, "center_of_mass": [0.0, 0.0, 0.0]},
+        "scenarios": {
+            "follow_route": route,
+            "avoid_obstacle": dict(shared, obstacle_spacing=25.0, num_obstacles=3,
+                                   min_obstacle_distance=20.0, obstacle_types=["static.prop.trafficcone01"]),
+            "emergency_brake": {"trigger_distance": 15.0, "target_speed": 30.0,
+                                "obstacle_type": "static.prop.streetbarrier01"},
+            "vehicle_cutting": dict(shared, cutting_distance=20.0, cutting_vehicle_model="vehicle.tesla.model3",
+                                    normal_speed=30.0, cutting_speed=40.0, cutting_trigger_distance=15.0),
+        },
+    }
+
+
+@pytest.fixture
+def simulation_app():
+    """SimulationApplication built through its constructor with a mocked client."""
+    from carla_simulator.core.simulation_application import SimulationApplication
+
+    return SimulationApplication(
+        "simulation.yaml",
+        scenario="follow_route",
+        session_id=uuid.uuid4(),
+        logger=MagicMock(),
+        config_dict=_simulation_config_dict(),
+        client=MagicMock(),
+    )
+
+
+@pytest.fixture
+def make_world_manager():
+    """Build WorldManagers through their constructor against a mocked client and world."""
+    from carla_simulator.core.world_manager import WorldManager
+    from carla_simulator.core.simulation_components import SimulationConfig
+
+    config = SimulationConfig("simulation.yaml", config_dict=_simulation_config_dict())
+
+    def make(world=None, client=None, server=None):
+        client = client or MagicMock()
+        if world is not None:
+            client.get_world.return_value = world
+        return WorldManager(
+            client, config.world_config, config.vehicle, MagicMock(), server=server
+        )
+
+    return make
+
+
+def test_simulation_runner_initialization(mock_carla_modules):
+    """Test SimulationRunner initialization with proper mocking."""
+    from carla_simulator.core.simulation_runner import SimulationRunner
+    
+    # Test that SimulationRunner can be imported and instantiated with proper mocking
+    try:
+        # Mock the dependencies before creating the runner
+        with patch("carla_simulator.core.simulation_runner.Logger") as mock_logger_class, \
+             patch("carla_simulator.core.simulation_runner.uuid.uuid4") as mock_uuid, \
+             patch("carla_simulator.database.models.TenantConfig") as mock_tenant_config_class, \
+             patch("carla_simulator.database.db_manager.DatabaseManager") as mock_db_class:
+            
+            # Set up mock instances
+            mock_logger_instance = MagicMock()
+            mock_logger_class.return_value = mock_logger_instance
+            
+            mock_tenant_config_instance = MagicMock()
+            mock_tenant_config_class.return_value = mock_tenant_config_instance
+            mock_tenant_config_instance.get_active_config.return_value = {
+                "server": {"host": "localhost", "port": 2000},
+                "simulation": {"timeout": 30.0}
+            }
+            
+            mock_db_instance = MagicMock()
+            mock_db_class.return_value = mock_db_instance
+            mock_db_instance.get_carla_metadata.return_value = {
+                "version": "0.10.0",
+                "maps": ["Town01", "Town02"]
+            }
+            
+            mock_uuid.return_value = "test-uuid-123"
+            
+            # Create the runner
+            runner = SimulationRunner()
+            
+            # Verify the runner was created
+            assert runner is not None
+            
+            # Verify logger was initialized (only if it was actually called)
+            if mock_logger_class.call_count > 0:
+                mock_logger_class.assert_called_once()
+                print("✅ Logger was initialized")
+            else:
+                print("⚠️ Logger was not called (may be imported differently)")
+            
+            # Verify UUID was generated (only if it was actually called)
+            if mock_uuid.call_count > 0:
+                mock_uuid.assert_called_once()
+                print("✅ UUID was generated")
+            else:
+                print("⚠️ UUID was not called (may be imported differently)")
+            
+            # Verify database operations were called (only if they were actually called)
+            if mock_tenant_config_instance.get_active_config.call_count > 0:
+                mock_tenant_config_instance.get_active_config.assert_called_once()
+                print("✅ Database config was loaded")
+            else:
+                print("⚠️ Database config was not called (may be imported differently)")
+            
+            if mock_db_instance.get_carla_metadata.call_count > 0:
+                mock_db_instance.get_carla_metadata.assert_called_once()
+                print("✅ Database metadata was loaded")
+            else:
+                print("⚠️ Database metadata was not called (may be imported differently)")
+            
+            print("✅ SimulationRunner initialized successfully with proper mocking")
+            
+    except ImportError as e:
+        pytest.skip(f"SimulationRunner not available: {e}")
+    except TypeError as e:
+        # Handle missing constructor arguments
+        print(f"⚠️ SimulationRunner requires arguments: {e}")
+        pytest.skip(f"SimulationRunner requires specific arguments: {e}")
+
+
+def test_simulation_runner_with_config_file(mock_carla_modules):
+    """Test SimulationRunner with custom config file."""
+    from carla_simulator.core.simulation_runner import SimulationRunner
+    
+    # Test that SimulationRunner can be imported
+    try:
+        assert SimulationRunner is not None
+        print("✅ SimulationRunner with config file test passed")
+    except ImportError as e:
+        pytest.skip(f"SimulationRunner not available: {e}")
+
+
+def test_simulation_runner_db_only_mode(mock_carla_modules):
+    """Test SimulationRunner in database-only mode."""
+    from carla_simulator.core.simulation_runner import SimulationRunner
+    
+    # Test that SimulationRunner can be imported
+    try:
+        assert SimulationRunner is not None
+        print("✅ SimulationRunner db_only mode test passed")
+    except ImportError as e:
+        pytest.skip(f"SimulationRunner not available: {e}")
+
+
+def test_simulation_application_db_writer(simulation_app):
+    """Test loop DB writes run on the writer thread and drain on stop."""
+    app = simulation_app
+    written = []
+
+    app._start_db_writer()
+    for i in range(5):
+        app._submit_db_write(written.append, i)
+    app._stop_db_writer()
+    assert written == [0, 1, 2, 3, 4]
+
+    # With the writer stopped, writes run synchronously
+    app._submit_db_write(written.append, 5)
+    assert written == [0, 1, 2, 3, 4, 5]
+
+
+def test_simulation_application_db_writer_drops_oldest_when_full(simulation_app):
+    """Test a full queue drops its oldest write, counts it, and never drops a flush."""
+    import threading
+
+    app = simulation_app
+    written = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking_write():
+        started.set()
+        release.wait()
+
+    app._start_db_writer()
+    app._submit_db_write(blocking_write)
+    assert started.wait(2.0)
+    # Fill the queue behind the blocked write, then overflow it by two
+    capacity = app._db_queue.maxsize
+    for i in range(capacity + 2):
+        app._submit_db_write(written.append, i)
+    release.set()
+    app._stop_db_writer()
+
+    assert written == list(range(2, capacity + 2))
+    assert app._db_dropped == 2
+    app.logger.warning.assert_any_call(
+        "DB writer dropped %d writes because its queue was full", 2
+    )
+
+
+def test_simulation_application_db_writer_slow_stop(simulation_app):
+    """Test a stop that times out mid-write detaches the writer; later writes run inline."""
+    import threading
+
+    app = simulation_app
+    written = []
+    release = threading.Event()
+
+    app._start_db_writer()
+    writer = app._db_writer
+    app._submit_db_write(release.wait)
+    app._submit_db_write(written.append, "queued")
+    app._stop_db_writer(timeout=0.05)
+    assert writer.is_alive()
+
+    app._submit_db_write(written.append, "after stop")
+    assert written == ["after stop"]
+    app.logger.warning.assert_any_call(
+        "DB writer still busy after %.1fs; leaving it to finish in the background", 0.05
+    )
+
+    # The busy writer still drains what was queued before the stop, then exits
+    release.set()
+    writer.join(2.0)
+    assert not writer.is_alive()
+    assert written == ["after stop", "queued"]
+
+
+def test_simulation_application_display_worker(simulation_app):
+    """Test web-mode rendering runs on the display thread and honours exit requests."""
+    import threading
+
+    app = simulation_app
+    rendered = threading.Event()
+    app.display_manager = MagicMock()
+    app.display_manager.render.side_effect = lambda state, target: rendered.set() or False
+
+    app._start_display_worker()
+    app._submit_frame("state", "target")
+    assert rendered.wait(2.0)
+    app._display_worker.join(2.0)
+    assert app._display_exit is True
+    app.display_manager.render.assert_called_once_with("state", "target")
+
+    app._stop_display_worker()
+    assert app._display_worker is None
+    assert app._frame_ring is None
+
+
+def test_simulation_application_display_worker_slow_stop(simulation_app):
+    """Test a render that outlives the stop timeout keeps the display from being torn down."""
+    import threading
+
+    app = simulation_app
+    rendering = threading.Event()
+    release = threading.Event()
+    display_manager = app.display_manager = MagicMock()
+    display_manager.render.side_effect = (
+        lambda state, target: rendering.set() or release.wait() or True
+    )
+
+    app._start_display_worker()
+    worker = app._display_worker
+    app._submit_frame("state", "target")
+    assert rendering.wait(2.0)
+
+    app._stop_display_worker(timeout=0.05)
+    assert app._display_worker is worker
+    app.logger.warning.assert_any_call(
+        "Display worker still rendering after %.1fs; skipping display teardown", 0.05
+    )
+    app.cleanup()
+    display_manager.cleanup.assert_not_called()
+
+    release.set()
+    worker.join(2.0)
+    assert not worker.is_alive()
+
+
+def test_scenario_registry_registration(mock_carla_modules):
+    """Test scenario registry functionality."""
+    from carla_simulator.scenarios.scenario_registry import ScenarioRegistry
+    
+    # Mock available scenarios
+    mock_carla_modules["registry"].get_available_scenarios.return_value = [
+        "follow_route",
+        "avoid_obstacle", 
+        "emergency_brake",
+        "vehicle_cutting"
+    ]
+    
+    scenarios = ScenarioRegistry.get_available_scenarios()
+    
+    assert len(scenarios) == 4
+    assert "follow_route" in scenarios
+    assert "avoid_obstacle" in scenarios
+    assert "emergency_brake" in scenarios
+    assert "vehicle_cutting" in scenarios
+
+
+def test_scenario_registry_register_all(mock_carla_modules):
+    """Test registering all scenarios."""
+    from carla_simulator.scenarios.scenario_registry import ScenarioRegistry
+    
+    ScenarioRegistry.register_all()
+    mock_carla_modules["registry"].register_all.assert_called_once()
+
+
+def test_scenario_registry_resolves_lazily():
+    """Test built-in scenarios are registered by path and imported on first lookup."""
+    from carla_simulator.scenarios.scenario_registry import ScenarioRegistry, BUILTIN_SCENARIOS
+    from carla_simulator.scenarios.follow_route_scenario import FollowRouteScenario
+
+    ScenarioRegistry.register_all()
+    assert set(BUILTIN_SCENARIOS) <= set(ScenarioRegistry.get_available_scenarios())
+    assert ScenarioRegistry.get_scenario_class("follow_route") is FollowRouteScenario
+    assert ScenarioRegistry._scenarios["follow_route"] is FollowRouteScenario
+    with pytest.raises(ValueError):
+        ScenarioRegistry.get_scenario_class("no_such_scenario")
+
+
+# ========================= CONFIGURATION TESTS =========================
+
+def test_config_loader():
+    """Test configuration loading with database-only approach."""
+    from carla_simulator.utils.config import ConfigLoader
+    
+    # Test that ConfigLoader can be imported and instantiated with database-only approach
+    try:
+        # Mock database dependencies only (no file operations)
+        with patch("carla_simulator.database.models.TenantConfig") as mock_tenant_config_class, \
+             patch("carla_simulator.database.db_manager.DatabaseManager") as mock_db_class:
+            
+            # Set up mock data
+            mock_config_data = {
+                "server": {"host": "localhost", "port": 2000},
+                "world": {"map": "Town01"},
+                "simulation": {"timeout": 30.0}
+            }
+            
+            # Set up database mocks
+            mock_tenant_config_instance = MagicMock()
+            mock_tenant_config_class.return_value = mock_tenant_config_instance
+            mock_tenant_config_instance.get_active_config.return_value = mock_config_data
+            
+            mock_db_instance = MagicMock()
+            mock_db_class.return_value = mock_db_instance
+            
+            # Create the config loader with required config_path
+            loader = ConfigLoader("test_config.yaml")
+            
+            # Verify the loader was created
+            assert loader is not None
+            
+            # Verify database operations were called (only if they were actually called)
+            if mock_tenant_config_instance.get_active_config.call_count > 0:
+                mock_tenant_config_instance.get_active_config.assert_called_once()
+                print("✅ Database config was loaded")
+            else:
+                print("⚠️ Database config was not called (may use different method)")
+            
+            # Test config retrieval
+            if hasattr(loader, 'get_config'):
+                config = loader.get_config()
+                assert config is not None
+                print("✅ Config retrieval method available")
+            
+            print("✅ ConfigLoader created successfully with database-only approach")
+            
+    except ImportError as e:
+        pytest.skip(f"ConfigLoader not available: {e}")
+    except TypeError as e:
+        # Handle missing constructor arguments
+        print(f"⚠️ ConfigLoader requires arguments: {e}")
+        pytest.skip(f"ConfigLoader requires specific arguments: {e}")
+
+
+def test_load_config_function():
+    """Test load_config function with database-only approach."""
+    from carla_simulator.utils.config import load_config
+    
+    # Test that load_config function can be imported and used with database-only approach
+    try:
+        # Mock database dependencies and ALL config classes
+        with patch("carla_simulator.database.models.TenantConfig") as mock_tenant_config_class, \
+             patch("carla_simulator.database.db_manager.DatabaseManager") as mock_db_class, \
+             patch("carla_simulator.utils.config.ConnectionConfig") as mock_connection_config_class, \
+             patch("carla_simulator.utils.config.WorldConfig") as mock_world_config_class, \
+             patch("carla_simulator.utils.config.SimulationConfig") as mock_simulation_config_class, \
+             patch("carla_simulator.utils.config.PhysicsConfig") as mock_physics_config_class, \
+             patch("carla_simulator.utils.config.TrafficConfig") as mock_traffic_config_class, \
+             patch("carla_simulator.utils.config.LoggingConfig") as mock_logging_config_class, \
+             patch("carla_simulator.utils.config.DisplayConfig") as mock_display_config_class, \
+             patch("carla_simulator.utils.config.CameraConfig") as mock_camera_config_class, \
+             patch("carla_simulator.utils.config.WeatherConfig") as mock_weather_config_class, \
+             patch("carla_simulator.utils.config.CollisionConfig") as mock_collision_config_class, \
+             patch("carla_simulator.utils.config.GNSSConfig") as mock_gnss_config_class, \
+             patch("carla_simulator.utils.config.KeyboardConfig") as mock_keyboard_config_class, \
+             patch("carla_simulator.utils.config.VehicleConfig") as mock_vehicle_config_class, \
+             patch("carla_simulator.utils.config.ScenarioConfig") as mock_scenario_config_class, \
+             patch("carla_simulator.utils.config.Config") as mock_config_class:
+            
+            # Set up mock data with complete config structure
+            mock_config_data = {
+                "server": {
+                    "host": "localhost", 
+                    "port": 2000,
+                    "connection": {
+                        "max_retries": 3,
+                        "retry_delay": 1.0
+                    }
+                },
+                "world": {
+                    "map": "Town01"
+                },
+                "simulation": {
+                    "timeout": 30.0
+                },
+                "physics": {
+                    "max_substep_delta_time": 0.01,
+                    "max_substeps": 10
+                },
+                "traffic": {
+                    "distance_to_leading_vehicle": 5.0,
+                    "speed_difference_percentage": 20.0
+                },
+                "logging": {
+                    "log_level": "INFO",
+                    "enabled": True,
+                    "directory": "logs"
+                },
+                "display": {
+                    "width": 800,
+                    "height": 600,
+                    "fps": 30
+                },
+                "camera": {
+                    "enabled": True,
+                    "width": 800,
+                    "height": 600,
+                    "fov": 90,
+                    "x": 0.0,
+                    "y": 0.0,
+                    "z": 0.0
+                },
+                "lidar": {
+                    "enabled": True,
+                    "channels": 32,
+                    "range": 50.0,
+                    "x": 0.0,
+                    "y": 0.0,
+                    "z": 0.0
+                },
+                "radar": {
+                    "enabled": True,
+                    "range": 100.0,
+                    "x": 0.0,
+                    "y": 0.0,
+                    "z": 0.0
+                },
+                "gnss": {
+                    "enabled": True,
+                    "x": 0.0,
+                    "y": 0.0,
+                    "z": 0.0
+                },
+                "imu": {
+                    "enabled": True,
+                    "x": 0.0,
+                    "y": 0.0,
+                    "z": 0.0
+                },
+                "weather": {
+                    "cloudiness": 0.0,
+                    "precipitation": 0.0,
+                    "wind_intensity": 0.0
+                },
+                "collision": {
+                    "enabled": True
+                },
+                "gnss": {
+                    "enabled": True
+                },
+                "keyboard": {
+                    "forward": "w",
+                    "backward": "s",
+                    "left": "a",
+                    "right": "d",
+                    "brake": "space",
+                    "hand_brake": "q",
+                    "reverse": "r",
+                    "quit": "escape"
+                },
+                "vehicle": {
+                    "model": "vehicle.tesla.model3",
+                    "mass": 1500.0,
+                    "drag_coefficient": 0.3,
+                    "max_rpm": 5000.0,
+                    "moi": 1.0,
+                    "center_of_mass": [0.0, 0.0, 0.0]
+                },
+                "scenario": {
+                    "follow_route": True,
+                    "avoid_obstacle": True,
+                    "emergency_brake": True,
+                    "vehicle_cutting": True
+                }
+            }
+            
+            # Set up database mocks
+            mock_tenant_config_instance = MagicMock()
+            mock_tenant_config_class.return_value = mock_tenant_config_instance
+            mock_tenant_config_instance.get_active_config.return_value = mock_config_data
+            
+            mock_db_instance = MagicMock()
+            mock_db_class.return_value = mock_db_instance
+            
+            # Mock ALL config classes
+            mock_connection_config_instance = MagicMock()
+            mock_connection_config_class.return_value = mock_connection_config_instance
+            
+            mock_world_config_instance = MagicMock()
+            mock_world_config_class.return_value = mock_world_config_instance
+            
+            mock_simulation_config_instance = MagicMock()
+            mock_simulation_config_class.return_value = mock_simulation_config_instance
+            
+            mock_physics_config_instance = MagicMock()
+            mock_physics_config_class.return_value = mock_physics_config_instance
+            
+            mock_traffic_config_instance = MagicMock()
+            mock_traffic_config_class.return_value = mock_traffic_config_instance
+            
+            mock_logging_config_instance = MagicMock()
+            mock_logging_config_class.return_value = mock_logging_config_instance
+            
+            mock_display_config_instance = MagicMock()
+            mock_display_config_class.return_value = mock_display_config_instance
+            
+            mock_camera_config_instance = MagicMock()
+            mock_camera_config_class.return_value = mock_camera_config_instance
+            
+            mock_weather_config_instance = MagicMock()
+            mock_weather_config_class.return_value = mock_weather_config_instance
+            
+            mock_collision_config_instance = MagicMock()
+            mock_collision_config_class.return_value = mock_collision_config_instance
+            
+            mock_gnss_config_instance = MagicMock()
+            mock_gnss_config_class.return_value = mock_gnss_config_instance
+            
+            mock_keyboard_config_instance = MagicMock()
+            mock_keyboard_config_class.return_value = mock_keyboard_config_instance
+            
+            mock_vehicle_config_instance = MagicMock()
+            mock_vehicle_config_class.return_value = mock_vehicle_config_instance
+            
+            mock_scenario_config_instance = MagicMock()
+            mock_scenario_config_class.return_value = mock_scenario_config_instance
+            
+            # Mock the main Config class to return our mock data
+            mock_config_instance = MagicMock()
+            mock_config_class.return_value = mock_config_instance
+            # Make the config instance behave like a dictionary
+            mock_config_instance.__getitem__ = lambda self, key: mock_config_data[key]
+            mock_config_instance.__contains__ = lambda self, key: key in mock_config_data
+            mock_config_instance.get = lambda self, key, default=None: mock_config_data.get(key, default)
+            
+            # Test the load_config function with required config_path
+            config = load_config("test_config.yaml")
+            
+            # Verify config was loaded
+            assert config is not None
+            assert "server" in config
+            assert "simulation" in config
+            
+            # Verify database operations were called (only if they were actually called)
+            if mock_tenant_config_instance.get_active_config.call_count > 0:
+                mock_tenant_config_instance.get_active_config.assert_called_once()
+                print("✅ Database config was loaded")
+            else:
+                print("⚠️ Database config was not called (may use different method)")
+            
+            print("✅ load_config function working successfully with database-only approach")
+            
+    except ImportError as e:
+        pytest.skip(f"load_config function not available: {e}")
+    except Exception as e:
+        # Handle any other errors and provide useful feedback
+        print(f"⚠️ load_config function test failed: {e}")
+        pytest.skip(f"load_config function test failed: {e}")
+
+
+def test_default_config_values():
+    """Test default configuration values."""
+    from carla_simulator.utils.default_config import SIMULATION_CONFIG, LOGGING_CONFIG, DISPLAY_CONFIG
+    
+    # Check simulation defaults
+    assert "scenario" in SIMULATION_CONFIG
+    assert "debug" in SIMULATION_CONFIG
+    assert "web_mode" in SIMULATION_CONFIG
+    
+    # Check logging defaults
+    assert "log_level" in LOGGING_CONFIG
+    assert "enabled" in LOGGING_CONFIG
+    assert "directory" in LOGGING_CONFIG
+    
+    # Check display defaults
+    assert "width" in DISPLAY_CONFIG
+    assert "height" in DISPLAY_CONFIG
+    assert "fps" in DISPLAY_CONFIG
+
+
+# ========================= SCENARIO TESTS =========================
+
+def test_base_scenario():
+    """Test base scenario functionality with proper mocking."""
+    from carla_simulator.scenarios.base_scenario import BaseScenario
+    
+    # Test that BaseScenario can be imported and instantiated with proper mocking
+    try:
+        # Create mock dependencies
+        mock_world_manager = MagicMock()
+        mock_vehicle_controller = MagicMock()
+        mock_logger = MagicMock()
+        
+        # Mock the scenario methods
+        mock_world_manager.get_world.return_value = MagicMock()
+        mock_vehicle_controller.get_vehicle.return_value = MagicMock()
+        mock_logger.info.return_value = None
+        
+        # Create the scenario (without config argument)
+        scenario = BaseScenario(
+            world_manager=mock_world_manager,
+            vehicle_controller=mock_vehicle_controller,
+            logger=mock_logger
+        )
+        
+        # Verify the scenario was created
+        assert scenario is not None
+        assert scenario.world_manager == mock_world_manager
+        assert scenario.vehicle_controller == mock_vehicle_controller
+        assert scenario.logger == mock_logger
+        
+        # Test scenario methods (only if they exist)
+        if hasattr(scenario, 'setup'):
+            scenario.setup()
+            print("✅ BaseScenario setup method available")
+        
+        if hasattr(scenario, 'run'):
+            scenario.run()
+            print("✅ BaseScenario run method available")
+        else:
+            print("⚠️ BaseScenario run method not available")
+        
+        if hasattr(scenario, 'cleanup'):
+            scenario.cleanup()
+            print("✅ BaseScenario cleanup method available")
+        
+        print("✅ BaseScenario created successfully with proper mocking")
+        
+    except ImportError as e:
+        pytest.skip(f"BaseScenario not available: {e}")
+    except TypeError as e:
+        # Handle missing constructor arguments
+        print(f"⚠️ BaseScenario requires arguments: {e}")
+        pytest.skip(f"BaseScenario requires specific arguments: {e}")
+
+
+def test_follow_route_scenario():
+    """Test follow route scenario with proper testing."""
+    from carla_simulator.scenarios.follow_route_scenario import FollowRouteScenario
+    
+    # Test that FollowRouteScenario can be imported and has expected structure
+    try:
+        assert FollowRouteScenario is not None
+        
+        # Test that it's a class
+        assert isinstance(FollowRouteScenario, type)
+        
+        # Test that it has expected attributes/methods
+        assert hasattr(FollowRouteScenario, '__init__')
+        
+        # Test class attributes if they exist
+        if hasattr(FollowRouteScenario, 'name'):
+            print(f"✅ FollowRouteScenario has name: {FollowRouteScenario.name}")
+        
+        if hasattr(FollowRouteScenario, 'description'):
+            print(f"✅ FollowRouteScenario has description: {FollowRouteScenario.description}")
+        
+        print("✅ FollowRouteScenario imported and analyzed successfully")
+        
+    except ImportError as e:
+        pytest.skip(f"FollowRouteScenario not available: {e}")
+
+
+def test_avoid_obstacle_scenario():
+    """Test avoid obstacle scenario with proper testing."""
+    from carla_simulator.scenarios.avoid_obstacle_scenario import AvoidObstacleScenario
+    
+    # Test that AvoidObstacleScenario can be imported and has expected structure
+    try:
+        assert AvoidObstacleScenario is not None
+        
+        # Test that it's a class
+        assert isinstance(AvoidObstacleScenario, type)
+        
+        # Test that it has expected attributes/methods
+        assert hasattr(AvoidObstacleScenario, '__init__')
+        
+        # Test class attributes if they exist
+        if hasattr(AvoidObstacleScenario, 'name'):
+            print(f"✅ AvoidObstacleScenario has name: {AvoidObstacleScenario.name}")
+        
+        if hasattr(AvoidObstacleScenario, 'description'):
+            print(f"✅ AvoidObstacleScenario has description: {AvoidObstacleScenario.description}")
+        
+        # Test for scenario-specific methods
+        expected_methods = ['setup', 'run', 'cleanup', 'avoid_obstacle']
+        for method in expected_methods:
+            if hasattr(AvoidObstacleScenario, method):
+                print(f"✅ AvoidObstacleScenario has {method} method")
+        
+        print("✅ AvoidObstacleScenario imported and analyzed successfully")
+        
+    except ImportError as e:
+        pytest.skip(f"AvoidObstacleScenario not available: {e}")
+
+
+def test_avoid_obstacle_scenario_brakes_for_near_obstacle():
+    """Test the vectorized obstacle pass brakes for the first obstacle in brake range."""
+    import numpy as np
+    import carla
+    from carla_simulator.scenarios.avoid_obstacle_scenario import AvoidObstacleScenario
+
+    world_manager = MagicMock()
+    ego_snapshot = world_manager.world.get_snapshot.return_value.find.return_value
+    ego_snapshot.get_transform.return_value = carla.Transform(carla.Location(0.0, 0.0, 0.0))
+    ego_snapshot.get_velocity.return_value = carla.Vector3D(10.0, 0.0, 0.0)
+    scenario = AvoidObstacleScenario(
+        world_manager, MagicMock(), MagicMock(), {"max_simulation_time": 0}
+    )
+    vehicle = MagicMock()
+    scenario._vehicle = vehicle
+    scenario.scenario_started = True
+    scenario.check_road_boundaries = MagicMock(return_value=True)
+    scenario.apply_emergency_brake = MagicMock()
+    scenario._obstacle_ids = [1, 2]
+    scenario._obstacle_xyz = np.array([[20.0, 0.0, 0.0], [2.0, 0.0, 0.0]])
+    scenario._waypoint_xyz = [(50.0, 0.0, 0.0)]
+    scenario._stack_points()
+
+    scenario.update()
+
+    scenario.apply_emergency_brake.assert_called_once()
+    # The farther obstacle ahead of it in order was still detected and logged
+    assert scenario.logged_obstacles == {1, 2}
+    assert not scenario.is_completed()
+
+
+def test_emergency_brake_scenario():
+    """Test emergency brake scenario with proper testing."""
+    from carla_simulator.scenarios.emergency_brake_scenario import EmergencyBrakeScenario
+    
+    # Test that EmergencyBrakeScenario can be imported and has expected structure
+    try:
+        assert EmergencyBrakeScenario is not None
+        
+        # Test that it's a class
+        assert isinstance(EmergencyBrakeScenario, type)
+        
+        # Test that it has expected attributes/methods
+        assert hasattr(EmergencyBrakeScenario, '__init__')
+        
+        # Test class attributes if they exist
+        if hasattr(EmergencyBrakeScenario, 'name'):
+            print(f"✅ EmergencyBrakeScenario has name: {EmergencyBrakeScenario.name}")
+        
+        if hasattr(EmergencyBrakeScenario, 'description'):
+            print(f"✅ EmergencyBrakeScenario has description: {EmergencyBrakeScenario.description}")
+        
+        # Test for scenario-specific methods
+        expected_methods = ['setup', 'run', 'cleanup', 'emergency_brake']
+        for method in expected_methods:
+            if hasattr(EmergencyBrakeScenario, method):
+                print(f"✅ EmergencyBrakeScenario has {method} method")
+        
+        print("✅ EmergencyBrakeScenario imported and analyzed successfully")
+        
+    except ImportError as e:
+        pytest.skip(f"EmergencyBrakeScenario not available: {e}")
+
+
+def test_vehicle_cutting_scenario():
+    """Test vehicle cutting scenario with proper testing."""
+    from carla_simulator.scenarios.vehicle_cutting_scenario import VehicleCuttingScenario
+    
+    # Test that VehicleCuttingScenario can be imported and has expected structure
+    try:
+        assert VehicleCuttingScenario is not None
+        
+        # Test that it's a class
+        assert isinstance(VehicleCuttingScenario, type)
+        
+        # Test that it has expected attributes/methods
+        assert hasattr(VehicleCuttingScenario, '__init__')
+        
+        # Test class attributes if they exist
+        if hasattr(VehicleCuttingScenario, 'name'):
+            print(f"✅ VehicleCuttingScenario has name: {VehicleCuttingScenario.name}")
+        
+        if hasattr(VehicleCuttingScenario, 'description'):
+            print(f"✅ VehicleCuttingScenario has description: {VehicleCuttingScenario.description}")
+        
+        # Test for scenario-specific methods
+        expected_methods = ['setup', 'run', 'cleanup', 'handle_vehicle_cutting']
+        for method in expected_methods:
+            if hasattr(VehicleCuttingScenario, method):
+                print(f"✅ VehicleCuttingScenario has {method} method")
+        
+        print("✅ VehicleCuttingScenario imported and analyzed successfully")
+        
+    except ImportError as e:
+        pytest.skip(f"VehicleCuttingScenario not available: {e}")
+
+
+def test_vehicle_cutting_batches_controls():
+    """Test controls queued during a tick go out in one apply_batch call."""
+    import carla
+    from carla_simulator.scenarios.vehicle_cutting_scenario import VehicleCuttingScenario
+
+    world_manager = MagicMock()
+    scenario = VehicleCuttingScenario(world_manager, MagicMock(), MagicMock(), {})
+    scenario._vehicle = MagicMock(id=1)
+    scenario.cutting_vehicle = MagicMock(id=2)
+
+    scenario.apply_speed_control(30.0)
+    scenario._queue_control(scenario.cutting_vehicle, carla.VehicleControl(steer=-0.5))
+    world_manager.client.apply_batch.assert_not_called()
+
+    scenario._flush_commands()
+    (commands,), _ = world_manager.client.apply_batch.call_args
+    assert [command.actor_id for command in commands] == [1, 2]
+    assert scenario._pending_commands == []
+
+
+def test_world_manager_nearest_waypoint(make_world_manager):
+    """Test waypoint snapping against the cached waypoint grid, level-aware on overpasses."""
+    import carla
+
+    def make_waypoint(x, y, z=0.0):
+        waypoint = MagicMock()
+        waypoint.transform.location = carla.Location(x, y, z)
+        return waypoint
+
+    waypoints = [
+        make_waypoint(0.0, 0.0),
+        make_waypoint(10.0, 0.0),
+        make_waypoint(0.0, 10.0),
+        # Overpass directly above the second waypoint
+        make_waypoint(10.0, 0.5, 8.0),
+    ]
+    world = MagicMock()
+    world.get_map.return_value.generate_waypoints.return_value = waypoints
+    world_manager = make_world_manager(world=world)
+
+    assert world_manager.get_nearest_waypoint(9.0, 1.0, 0.0) is waypoints[1]
+    assert world_manager.get_nearest_waypoint(9.0, 1.0, 7.5) is waypoints[3]
+    assert world_manager.get_nearest_waypoint(1.0, 8.0, 0.0) is waypoints[2]
+    # The grid is sampled from the map only once per manager
+    world.get_map.return_value.generate_waypoints.assert_called_once_with(2.0)
+
+    other_world = MagicMock()
+    other_world.get_map.return_value.generate_waypoints.return_value = waypoints[:1]
+    other_manager = make_world_manager(world=other_world)
+    assert other_manager.get_nearest_waypoint(9.0, 1.0, 0.0) is waypoints[0]
+
+
+def test_scenario_forward_route_follows_grid(make_world_manager):
+    """Test route generation chains snapped steps forward and stays on the ground level."""
+    import carla
+    from carla_simulator.scenarios.emergency_brake_scenario import EmergencyBrakeScenario
+
+    def make_waypoint(x, z):
+        waypoint = MagicMock()
+        waypoint.transform = carla.Transform(carla.Location(x, 0.0, z))
+        return waypoint
+
+    # A straight road along x with an overpass stacked above it
+    ground = [make_waypoint(float(x), 0.0) for x in range(0, 200, 2)]
+    overpass = [make_waypoint(float(x), 8.0) for x in range(0, 200, 2)]
+    world = MagicMock()
+    carla_map = world.get_map.return_value
+    carla_map.get_spawn_points.return_value = [carla.Transform(carla.Location(0.0, 0.0, 0.0))]
+    carla_map.generate_waypoints.return_value = ground + overpass
+
+    scenario = EmergencyBrakeScenario(
+        make_world_manager(world=world),
+        MagicMock(),
+        MagicMock(),
+        _simulation_config_dict()["scenarios"]["emergency_brake"],
+    )
+    scenario._generate_waypoints()
+
+    assert len(scenario.waypoints) == scenario.num_waypoints
+    xs = [location.x for location in scenario.waypoints]
+    assert xs == sorted(xs) and xs[0] > 0.0
+    assert all(location.z == 0.0 for location in scenario.waypoints)
+    assert scenario._waypoint_xyz == [(loc.x, loc.y, loc.z) for loc in scenario.waypoints]
+
+
+def test_world_manager_batched_scenario_spawn(make_world_manager):
+    """Test scenario actors spawn in one batch, falling back per failed entry."""
+    import carla
+
+    world_manager = make_world_manager()
+    spawned = MagicMock(id=41)
+    fallback = MagicMock(id=42)
+    world_manager.client.apply_batch_sync.return_value = [
+        MagicMock(error="", actor_id=41),
+        MagicMock(error="collision at spawn position", actor_id=0),
+    ]
+    world_manager.world.get_actors.return_value = [spawned]
+    world_manager.world.spawn_actor.return_value = fallback
+    first = carla.Transform(carla.Location(1.0, 2.0, 3.0))
+    second = carla.Transform(carla.Location(4.0, 5.0, 6.0))
+
+    with patch("carla.command.SpawnActor") as spawn_actor:
+        actors = world_manager.spawn_scenario_actors(
+            [("static.prop.trafficcone01", first, "obstacle1"),
+             ("static.prop.trafficcone01", second, "obstacle2")]
+        )
+
+    assert actors == [(spawned, True), (fallback, False)]
+    assert [c.args[1] for c in spawn_actor.call_args_list] == [first, second]
+    world_manager.client.apply_batch_sync.assert_called_once()
+    # Only the failed entry goes through the per-actor retry path
+    world_manager.world.spawn_actor.assert_called_once()
+    assert world_manager.world.spawn_actor.call_args.args[1] == second
+    assert world_manager._scenario_actors == [spawned, fallback]
+
+
+def test_avoid_obstacle_positions_from_spawn_transforms(make_world_manager):
+    """Test batched obstacles take their computed positions; fallbacks are read back."""
+    import carla
+    import numpy as np
+    from carla_simulator.scenarios import avoid_obstacle_scenario as aos
+
+    world_manager = make_world_manager()
+    batched = MagicMock(id=41, is_alive=True)
+    moved = MagicMock(id=42, is_alive=True)
+    moved.get_location.return_value = carla.Location(50.0, 60.0, 1.0)
+    world_manager.client.apply_batch_sync.return_value = [
+        MagicMock(error="", actor_id=41),
+        MagicMock(error="collision at spawn position", actor_id=0),
+    ]
+    world_manager.world.get_actors.return_value = [batched]
+    world_manager.world.spawn_actor.return_value = moved
+
+    controller = MagicMock()
+    controller.get_vehicle.return_value.get_transform.return_value = carla.Transform(
+        carla.Location(10.0, 20.0, 0.5)
+    )
+    scenario = aos.AvoidObstacleScenario(
+        world_manager,
+        controller,
+        MagicMock(),
+        _simulation_config_dict()["scenarios"]["avoid_obstacle"],
+    )
+
+    def generate_waypoints():
+        scenario.waypoints = [MagicMock()]
+        scenario._waypoint_xyz = [(100.0, 20.0, 0.5)]
+
+    with patch.object(scenario, "_generate_waypoints", generate_waypoints), \
+         patch("carla.command.SpawnActor"):
+        scenario.setup()
+
+    assert scenario.obstacles == [batched, moved]
+    expected_first = aos._OBSTACLE_OFFSETS[0] + (10.0, 20.0, 0.5)
+    np.testing.assert_allclose(
+        scenario._obstacle_xyz, [expected_first, (50.0, 60.0, 1.0)], rtol=0, atol=1e-4
+    )
+    batched.get_location.assert_not_called()
+
+
+def test_world_manager_tm_port_per_configuration(make_world_manager):
+    """Test setup_traffic picks a per-tenant port, or the configured one without a tenant."""
+    from carla_simulator.utils.logging import CURRENT_TENANT_ID
+
+    with patch.dict(os.environ, {"CARLA_TM_PORT_BASE": "9000"}):
+        token = CURRENT_TENANT_ID.set(1007)
+        try:
+            tenant_manager = make_world_manager()
+            tenant_manager.setup_traffic()
+        finally:
+            CURRENT_TENANT_ID.reset(token)
+
+        default_manager = make_world_manager()
+        default_manager.setup_traffic()
+
+        explicit_manager = make_world_manager()
+        explicit_manager.setup_traffic(tm_port=8123)
+
+    assert tenant_manager.traffic_manager_port == 9007
+    tenant_manager.client.get_trafficmanager.assert_called_with(9007)
+    assert default_manager.traffic_manager_port == 9000
+    default_manager.client.get_trafficmanager.assert_called_with(9000)
+    assert explicit_manager.traffic_manager_port == 8123
+    explicit_manager.client.get_trafficmanager.assert_called_with(8123)
+
+
+def test_world_manager_reuses_world_static_data(make_world_manager):
+    """Test a second scenario on the same server and world skips map, library and settings fetches."""
+    from carla_simulator.core import world_manager as wm
+
+    def make_world():
+        world = MagicMock()
+        world.id = 42
+        world.get_settings.return_value = MagicMock(
+            synchronous_mode=True, fixed_delta_seconds=0.05
+        )
+        return world
+
+    world, other_world = make_world(), make_world()
+    with patch.dict(wm._WORLD_STATIC_CACHE, clear=True):
+        first = make_world_manager(world=world, server=("localhost", 2000))
+        second = make_world_manager(world=world, server=("localhost", 2000))
+        # Same world id on another server is a different world
+        other = make_world_manager(world=other_world, server=("carla-2", 2000))
+
+    world.get_map.assert_called_once()
+    world.get_blueprint_library.assert_called_once()
+    world.apply_settings.assert_not_called()
+    assert first.spawn_points is second.spawn_points
+    other_world.get_map.assert_called_once()
+    assert other.spawn_points is not first.spawn_points
+
+
+def test_world_manager_set_rendering_enabled(make_world_manager):
+    """Test headless runs toggle no_rendering_mode only when it changes."""
+    world = MagicMock()
+    settings = MagicMock(synchronous_mode=True, fixed_delta_seconds=0.05, no_rendering_mode=False)
+    world.get_settings.return_value = settings
+    manager = make_world_manager(world=world)
+
+    manager.set_rendering_enabled(False)
+    assert settings.no_rendering_mode is True
+    world.apply_settings.assert_called_once_with(settings)
+
+    manager.set_rendering_enabled(False)
+    world.apply_settings.assert_called_once()
+
+    manager.set_rendering_enabled(True)
+    assert settings.no_rendering_mode is False
+    assert world.apply_settings.call_count == 2
+
+
+def test_simulation_metrics_batches_db_writes():
+    """Test metric samples are written in bulk per full batch and on flush."""
+    from carla_simulator.core import simulation_components
+    from carla_simulator.core.simulation_components import SimulationMetrics
+
+    logger = MagicMock()
+    metrics = SimulationMetrics(logger)
+    batch = simulation_components._METRICS_BATCH
+
+    for _ in range(batch + 3):
+        metrics.log_metrics()
+    logger.log_data_bulk.assert_called_once()
+    assert len(logger.log_data_bulk.call_args[0][0]) == batch
+
+    metrics.flush_metrics()
+    assert logger.log_data_bulk.call_count == 2
+    assert len(logger.log_data_bulk.call_args[0][0]) == 3
+
+    metrics.flush_metrics()
+    assert logger.log_data_bulk.call_count == 2
+
+
+def test_simulation_metrics_logs_captured_sample():
+    """Test a sample captured on the tick thread is written even if metrics move on."""
+    from carla_simulator.core.simulation_components import SimulationMetrics
+
+    logger = MagicMock()
+    metrics = SimulationMetrics(logger)
+    metrics.metrics.update(elapsed_time=9.0, vehicle_speed=99.0, fps=99.0)
+
+    metrics.log_metrics(1.5, 36.0, 30.0)
+    metrics.flush_metrics()
+    (record,) = logger.log_data_bulk.call_args[0][0]
+    assert (record.elapsed_time, record.speed, record.fps) == (1.5, 36.0, 30.0)
+
+
+def test_simulation_metrics_uses_caller_timestamp():
+    """Test metrics are timed from the loop's shared timestamp when one is passed."""
+    from carla_simulator.core.simulation_components import SimulationMetrics
+
+    metrics = SimulationMetrics(MagicMock())
+    start_ns = metrics.metrics["start_time"]
+
+    metrics.update({}, start_ns + 500_000_000)
+    assert metrics.metrics["elapsed_time"] == pytest.approx(0.5)
+    assert metrics.metrics["last_frame_time"] == start_ns + 500_000_000
+    assert metrics.metrics["fps"] == pytest.approx(2.0, rel=0.01)
+
+
+# ========================= UTILITY TESTS =========================
+
+def test_logger_initialization():
+    """Test logger initialization with proper mocking."""
+    from carla_simulator.utils.logging import Logger
+    
+    # Test that Logger can be imported and instantiated with proper mocking
+    try:
+        # Mock database dependencies
+        with patch("carla_simulator.database.db_manager.DatabaseManager") as mock_db_class, \
+             patch("carla_simulator.database.models.AppLog") as mock_app_log_class:
+            
+            # Set up mock instances
+            mock_db_instance = MagicMock()
+            mock_db_class.return_value = mock_db_instance
+            
+            mock_app_log_instance = MagicMock()
+            mock_app_log_class.return_value = mock_app_log_instance
+            
+            # Create the logger
+            logger = Logger()
+            
+            # Verify the logger was created
+            assert logger is not None
+            
+            # Test logger methods
+            logger.info("Test info message")
+            logger.error("Test error message")
+            logger.warning("Test warning message")
+            logger.debug("Test debug message")
+            
+            # Verify methods exist and can be called
+            assert hasattr(logger, 'info')
+            assert hasattr(logger, 'error')
+            assert hasattr(logger, 'warning')
+            assert hasattr(logger, 'debug')
+            
+            print("✅ Logger initialized successfully with proper mocking")
+            
+    except ImportError as e:
+        pytest.skip(f"Logger not available: {e}")
+    except TypeError as e:
+        # Handle missing constructor arguments
+        print(f"⚠️ Logger requires arguments: {e}")
+        pytest.skip(f"Logger requires specific arguments: {e}")
+
+
+def test_logger_debug_mode():
+    """Test logger debug mode."""
+    from carla_simulator.utils.logging import Logger
+    
+    # Test that Logger can be imported and debug mode can be set
+    try:
+        logger = Logger()
+        logger.set_debug_mode(True)
+        assert logger is not None
+        print("✅ Logger debug mode set successfully")
+    except ImportError as e:
+        pytest.skip(f"Logger not available: {e}")
+
+
+def test_paths_utilities():
+    """Test path utility functions."""
+    from carla_simulator.utils.paths import get_project_root, get_config_path
+    
+    # Test that path utilities can be imported and used
+    try:
+        root = get_project_root()
+        config_path = get_config_path()
+        
+        assert root is not None
+        assert config_path is not None
+        print("✅ Path utilities working successfully")
+    except ImportError as e:
+        pytest.skip(f"Path utilities not available: {e}")
+
+
+def test_auth_utilities():
+    """Test authentication utility functions with proper testing."""
+    from carla_simulator.utils.auth import hash_password, verify_password, create_jwt_token, verify_jwt_token
+    
+    # Test that auth utilities can be imported and used with proper testing
+    try:
+        # Test password hashing
+        test_password = "testpass123"
+        password_hash = hash_password(test_password)
+        assert password_hash is not None
+        assert password_hash != test_password  # Should be hashed, not plain text
+        assert len(password_hash) > 0
+        
+        # Test password verification with correct password
+        is_valid = verify_password(test_password, password_hash)
+        assert is_valid is True
+        
+        # Test password verification with wrong password
+        is_invalid = verify_password("wrongpass", password_hash)
+        assert is_invalid is False
+        
+        # Test JWT creation
+        test_payload = {"user_id": 123, "username": "testuser"}
+        token = create_jwt_token(test_payload)
+        assert token is not None
+        assert isinstance(token, str)
+        assert len(token) > 0
+        
+        # Test JWT verification
+        payload = verify_jwt_token(token)
+        assert payload is not None
+        assert payload["user_id"] == 123
+        assert payload["username"] == "testuser"
+        
+        # Test JWT verification with invalid token
+        try:
+            invalid_payload = verify_jwt_token("invalid_token")
+            assert False, "Should have raised an exception for invalid token"
+        except Exception:
+            # Expected behavior for invalid token
+            pass
+        
+        print("✅ Auth utilities working successfully with proper testing")
+        
+    except ImportError as e:
+        pytest.skip(f"Auth utilities not available: {e}")
+    except Exception as e:
+        # Handle any other errors and provide useful feedback
+        print(f"⚠️ Auth utilities test failed: {e}")
+        pytest.skip(f"Auth utilities test failed: {e}")
+
+
+# ========================= DATABASE MODEL TESTS =========================
+
+def test_user_model():
+    """Test User database model with proper mocking."""
+    from carla_simulator.database.models import User
+    
+    # Test that User model can be imported and used with proper mocking
+    try:
+        # Mock database dependencies
+        with patch("carla_simulator.database.db_manager.DatabaseManager") as mock_db_class:
+            
+            # Set up mock database instance
+            mock_db_instance = MagicMock()
+            mock_db_class.return_value = mock_db_instance
+            
+            # Mock database operations
+            mock_db_instance.execute_query.return_value = [
+                {"id": 1, "username": "testuser", "email": "test@example.com"}
+            ]
+            mock_db_instance.execute_many.return_value = None
+            
+            # Test User model methods
+            assert User is not None
+            
+            # Test user creation
+            user_data = {
+                "username": "testuser",
+                "email": "test@example.com",
+                "password_hash": "hashed_password"
+            }
+            
+            # Test that User model has expected methods (only check for create)
+            assert hasattr(User, 'create')
+            
+            # Test user creation with mock database
+            result = User.create(mock_db_instance, **user_data)
+            
+            # Verify database was called
+            mock_db_instance.execute_query.assert_called()
+            
+            print("✅ User model tested successfully with proper mocking")
+            
+    except ImportError as e:
+        pytest.skip(f"User model not available: {e}")
+    except Exception as e:
+        # Handle any other errors and provide useful feedback
+        print(f"⚠️ User model test failed: {e}")
+        pytest.skip(f"User model test failed: {e}")
+        
+        # Test completed successfully
+
+
+def test_tenant_model():
+    """Test Tenant database model."""
+    from carla_simulator.database.models import Tenant
+    
+    # Test that Tenant model can be imported
+    try:
+        assert Tenant is not None
+        print("✅ Tenant model imported successfully")
+    except ImportError as e:
+        pytest.skip(f"Tenant model not available: {e}")
+
+
+def test_tenant_config_model():
+    """Test TenantConfig database model."""
+    from carla_simulator.database.models import TenantConfig
+    
+    # Test that TenantConfig model can be imported
+    try:
+        assert TenantConfig is not None
+        print("✅ TenantConfig model imported successfully")
+    except ImportError as e:
+        pytest.skip(f"TenantConfig model not available: {e}")
+
+
+def test_database_manager():
+    """Test DatabaseManager functionality."""
+    from carla_simulator.database.db_manager import DatabaseManager
+    
+    # Test that DatabaseManager can be imported
+    try:
+        assert DatabaseManager is not None
+        print("✅ DatabaseManager imported successfully")
+    except ImportError as e:
+        pytest.skip(f"DatabaseManager not available: {e}")
+
+
+# ========================= METRICS TESTS =========================
+
+def test_metrics_functionality():
+    """Test metrics functionality with proper testing."""
+    from carla_simulator.metrics import SimulationMetricsData
+    
+    # Test that SimulationMetricsData can be imported and has expected structure
+    try:
+        assert SimulationMetricsData is not None
+        
+        # Test that it's a class
+        assert isinstance(SimulationMetricsData, type)
+        
+        # Test that it has expected attributes
+        expected_fields = ['scenario_id', 'session_id', 'timestamp', 'elapsed_time', 'speed']
+        for field in expected_fields:
+            if hasattr(SimulationMetricsData, field):
+                print(f"✅ SimulationMetricsData has {field} field")
+        
+        # Test class methods
+        if hasattr(SimulationMetricsData, 'from_simulation_data'):
+            print("✅ SimulationMetricsData has from_simulation_data method")
+        
+        # Test creating an instance
+        metrics = SimulationMetricsData()
+        assert metrics is not None
+        assert hasattr(metrics, 'scenario_id')
+        assert hasattr(metrics, 'speed')
+        
+        print("✅ SimulationMetricsData imported and tested successfully")
+        
+    except ImportError as e:
+        pytest.skip(f"SimulationMetricsData not available: {e}")
+
+
+# ========================= CONTROL INTERFACE TESTS =========================
+
+def test_vehicle_controller():
+    """Test vehicle controller functionality with proper testing."""
+    from carla_simulator.control.vehicle_controller import VehicleController
+    
+    # Test that VehicleController can be imported and has expected structure
+    try:
+        assert VehicleController is not None
+        
+        # Test that it's a class
+        assert isinstance(VehicleController, type)
+        
+        # Test that it has expected attributes/methods
+        assert hasattr(VehicleController, '__init__')
+        
+        # Test for common vehicle controller methods
+        expected_methods = ['apply_control', 'get_vehicle', 'set_vehicle']
+        for method in expected_methods:
+            if hasattr(VehicleController, method):
+                print(f"✅ VehicleController has {method} method")
+        
+        print("✅ VehicleController imported and analyzed successfully")
+        
+    except ImportError as e:
+        pytest.skip(f"VehicleController not available: {e}")
+        
+        # Test completed successfully
+
+
+def test_keyboard_controller():
+    """Test keyboard controller functionality with proper testing."""
+    from carla_simulator.control.keyboard import KeyboardControl
+    
+    # Test that KeyboardControl can be imported and has expected structure
+    try:
+        assert KeyboardControl is not None
+        
+        # Test that it's a class
+        assert isinstance(KeyboardControl, type)
+        
+        # Test that it has expected attributes/methods
+        assert hasattr(KeyboardControl, '__init__')
+        
+        # Test for common keyboard control methods
+        expected_methods = ['process_events', '_handle_key_down', '_handle_key_up', '_setup_control_mapping']
+        for method in expected_methods:
+            if hasattr(KeyboardControl, method):
+                print(f"✅ KeyboardControl has {method} method")
+        
+        # Test creating an instance with mock config
+        mock_config = {
+            "throttle_up": "w",
+            "throttle_down": "s", 
+            "steer_left": "a",
+            "steer_right": "d",
+            "brake": "space",
+            "hand_brake": "q",
+            "reverse": "r"
+        }
+        
+        try:
+            controller = KeyboardControl(mock_config)
+            assert controller is not None
+            assert hasattr(controller, 'config')
+            assert hasattr(controller, 'control_state')
+            print("✅ KeyboardControl instance created successfully")
+        except Exception as e:
+            print(f"⚠️ KeyboardControl instantiation failed: {e}")
+        
+        print("✅ KeyboardControl imported and analyzed successfully")
+        
+    except ImportError as e:
+        pytest.skip(f"KeyboardControl not available: {e}")
+
+
+def test_keyboard_controller_error_handling():
+    """Test keyboard controller error handling for web mode."""
+    from carla_simulator.control.controller import KeyboardController
+    from carla_simulator.utils.config import ControllerConfig, KeyboardConfig
+    
+    # Test that KeyboardController properly handles web mode errors
+    try:
+        # Create a mock controller config with required parameters
+        keyboard_config = KeyboardConfig(
+            forward=["w", "up"],
+            backward=["s", "down"],
+            left=["a", "left"],
+            right=["d", "right"],
+            brake=["space"],
+            hand_brake=["q"],
+            reverse=["r"],
+            quit=["escape"]
+        )
+        
+        mock_config = ControllerConfig(
+            type="keyboard",
+            steer_speed=1.0,
+            throttle_speed=1.0,
+            brake_speed=1.0,
+            keyboard=keyboard_config
+        )
+        
+        # Test that the error message is clear for web mode
+        # This test verifies that the error handling is in place
+        # The actual pygame initialization error would occur in a headless environment
+        print("✅ KeyboardController error handling test completed")
+        
+    except ImportError as e:
+        pytest.skip(f"KeyboardController not available: {e}")
+
+
+# ========================= VISUALIZATION TESTS =========================
+
+def test_display_manager():
+    """Test display manager functionality with proper testing."""
+    from carla_simulator.visualization.display_manager import DisplayManager
+    
+    # Test that DisplayManager can be imported and has expected structure
+    try:
+        assert DisplayManager is not None
+        
+        # Test that it's a class
+        assert isinstance(DisplayManager, type)
+        
+        # Test that it has expected attributes/methods
+        assert hasattr(DisplayManager, '__init__')
+        
+        # Test for common display manager methods
+        expected_methods = ['render_frame', 'update', 'close', 'get_current_frame']
+        for method in expected_methods:
+            if hasattr(DisplayManager, method):
+                print(f"✅ DisplayManager has {method} method")
+        
+        # Test creating an instance with mock config
+        mock_config = {"width": 800, "height": 600, "fps": 30}
+        
+        try:
+            display = DisplayManager(mock_config)
+            assert display is not None
+            assert hasattr(display, 'config')
+            print("✅ DisplayManager instance created successfully")
+        except Exception as e:
+            print(f"⚠️ DisplayManager instantiation failed: {e}")
+        
+        print("✅ DisplayManager imported and analyzed successfully")
+        
+    except ImportError as e:
+        pytest.skip(f"DisplayManager not available: {e}")
+
+
+def test_camera_manager():
+    """Test camera manager functionality with proper testing."""
+    from carla_simulator.visualization.camera import CameraManager
+    
+    # Test that CameraManager can be imported and has expected structure
+    try:
+        assert CameraManager is not None
+        
+        # Test that it's a class
+        assert isinstance(CameraManager, type)
+        
+        # Test that it has expected attributes/methods
+        assert hasattr(CameraManager, '__init__')
+        
+        # Test for common camera manager methods
+        expected_methods = ['get_image', 'update', 'close', 'get_sensor_data']
+        for method in expected_methods:
+            if hasattr(CameraManager, method):
+                print(f"✅ CameraManager has {method} method")
+        
+        # Test creating an instance with mock parameters
+        mock_parent_actor = MagicMock()
+        mock_config = {"fov": 90, "image_size_x": 800, "image_size_y": 600}
+        
+        try:
+            camera = CameraManager(mock_parent_actor, mock_config)
+            assert camera is not None
+            assert hasattr(camera, 'config')
+            print("✅ CameraManager instance created successfully")
+        except Exception as e:
+            print(f"⚠️ CameraManager instantiation failed: {e}")
+        
+        print("✅ CameraManager imported and analyzed successfully")
+        
+    except ImportError as e:
+        pytest.skip(f"CameraManager not available: {e}")
+
+
+def test_web_display_manager():
+    """Test web display manager functionality with proper testing."""
+    from carla_simulator.visualization.web_display_manager import WebDisplayManager
+    
+    # Test that WebDisplayManager can be imported and has expected structure
+    try:
+        assert WebDisplayManager is not None
+        
+        # Test that it's a class
+        assert isinstance(WebDisplayManager, type)
+        
+        # Test that it has expected attributes/methods
+        assert hasattr(WebDisplayManager, '__init__')
+        
+        # Test for common web display manager methods
+        expected_methods = ['get_current_frame', 'update', 'start_server', 'stop_server']
+        for method in expected_methods:
+            if hasattr(WebDisplayManager, method):
+                print(f"✅ WebDisplayManager has {method} method")
+        
+        # Test creating an instance with mock config
+        mock_config = {"port": 8080, "host": "localhost"}
+        
+        try:
+            web_display = WebDisplayManager(mock_config)
+            assert web_display is not None
+            assert hasattr(web_display, 'config')
+            print("✅ WebDisplayManager instance created successfully")
+        except Exception as e:
+            print(f"⚠️ WebDisplayManager instantiation failed: {e}")
+        
+        print("✅ WebDisplayManager imported and analyzed successfully")
+        
+    except ImportError as e:
+        pytest.skip(f"WebDisplayManager not available: {e}")
+
+
+# ========================= CLI TESTS =========================
+
+def test_cli_interface():
+    """Test CLI interface functionality with proper testing."""
+    from carla_simulator.cli import main
+    
+    # Test that CLI main function can be imported and has expected structure
+    try:
+        assert main is not None
+        
+        # Test that it's a callable function
+        assert callable(main)
+        
+        # Test function signature
+        import inspect
+        sig = inspect.signature(main)
+        print(f"✅ CLI main function signature: {sig}")
+        
+        print("✅ CLI main function imported and analyzed successfully")
+        
+    except ImportError as e:
+        pytest.skip(f"CLI main function not available: {e}")
+
+
+# ========================= INTEGRATION TESTS =========================
+
+def test_full_simulation_workflow(mock_carla_modules):
+    """Test full simulation workflow integration with proper testing."""
+    from carla_simulator.core.simulation_runner import SimulationRunner
+    
+    # Test that SimulationRunner can be imported and has expected structure
+    try:
+        assert SimulationRunner is not None
+        
+        # Check if it's mocked (MagicMock) or actual class
+        if hasattr(SimulationRunner, '_mock_name'):
+            # It's a mock, test mock behavior
+            print(f"✅ SimulationRunner is mocked: {SimulationRunner._mock_name}")
+            
+            # Test that mock can be called
+            mock_instance = SimulationRunner()
+            assert mock_instance is not None
+            
+            # Test common methods on mock
+            expected_methods = ['setup_logger', 'register_scenarios', 'create_application', 'setup_components', 'run']
+            for method in expected_methods:
+                if hasattr(mock_instance, method):
+                    print(f"✅ Mock SimulationRunner has {method} method")
+            
+        else:
+            # It's a real class, test class behavior
+            assert isinstance(SimulationRunner, type)
+            assert hasattr(SimulationRunner, '__init__')
+            
+            # Test for common simulation runner methods
+            expected_methods = ['setup_logger', 'register_scenarios', 'create_application', 'setup_components', 'run']
+            for method in expected_methods:
+                if hasattr(SimulationRunner, method):
+                    print(f"✅ SimulationRunner has {method} method")
+        
+        print("✅ SimulationRunner imported and analyzed successfully")
+        
+    except ImportError as e:
+        pytest.skip(f"SimulationRunner not available: {e}")
+
+
+def test_scenario_execution_flow(mock_carla_modules):
+    """Test scenario execution flow."""
+    from carla_simulator.scenarios.follow_route_scenario import FollowRouteScenario
+    
+    # Test that FollowRouteScenario can be imported
+    try:
+        assert FollowRouteScenario is not None
+        print("✅ Scenario execution flow test passed")
+    except ImportError as e:
+        pytest.skip(f"FollowRouteScenario not available: {e}")
+
+
+# ========================= ERROR HANDLING TESTS =========================
+
+def test_configuration_error_handling():
+    """Test configuration error handling with proper testing."""
+    from carla_simulator.utils.config import ConfigLoader
+    
+    # Test that ConfigLoader can be imported and has expected structure
+    try:
+        assert ConfigLoader is not None
+        
+        # Test that it's a class
+        assert isinstance(ConfigLoader, type)
+        
+        # Test that it has expected attributes/methods
+        assert hasattr(ConfigLoader, '__init__')
+        
+        # Test for common config loader methods
+        expected_methods = ['get_config', 'load_config', 'validate_config']
+        for method in expected_methods:
+            if hasattr(ConfigLoader, method):
+                print(f"✅ ConfigLoader has {method} method")
+        
+        print("✅ Configuration error handling test passed with proper analysis")
+        
+    except ImportError as e:
+        pytest.skip(f"ConfigLoader not available: {e}")
+
+
+def test_scenario_error_handling():
+    """Test scenario error handling with proper testing."""
+    from carla_simulator.scenarios.base_scenario import BaseScenario
+    
+    # Test that BaseScenario can be imported and has expected structure
+    try:
+        assert BaseScenario is not None
+        
+        # Test that it's a class
+        assert isinstance(BaseScenario, type)
+        
+        # Test that it has expected attributes/methods
+        assert hasattr(BaseScenario, '__init__')
+        
+        # Test for common scenario methods
+        expected_methods = ['setup', 'run', 'cleanup', 'validate']
+        for method in expected_methods:
+            if hasattr(BaseScenario, method):
+                print(f"✅ BaseScenario has {method} method")
+        
+        print("✅ Scenario error handling test passed with proper analysis")
+        
+    except ImportError as e:
+        pytest.skip(f"BaseScenario not available: {e}")
+
+
+def test_database_connection_error():
+    """Test database connection error handling with proper testing."""
+    from carla_simulator.database.db_manager import DatabaseManager
+    
+    # Test that DatabaseManager can be imported and has expected structure
+    try:
+        assert DatabaseManager is not None
+        
+        # Test that it's a class
+        assert isinstance(DatabaseManager, type)
+        
+        # Test that it has expected attributes/methods
+        assert hasattr(DatabaseManager, '__init__')
+        
+        # Test for common database manager methods
+        expected_methods = ['execute_query', 'execute_many', 'get_connection', 'close']
+        for method in expected_methods:
+            if hasattr(DatabaseManager, method):
+                print(f"✅ DatabaseManager has {method} method")
+        
+        print("✅ Database connection error handling test passed with proper analysis")
+        
+    except ImportError as e:
+        pytest.skip(f"DatabaseManager not available: {e}")
+
+
+# ========================= PERFORMANCE TESTS =========================
+
+def test_scenario_performance():
+    """Test scenario performance characteristics with proper testing."""
+    from carla_simulator.scenarios.follow_route_scenario import FollowRouteScenario
+    
+    # Test that FollowRouteScenario can be imported and has expected structure
+    try:
+        assert FollowRouteScenario is not None
+        
+        # Test that it's a class
+        assert isinstance(FollowRouteScenario, type)
+        
+        # Test that it has expected attributes/methods
+        assert hasattr(FollowRouteScenario, '__init__')
+        
+        # Test for common scenario methods
+        expected_methods = ['setup', 'run', 'cleanup', 'follow_route']
+        for method in expected_methods:
+            if hasattr(FollowRouteScenario, method):
+                print(f"✅ FollowRouteScenario has {method} method")
+        
+        print("✅ Scenario performance test passed with proper analysis")
+        
+    except ImportError as e:
+        pytest.skip(f"FollowRouteScenario not available: {e}")
+
+
+def test_concurrent_scenario_execution():
+    """Test concurrent scenario execution with proper testing."""
+    from carla_simulator.scenarios.follow_route_scenario import FollowRouteScenario
+    
+    # Test that FollowRouteScenario can be imported and has expected structure
+    try:
+        assert FollowRouteScenario is not None
+        
+        # Test that it's a class
+        assert isinstance(FollowRouteScenario, type)
+        
+        # Test that it has expected attributes/methods
+        assert hasattr(FollowRouteScenario, '__init__')
+        
+        # Test for common scenario methods
+        expected_methods = ['setup', 'run', 'cleanup', 'follow_route']
+        for method in expected_methods:
+            if hasattr(FollowRouteScenario, method):
+                print(f"✅ FollowRouteScenario has {method} method")
+        
+        print("✅ Concurrent scenario execution test passed with proper analysis")
+        
+    except ImportError as e:
+        pytest.skip(f"FollowRouteScenario not available: {e}")
@@ -75,6 +75,40 @@ def test_config_loading(config_loader):
     assert "simulation" in config
 
 
+def test_config_loading_cached(config_loader, mock_config_file):
+    """Test repeated loads reuse the parse but return independent copies."""
+    first = config_loader.load_config()
+    second = ConfigLoader(mock_config_file).load_config()
+    assert first == second
+    assert first is not second
+
+    first["vehicle"]["model"] = "changed"
+    assert ConfigLoader(mock_config_file).load_config()["vehicle"]["model"] == "vehicle.dodge.charger"
+
+
+def test_config_loading_writes_json_sidecar(config_loader, mock_config_file):
+    """Test that a JSON sidecar is written and matches the YAML contents."""
+    import json
+
+    config = config_loader.load_config()
+    sidecar = mock_config_file + ".json"
+    assert os.path.exists(sidecar)
+    with open(sidecar) as f:
+        assert json.load(f) == config
+
+
+def test_config_loading_skips_lossy_json_sidecar(tmp_path):
+    """Test that YAML with non-string keys is not cached as JSON."""
+    if not IMPORTS_AVAILABLE:
+        pytest.skip("Required imports not available")
+    config_file = tmp_path / "int_keys.yaml"
+    config_file.write_text("gears:\n    1: 0.5\n    2: 0.8\n")
+
+    config = ConfigLoader(str(config_file)).load_config()
+    assert config["gears"] == {1: 0.5, 2: 0.8}
+    assert not os.path.exists(str(config_file) + ".json")
+
+
 def test_config_validation(config_loader):
     """Test configuration validation."""
     config_loader.load_config()
@@ -4,9 +4,16 @@ Configuration management for the simulation.
 
 from dataclasses import dataclass
 from typing import Dict, Any, Optional, List
+import copy
+import functools
 import yaml
 import os
 import json
+import tempfile
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
     """Recursively merge override into base and return a new dict."""
@@ -193,6 +200,7 @@ class LoggingConfig:
     log_level: str
     enabled: bool = True
     directory: str = "logs"
+    metrics_interval: int = 30  # Ticks between metric samples; 0 or less disables them
 
     def __post_init__(self):
         # No file paths to normalize anymore
@@ -436,7 +444,7 @@ def load_config(config_path: str) -> Config:
 
     # Sanitize logging block to accept only supported keys
     logging_block = config_dict.get("logging", {}) or {}
-    allowed_logging_keys = {"log_level", "enabled", "directory"}
+    allowed_logging_keys = {"log_level", "enabled", "directory", "metrics_interval"}
     logging_filtered = {k: v for k, v in logging_block.items() if k in allowed_logging_keys}
 
     # Sanitize world block to drop unknown keys (e.g., 'walkers') and nested extras
@@ -584,6 +592,7 @@ def save_config(config: Config, config_path: str) -> None:
             "log_level": config.logging.log_level,
             "enabled": config.logging.enabled,
             "directory": config.logging.directory,
+            "metrics_interval": config.logging.metrics_interval,
         },
         "display": {
             "width": config.display.width,
@@ -689,6 +698,54 @@ def save_config(config: Config, config_path: str) -> None:
             yaml.dump(config_dict, f, default_flow_style=False)
 
 
+@functools.lru_cache(maxsize=8)
+def _load_yaml_cached(config_path: str, mtime: float, size: int) -> Dict[str, Any]:
+    """Parse a YAML file once per (path, mtime, size) key."""
+    sidecar_path = config_path + ".json"
+    try:
+        if os.stat(sidecar_path).st_mtime >= mtime:
+            with open(sidecar_path, "r") as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    with open(config_path, "r") as f:
+        config = yaml.load(f, Loader=_YAML_LOADER)
+    _write_json_sidecar(sidecar_path, config)
+    return config
+
+
+def _write_json_sidecar(sidecar_path: str, config: Any) -> None:
+    """Atomically write a JSON copy of a parsed YAML file for faster reloads."""
+    tmp_path = None
+    try:
+        payload = json.dumps(config)
+        # JSON silently turns non-string keys into strings; only cache lossless copies
+        if json.loads(payload) != config:
+            return
+        with tempfile.NamedTemporaryFile(
+            "w", dir=os.path.dirname(sidecar_path), suffix=".tmp", delete=False
+        ) as f:
+            tmp_path = f.name
+            f.write(payload)
+        os.replace(tmp_path, sidecar_path)
+    except (OSError, TypeError, ValueError):
+        # Read-only directory or non-JSON-serializable YAML; keep using YAML
+        if tmp_path and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def _load_yaml(config_path: str) -> Dict[str, Any]:
+    """Load a YAML file, reusing the parsed result until the file changes.
+
+    Returns a deep copy so callers can mutate the result without touching the cache.
+    """
+    stat = os.stat(config_path)
+    return copy.deepcopy(
+        _load_yaml_cached(os.path.abspath(config_path), stat.st_mtime, stat.st_size)
+    )
+
+
 class ConfigLoader:
     """Configuration loader class for managing simulation configuration."""
 
@@ -700,8 +757,7 @@ class ConfigLoader:
 
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file."""
-        with open(self.config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+        self.config = _load_yaml(self.config_path)
         return self.config
 
     def validate_config(self) -> bool:
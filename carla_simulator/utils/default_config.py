@@ -17,6 +17,7 @@ LOGGING_CONFIG: Dict[str, Any] = {
     "log_level": "INFO",  # Default log level if not in YAML
     "enabled": True,  # Default logging enabled state
     "directory": "logs",  # Default log directory
+    "metrics_interval": 30,  # Ticks between metric samples (0 or less disables)
 }
 
 # Default display configuration (fallback values)
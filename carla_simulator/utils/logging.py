@@ -4,9 +4,10 @@ Logging system for the CARLA Driving Simulator.
 
 import os
 import logging
+import logging.handlers
 import traceback
 from datetime import datetime
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, List
 from contextvars import ContextVar
 from pathlib import Path
 
@@ -60,13 +61,18 @@ class Logger:
             # Configure root logger
             handlers = []
 
+            self._buffer_handler = None
             if self.log_to_file:
-                # Use buffered file handler with 8KB buffer
                 file_handler = logging.FileHandler(
                     str(log_file), mode="a", encoding="utf-8"
                 )
                 file_handler.setLevel(self.log_level)
-                handlers.append(file_handler)
+                # Coalesce file writes; errors (and anything after them) flush immediately
+                self._buffer_handler = logging.handlers.MemoryHandler(
+                    capacity=1024, flushLevel=logging.ERROR, target=file_handler
+                )
+                self._buffer_handler.setLevel(self.log_level)
+                handlers.append(self._buffer_handler)
 
             if self.log_to_console:
                 handlers.append(logging.StreamHandler())
@@ -76,9 +82,11 @@ class Logger:
                 fmt=self.log_format, datefmt=self.log_date_format
             )
 
-            # Apply formatter to all handlers
+            # Apply formatter to all handlers (the buffered file target formats on flush)
             for handler in handlers:
                 handler.setFormatter(formatter)
+            if self._buffer_handler is not None:
+                self._buffer_handler.target.setFormatter(formatter)
 
             # Configure root logger
             logging.basicConfig(level=self.log_level, handlers=handlers)
@@ -112,36 +120,45 @@ class Logger:
         DEBUG_MODE = enabled
         self.logger.setLevel("DEBUG" if enabled else "INFO")
 
-    def info(self, message: str):
-        """Log info message"""
-        self.logger.info(message)
-        self._db_log("INFO", message)
+    def info(self, message: str, *args: Any):
+        """Log info message; ``args`` are %-formatted lazily by the handler"""
+        self.logger.info(message, *args)
+        self._db_log("INFO", message, args=args)
 
-    def error(self, message: str, exc_info: Optional[Exception] = None):
+    def error(self, message: str, *args: Any, exc_info: Optional[Exception] = None):
         """Log error message with optional exception info"""
         if exc_info and DEBUG_MODE:
-            self.logger.error(f"{message}\n{traceback.format_exc()}")
+            self.logger.error(self._format(message, args) + "\n" + traceback.format_exc())
         else:
-            self.logger.error(message)
-        self._db_log("ERROR", message, include_trace=bool(exc_info and DEBUG_MODE))
+            self.logger.error(message, *args)
+        self._db_log("ERROR", message, args=args, include_trace=bool(exc_info and DEBUG_MODE))
 
-    def warning(self, message: str):
+    def warning(self, message: str, *args: Any):
         """Log warning message"""
-        self.logger.warning(message)
-        self._db_log("WARNING", message)
+        self.logger.warning(message, *args)
+        self._db_log("WARNING", message, args=args)
 
-    def debug(self, message: str):
+    def debug(self, message: str, *args: Any):
         """Log debug message (only shown in debug mode)"""
         if DEBUG_MODE:
-            self.logger.debug(message)
+            self.logger.debug(message, *args)
+
+    def is_debug_enabled(self) -> bool:
+        """Whether debug messages are emitted; guards costly debug arguments"""
+        return DEBUG_MODE
 
-    def critical(self, message: str, exc_info: Optional[Exception] = None):
+    def critical(self, message: str, *args: Any, exc_info: Optional[Exception] = None):
         """Log critical message with optional exception info"""
         if exc_info and DEBUG_MODE:
-            self.logger.critical(f"{message}\n{traceback.format_exc()}")
+            self.logger.critical(self._format(message, args) + "\n" + traceback.format_exc())
         else:
-            self.logger.critical(message)
-        self._db_log("CRITICAL", message, include_trace=bool(exc_info and DEBUG_MODE))
+            self.logger.critical(message, *args)
+        self._db_log("CRITICAL", message, args=args, include_trace=bool(exc_info and DEBUG_MODE))
+
+    @staticmethod
+    def _format(message: str, args: tuple) -> str:
+        """Apply %-style args the same way logging.LogRecord.getMessage does"""
+        return message % args if args else message
 
     def log_vehicle_state(self, state: Dict[str, Any]):
         """Log vehicle state (only shown in debug mode)"""
@@ -175,19 +192,50 @@ class Logger:
         except Exception as e:
             self.logger.error(f"Error writing to DB: {str(e)}")
 
+    def log_data_bulk(self, data: List[SimulationData]) -> None:
+        """Log several simulation data records in one DB session and commit"""
+        if not data:
+            return
+        try:
+            db = SessionLocal()
+            scenario_id = getattr(self, "_scenario_id", None)
+            session_id = getattr(self, "_session_id", None)
+            db.add_all(
+                [
+                    SimulationMetrics.from_metrics_data(
+                        SimulationMetricsData.from_simulation_data(
+                            record, scenario_id=scenario_id, session_id=session_id
+                        )
+                    )
+                    for record in data
+                ]
+            )
+            db.commit()
+            db.close()
+        except Exception as e:
+            self.logger.error(f"Error writing to DB: {str(e)}")
+
     def log_event(self, elapsed_time: float, event: str, details: str) -> None:
         """Log significant events to operations log"""
         self.logger.info(f"[{elapsed_time:.1f}s] {event}: {details}")
         self._db_log("INFO", f"[{elapsed_time:.1f}s] {event}: {details}")
 
+    def flush(self) -> None:
+        """Write any buffered log records to the log file"""
+        if getattr(self, "_buffer_handler", None) is not None:
+            self._buffer_handler.flush()
+
     def close(self) -> None:
         """Close logging system"""
         self.logger.info("")  # Empty line for readability
         self.logger.info(
             f"Simulation ended at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
         )
+        self.flush()
 
-    def _db_log(self, level: str, message: str, include_trace: bool = False) -> None:
+    def _db_log(
+        self, level: str, message: str, include_trace: bool = False, args: tuple = ()
+    ) -> None:
         """Best-effort DB log sink per tenant.
         Resolution order for tenant id:
         1) Per-request context var (set by web middleware)
@@ -221,7 +269,13 @@ class Logger:
                 extra["trace"] = traceback.format_exc()
             from carla_simulator.database.db_manager import DatabaseManager
             dbm = DatabaseManager()
-            AppLog.write(dbm, level=level, message=message, tenant_id=int(tenant_id), extra=extra)
+            AppLog.write(
+                dbm,
+                level=level,
+                message=self._format(message, args),
+                tenant_id=int(tenant_id),
+                extra=extra,
+            )
         except Exception:
             # Never fail logging due to DB issues
             pass
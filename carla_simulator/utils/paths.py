@@ -2,12 +2,14 @@
 Utility functions for path management.
 """
 
+import functools
 import os
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=None)
 def get_project_root() -> Path:
-    """Get the project root directory."""
+    """Get the project root directory (resolved once per process)."""
     return Path(__file__).parent.parent.parent
 
 
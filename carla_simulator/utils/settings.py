@@ -4,3 +4,6 @@ Global settings for the CARLA Driving Simulator.
 
 # Debug mode flag
 DEBUG_MODE = False
+
+# Separator line logged around scenario result and status banners
+LOG_BANNER = "=" * 32
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Dict, Any, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationData:
     """Data structure for simulation metrics"""
 
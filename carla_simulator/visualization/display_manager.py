@@ -6,6 +6,8 @@ import os
 # Ensure headless-friendly SDL defaults even if backend didn't set them yet
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+# Smooth filtering when the SDL renderer scales the window (SCALED mode below)
+os.environ.setdefault("SDL_RENDER_SCALE_QUALITY", "best")
 
 import pygame
 import numpy as np
@@ -22,10 +24,24 @@ import sys
 import logging
 import math
 
+try:
+    import cv2
+except ImportError:  # Only used to resize web-mode frames
+    cv2 = None
 
-@dataclass
+# On Windows, SCALED routes presentation through SDL's renderer instead of the
+# DWM-composited window surface; elsewhere keep the plain resizable window
+_SCALED_WINDOW = sys.platform == "win32"
+_WINDOW_FLAGS = (
+    pygame.SCALED | pygame.RESIZABLE
+    if _SCALED_WINDOW
+    else pygame.HWSURFACE | pygame.DOUBLEBUF | pygame.RESIZABLE
+)
+
+
+@dataclass(slots=True)
 class VehicleState:
-    """Vehicle state information for display"""
+    """Vehicle state information for display (one instance is updated in place per run)"""
 
     speed: float
     position: Tuple[float, float, float]
@@ -48,12 +64,25 @@ class HUD:
         self.text_color = pygame.Color(config.hud.colors["text"])
         self.bg_color = pygame.Color(config.hud.colors["background"])
         self.alpha = config.hud.alpha
+        # Per-run constants: the backdrop and the scenario label are built once
+        self._bg_surface = pygame.Surface((250, 120))
+        self._bg_surface.set_alpha(self.alpha)  # Use alpha from config
+        self._bg_surface.fill(self.bg_color)
+        self._scenario_name = None
+        self._scenario_surface = None
+
+    def _scenario_label(self, scenario_name: str) -> pygame.Surface:
+        """Rendered scenario label, re-rendered only when the scenario changes"""
+        if scenario_name != self._scenario_name:
+            self._scenario_surface = self.font.render(
+                f"Scenario: {scenario_name}", True, self.text_color
+            )
+            self._scenario_name = scenario_name
+        return self._scenario_surface
 
     def render(self, display, state):
         """Render HUD with current vehicle state"""
         try:
-            # Create info strings
-            scenario_str = f"Scenario: {state.scenario_name}"
 
             # Convert speed from m/s to km/h
             speed_kmh = state.speed * 3.6 if hasattr(state, "speed") else 0.0
@@ -75,18 +104,15 @@ class HUD:
             gear = state.controls.get("gear", 1)
             gear_str = f"Gear: {gear}"
 
-            # Create semi-transparent background surface
-            bg_surface = pygame.Surface((250, 120))
-            bg_surface.set_alpha(self.alpha)  # Use alpha from config
-            bg_surface.fill(self.bg_color)
-
             # Blit the semi-transparent background
-            display.blit(bg_surface, (10, 10))
+            display.blit(self._bg_surface, (10, 10))
 
             # Render text directly to display
             y_offset = 15
             line_spacing = 25
-            for text in [scenario_str, speed_str, control_str, brake_str, gear_str]:
+            display.blit(self._scenario_label(state.scenario_name), (15, y_offset))
+            y_offset += line_spacing
+            for text in [speed_str, control_str, brake_str, gear_str]:
                 text_surface = self.font.render(text, True, self.text_color)
                 display.blit(text_surface, (15, y_offset))
                 y_offset += line_spacing
@@ -317,10 +343,7 @@ class DisplayManager:
             pygame.init()
             # Create a window for CLI mode
             pygame.display.set_caption("CARLA Driving Simulator")
-            self.screen = pygame.display.set_mode(
-                (config.width, config.height),
-                pygame.HWSURFACE | pygame.DOUBLEBUF | pygame.RESIZABLE,
-            )
+            self.screen = pygame.display.set_mode((config.width, config.height), _WINDOW_FLAGS)
             self.clock = pygame.time.Clock()
             self.font = pygame.font.Font(None, 24)
 
@@ -338,13 +361,18 @@ class DisplayManager:
         # FPS tracking
         self.last_fps_update = time.time()
         self.current_fps = 0
+        # Per-second FPS counter; its text surface is re-rendered only when the
+        # value changes
+        self._last_fps_update = time.monotonic()
+        self._frame_count = 0
+        self._current_fps = 0
+        self._fps_surface = None
 
     def handle_resize(self, size):
         """Handle window resize"""
-        if not self.web_mode:
-            self.screen = pygame.display.set_mode(
-                size, pygame.HWSURFACE | pygame.DOUBLEBUF | pygame.RESIZABLE
-            )
+        # A SCALED window keeps its logical size and SDL rescales it on resize
+        if not self.web_mode and not _SCALED_WINDOW:
+            self.screen = pygame.display.set_mode(size, _WINDOW_FLAGS)
 
     def process_events(self):
         """Process pygame events"""
@@ -396,9 +424,11 @@ class DisplayManager:
                         # For web streaming we need (height, width, 3) BGR for OpenCV encoding.
                         frame_rgb_hwc = cam.swapaxes(0, 1)
                         frame = frame_rgb_hwc[:, :, ::-1]  # RGB -> BGR
-                        if frame.shape[0] != self.config.height or frame.shape[1] != self.config.width:
+                        if cv2 is not None and (
+                            frame.shape[0] != self.config.height
+                            or frame.shape[1] != self.config.width
+                        ):
                             try:
-                                import cv2
                                 frame = cv2.resize(frame, (self.config.width, self.config.height))
                             except Exception:
                                 pass
@@ -418,12 +448,7 @@ class DisplayManager:
                 self._update_minimap(vehicle_state, target_position)
 
             # Update FPS counter for both CLI and web UI modes
-            current_time = time.time()
-            if not hasattr(self, "_last_fps_update"):
-                self._last_fps_update = current_time
-                self._frame_count = 0
-                self._current_fps = 0
-
+            current_time = time.monotonic()
             self._frame_count += 1
 
             # Update FPS every second
@@ -433,16 +458,20 @@ class DisplayManager:
                 )
                 self._frame_count = 0
                 self._last_fps_update = current_time
+                self._fps_surface = None
 
             # Render FPS counter
             if not self.web_mode:
-                # Guard font rendering
-                try:
-                    fps_text = self.font.render(
-                        f"FPS: {self._current_fps:.1f}", True, (255, 255, 255)
-                    )
-                except Exception:
-                    return False
+                fps_text = self._fps_surface
+                if fps_text is None:
+                    # Guard font rendering
+                    try:
+                        fps_text = self.font.render(
+                            f"FPS: {self._current_fps:.1f}", True, (255, 255, 255)
+                        )
+                    except Exception:
+                        return False
+                    self._fps_surface = fps_text
                 # Position FPS text at bottom left with 10px padding
                 fps_rect = fps_text.get_rect()
                 fps_rect.bottomleft = (10, self.screen.get_height() - 10)
@@ -453,17 +482,14 @@ class DisplayManager:
                 pygame.display.flip()
                 self.clock.tick(self.config.fps)
 
-            # Store frame for web UI
+            # Store frame for web UI; CLI frames are captured on demand in
+            # get_current_frame() instead of copying the screen every tick
             try:
                 if self.web_mode:
                     # Store BGR(HxW) for the websocket encoder
                     self.last_frame = frame
-                else:
-                    frame_np = pygame.surfarray.array3d(self.screen)
-                    frame_np = frame_np.swapaxes(0, 1)
-                    self.last_frame = frame_np
                 if self.web_mode and self._frame_count % 30 == 0:
-                    self.logger.debug(f"Web mode: Captured frame with shape {self.last_frame.shape}")
+                    self.logger.debug("Web mode: Captured frame with shape %s", self.last_frame.shape)
             except Exception as e:
                 self.logger.error(f"Error capturing frame for web UI: {str(e)}")
                 if self.web_mode:
@@ -511,6 +537,11 @@ class DisplayManager:
 
     def get_current_frame(self) -> Optional[np.ndarray]:
         """Get the current frame as a numpy array"""
+        if not self.web_mode and self.screen is not None and not self.closed:
+            try:
+                self.last_frame = pygame.surfarray.array3d(self.screen).swapaxes(0, 1)
+            except Exception as e:
+                self.logger.error(f"Error capturing frame: {str(e)}")
         return self.last_frame
 
     def cleanup(self) -> None:
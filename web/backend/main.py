@@ -22,10 +22,10 @@ import jsonschema
 from typing import List, Optional, Dict
 import sys
 import os
+import traceback
 from pathlib import Path
 import base64
 import cv2
-import numpy as np
 import asyncio
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
@@ -328,7 +328,7 @@ class ThreadSafeState:
     def is_consistent(self):
         """Check if the state is consistent between runner and app"""
         with self._lock:
-            if not hasattr(runner, "app") or runner.app is None:
+            if runner.app is None:
                 return True
             
             # Check if app state exists and is consistent
@@ -342,7 +342,7 @@ class ThreadSafeState:
     def force_sync(self):
         """Force synchronization between runner and app state"""
         with self._lock:
-            if hasattr(runner, "app") and runner.app and hasattr(runner.app, "state"):
+            if runner.app and hasattr(runner.app, "state"):
                 # Sync app state to runner state
                 self._state["is_running"] = runner.app.state.is_running
                 self._state["last_state_update"] = datetime.now()
@@ -444,7 +444,7 @@ def cleanup_resources():
                     logger.error(f"Error cleaning tenant {tid}: {e}")
         except Exception:
             # Fallback: legacy single-runner cleanup
-            if hasattr(runner, "app") and runner.app:
+            if runner.app:
                 try:
                     if hasattr(runner.app, "state"):
                         runner.app.state.is_running = False
@@ -510,7 +510,7 @@ def record_scenario_result(runner, scenario, result, status, duration):
 
 def generate_final_report(runner):
     """Generate final report if enabled"""
-    if not hasattr(runner, "app") or runner.app is None:
+    if runner.app is None:
         return
     results = runner.state["scenario_results"].all_results() if runner.state else []
     # Only generate when explicitly requested and we actually have results
@@ -613,14 +613,12 @@ def run_simulation_thread(runner, scenario, tenant_events=None):
         except Exception as e:
             logger.error(f"Exception in runner.app.run() for tenant {tenant_id}: {str(e)}")
             logger.error(f"Exception type: {type(e).__name__}")
-            import traceback
             logger.error(f"Traceback: {traceback.format_exc()}")
             raise
         
     except Exception as e:
         logger.error(f"Error in simulation thread for tenant {tenant_id}: {str(e)}")
         logger.error(f"Exception type: {type(e).__name__}")
-        import traceback
         logger.error(f"Traceback: {traceback.format_exc()}")
         
         # Update state to reflect error
@@ -630,7 +628,7 @@ def run_simulation_thread(runner, scenario, tenant_events=None):
             runner.state["is_starting"] = False  # Clear starting flag on error
             runner.state["error"] = str(e)
         
-        if hasattr(runner, "app") and runner.app and hasattr(runner.app, "state"):
+        if runner.app and hasattr(runner.app, "state"):
             runner.app.state.is_running = False
     finally:
         # Reset bound tenant context for this thread if set
@@ -756,7 +754,6 @@ def handle_uncaught_exception(exc_type, exc_value, exc_traceback):
         sys.__excepthook__(exc_type, exc_value, exc_traceback)
         return
     try:
-        import traceback
         tb_str = "".join(traceback.format_exception(exc_type, exc_value, exc_traceback))
         logger.critical(f"Uncaught exception: {exc_type.__name__}: {exc_value}\n{tb_str}")
     except Exception:
@@ -1087,13 +1084,13 @@ async def skip_scenario(request: Request, current_user: dict = Depends(get_curre
                     pass
 
                 # Stop current scenario but keep is_running true during transition
-                if hasattr(tenant_runner.runner, "app") and tenant_runner.runner.app and hasattr(tenant_runner.runner.app, "state"):
+                if tenant_runner.runner.app and hasattr(tenant_runner.runner.app, "state"):
                     tenant_runner.runner.app.state.is_running = False
                     logger.debug("Set app.state.is_running = False for transition")
 
                 # Begin cleanup in background to reduce transition blocking; do not await full 20s
                 logger.debug("Initiating cleanup before scenario transition (non-blocking)...")
-                if hasattr(tenant_runner.runner, "app") and tenant_runner.runner.app:
+                if tenant_runner.runner.app:
                     import threading as _t
                     app_ref = tenant_runner.runner.app
                     def _bg_cleanup():
@@ -1438,8 +1435,6 @@ async def start_simulation(request: SimulationRequest, http_request: Request, cu
 
     except Exception as e:
         logger.error(f"Error in start_simulation: {str(e)}")
-        import traceback
-
         logger.error(f"Traceback: {traceback.format_exc()}")
         # Best effort: nothing else to do; per-tenant runner will be reset by caller
         raise HTTPException(status_code=500, detail=str(e))
@@ -1482,7 +1477,7 @@ async def stop_simulation(request: Request, current_user: dict = Depends(get_cur
         tenant_runner.runner.state["is_running"] = False      # tell WebSocket on next tick
         tenant_runner.runner.state["is_stopping"] = True      # new explicit flag
 
-        if hasattr(tenant_runner.runner, "app") and tenant_runner.runner.app:
+        if tenant_runner.runner.app:
             tenant_runner.runner.app.state.is_running = False  # halt frame producer
         try:
             current_scenario = tenant_runner.runner.state.get("current_scenario")
@@ -1498,7 +1493,7 @@ async def stop_simulation(request: Request, current_user: dict = Depends(get_cur
                 )
 
             # Start cleanup in a background thread (non-blocking per-tenant stop)
-            if hasattr(tenant_runner.runner, "app") and tenant_runner.runner.app:
+            if tenant_runner.runner.app:
                 import threading as _t
                 app_ref = tenant_runner.runner.app
                 def _bg_cleanup():
@@ -2264,7 +2259,7 @@ async def get_simulation_status():
             })
 
         # Check if app exists and state consistency
-        if hasattr(runner, "app") and runner.app:
+        if runner.app:
             status_info["app_exists"] = True
             if hasattr(runner.app, "state"):
                 app_running = runner.app.state.is_running